@@ -22,7 +22,7 @@ def parse_args() -> argparse.Namespace:
         "--modifiedtime",
         type=str,
         default=None,
-        help="수정일 기준 (YYYYMMDD 형식). --step 4에서 사용. 기본값: 2일 전",
+        help="수정일 기준 (YYYYMMDD 형식). --step 4에서 사용. 기본값: 언어별 워터마크 (없으면 2일 전)",
     )
     parser.add_argument(
         "--transform-only",
@@ -32,7 +32,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--save-mongodb",
         action="store_true",
-        help="output 파일 기반으로 MongoDB 저장만 실행 (regions + pois)",
+        help="output 파일 기반으로 MongoDB 저장만 실행 (regions + pois + poi_clusters + poi_links)",
     )
     parser.add_argument(
         "--save-mongodb-details",
@@ -68,6 +68,66 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="각 언어당 최대 처리 건수 (기본: 1000). --step 3에서 사용",
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="API 호출 없이 우선순위 스케줄러가 선택할 POI만 출력 (--step 3 / --fetch detail_update 전용)",
+    )
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="원본 modifiedtime이 그대로인 POI도 상세 재수신 (--step 3 / --step 4 변경 감지 게이트, --step 5 행사 상세 캐시 무시)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "병렬 워커 프로세스 수 — --step 3: 샤드 lease 기반 분산 처리 후 journal 병합, "
+            "--transform-only: POI 변환/직렬화 프로세스 풀"
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "--transform-only 전용: 원본 해시가 바뀐 POI만 다시 변환하고 "
+            "변경분(transform_delta_{lang}.json)을 MongoDB에 반영 (--workers 무시)"
+        ),
+    )
+    parser.add_argument(
+        "--detail-worker",
+        type=str,
+        default=None,
+        metavar="WORKER_ID",
+        help="샤드 lease 워커 1개만 실행 (journal 기록까지, 병합은 --merge-journals)",
+    )
+    parser.add_argument(
+        "--run-id",
+        type=str,
+        default=None,
+        help=(
+            "멀티 워커 실행 식별자 (같은 run-id 워커끼리 샤드 분배). "
+            "기본값: --detail-worker는 오늘 날짜(YYYYMMDD), --step 3 --workers는 실행 시각(YYYYMMDDHHMMSS) — "
+            "실패한 실행을 이어받으려면 출력된 run-id를 지정해 재실행"
+        ),
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=["hash", "region"],
+        default="hash",
+        help="멀티 워커 샤드 기준 (hash: contentId 해시, region: 지역 slug)",
+    )
+    parser.add_argument(
+        "--merge-journals",
+        action="store_true",
+        help="워커 journal을 pois_details 파일에 병합하고 MongoDB 저장 (--run-id 미지정 시 미병합 전체)",
+    )
+    parser.add_argument(
+        "--build-tiles",
+        action="store_true",
+        help="pois_geo_{lang}.json으로 벡터 타일 피라미드 전체 생성 (--workers N: 타일 기록 프로세스 수)",
+    )
     return parser.parse_args()
 
 
@@ -127,6 +187,14 @@ def run_transform_categories(cat_data: dict | None = None) -> None:
     print(f"[Transform] categories_db.json 저장 완료: {db_path} ({len(docs)} documents)")
 
 
+def run_build_reference_bundle() -> None:
+    from src.transformers.reference import save_reference_bundle
+
+    print("[Transform] 참조 데이터 번들 생성 시작...")
+    path = save_reference_bundle()
+    print(f"[Transform] 참조 데이터 번들 저장 완료: {path}")
+
+
 def _save_regions_to_mongodb(docs: list[dict] | None = None) -> None:
     """변환된 regions_db 데이터를 MongoDB에 저장한다.
 
@@ -165,6 +233,8 @@ async def run_step1() -> None:
     cat_data = await run_fetch_category_code()
     run_transform_regions(ldong_data)
     run_transform_categories(cat_data)
+    run_build_reference_bundle()
+    run_build_autocomplete()
     _save_regions_to_mongodb()
 
 
@@ -177,14 +247,305 @@ async def run_fetch_area_based() -> dict:
     return data
 
 
-def run_transform_pois() -> None:
-    from src.transformers.pois import save_pois, transform_pois
-
+def run_transform_pois(workers: int = 1, incremental: bool = False) -> None:
     print("[Transform] pois 변환 시작...")
-    data = transform_pois()
-    paths = save_pois(data)
+    results = None
+    if incremental:
+        from src.transformers.pois_incremental import transform_pois_incremental
+
+        results = transform_pois_incremental()
+        paths = [p for result in results.values() for p in result["paths"]]
+        _apply_pois_delta_to_mongodb(results)
+    elif workers > 1:
+        from src.transformers.pois import transform_pois_parallel
+
+        counts, paths = transform_pois_parallel(workers)
+        print(f"[Transform] 프로세스 {workers}개로 변환 완료: {counts}")
+    else:
+        from src.transformers.pois import save_pois, transform_pois
+
+        data = transform_pois()
+        paths = save_pois(data)
     for p in paths:
         print(f"[Transform] 저장 완료: {p}")
+    # 증분 갱신 경로가 없는 산출물은 전체 생성
+    run_build_geo_shards()
+    run_build_spatial_index()
+    if results and not any(result["full"] for result in results.values()):
+        _apply_transform_delta(results)
+    else:
+        cluster_changes = run_build_poi_clusters()
+        if cluster_changes:
+            _save_poi_clusters_to_mongodb(cluster_changes)
+        run_build_search_index()
+    # 연결 상태(poi_links_state.json)는 이번 변경분을 반영한 뒤 저장되므로 변경분을 바로 MongoDB에 반영한다
+    links_change = run_build_poi_links()
+    if links_change is not None:
+        _save_poi_links_to_mongodb(links_change)
+    run_build_autocomplete()
+
+
+def _apply_transform_delta(results: dict[str, dict]) -> None:
+    """증분 재변환 변경분을 클러스터/검색 인덱스/벡터 타일에 증분 반영한다.
+
+    클러스터 상태나 검색 인덱스가 아직 없으면 그 언어만 전체 생성한다.
+    검색 문서는 전체 생성(_load_source_pois())과 같이 상세 반영분(pois_details_{lang}.json)을 우선한다.
+    """
+    from src.fetchers.detail_update import _open_detail_table
+    from src.transformers.poi_clusters import CLUSTERS_DIR, build_clusters, update_clusters
+    from src.transformers.search_index import build_search_index, update_search_index
+    from src.transformers.vector_tiles import update_tiles
+
+    cluster_changes: dict[str, dict] = {}
+    for lang, result in results.items():
+        upserts = {poi["id"]: poi for poi in result["upserts"]}
+        removed = set(result["delta"]["removed"])
+
+        change = update_clusters(lang, upserts, removed)
+        if change is None:
+            change = build_clusters(lang)
+            if change is not None:
+                print(f"[Transform] [{lang}] 클러스터 {len(change['upserts'])}개 → {CLUSTERS_DIR / lang}")
+        else:
+            print(
+                f"[Transform] [{lang}] 클러스터 증분 갱신: "
+                f"{len(change['upserts'])}개 변경, {len(change['deleted'])}개 삭제"
+            )
+        if change is not None:
+            cluster_changes[lang] = change
+
+        details = _open_detail_table(lang)
+        documents = {}
+        for content_id, poi in upserts.items():
+            row = details.get(content_id)
+            documents[content_id] = row.to_dict() if row is not None else poi
+        stats = update_search_index(lang, documents, removed)
+        if stats is None:
+            meta = build_search_index(lang)
+            if meta is not None:
+                print(f"[Transform] [{lang}] 검색 인덱스 문서 {meta['docs']}건 (전체 생성)")
+        else:
+            print(f"[Transform] [{lang}] 검색 인덱스 증분 갱신: {stats}")
+
+        if upserts or removed:
+            stats = update_tiles(lang, upserts, removed)
+            if stats is not None:
+                print(f"[Tiles] [{lang}] 증분 갱신: {stats}")
+
+    if cluster_changes:
+        _save_poi_clusters_to_mongodb(cluster_changes)
+
+
+def run_build_geo_shards() -> None:
+    from src.transformers.geo_shards import save_geo_shards
+
+    print("[Transform] 지역별 geo 샤드 생성 시작...")
+    for lang in ("kr", "en"):
+        path = save_geo_shards(lang)
+        if path is not None:
+            print(f"[Transform] 저장 완료: {path}")
+
+
+def run_build_tiles(workers: int = 1) -> None:
+    from src.config import TILE_MAX_ZOOM, TILE_MIN_ZOOM
+    from src.transformers.vector_tiles import TILES_DIR, build_tiles
+
+    print(f"[Tiles] 벡터 타일 생성 시작 (z{TILE_MIN_ZOOM}~z{TILE_MAX_ZOOM}, 프로세스 {workers}개)...")
+    for lang in ("kr", "en"):
+        stats = build_tiles(lang, workers)
+        if stats is not None:
+            print(f"[Tiles] [{lang}] {stats} → {TILES_DIR / lang}")
+
+
+def _update_tiles_from_summaries(summaries: list[dict]) -> None:
+    """Step 4/5 변경분이 닿은 벡터 타일만 다시 기록한다 (--build-tiles로 만든 타일이 있을 때만)."""
+    from src.transformers.geo_delta import geo_delta_from_summaries
+    from src.transformers.vector_tiles import update_tiles
+
+    for lang, delta in geo_delta_from_summaries(summaries).items():
+        stats = update_tiles(lang, delta["upserts"], delta["removed"])
+        if stats is not None:
+            print(f"[Tiles] [{lang}] 증분 갱신: {stats}")
+
+
+def run_build_spatial_index() -> None:
+    from src.transformers.spatial_index import build_spatial_index
+
+    print("[Transform] 공간 인덱스 생성 시작...")
+    for lang in ("kr", "en"):
+        path = build_spatial_index(lang)
+        if path is not None:
+            print(f"[Transform] 저장 완료: {path}")
+
+
+def run_build_poi_clusters() -> dict[str, dict]:
+    """pois_{lang}.json으로 줌별 클러스터를 만들어 output/clusters/{lang}/에 저장한다."""
+    from src.transformers.poi_clusters import CLUSTERS_DIR, build_clusters
+
+    print("[Transform] POI 클러스터 생성 시작...")
+    changes: dict[str, dict] = {}
+    for lang in ("kr", "en"):
+        change = build_clusters(lang)
+        if change is not None:
+            changes[lang] = change
+            print(f"[Transform] [{lang}] 클러스터 {len(change['upserts'])}개 → {CLUSTERS_DIR / lang}")
+    return changes
+
+
+def _update_clusters_from_summaries(summaries: list[dict]) -> None:
+    """Step 4/5 변경분이 닿은 클러스터만 다시 계산하고 MongoDB에 반영한다."""
+    from src.transformers.geo_delta import geo_delta_from_summaries
+    from src.transformers.poi_clusters import update_clusters
+
+    changes: dict[str, dict] = {}
+    for lang, delta in geo_delta_from_summaries(summaries).items():
+        change = update_clusters(lang, delta["upserts"], delta["removed"])
+        if change is not None:
+            changes[lang] = change
+            print(
+                f"[Transform] [{lang}] 클러스터 증분 갱신: "
+                f"{len(change['upserts'])}개 변경, {len(change['deleted'])}개 삭제"
+            )
+    if changes:
+        _save_poi_clusters_to_mongodb(changes)
+
+
+def _save_poi_clusters_to_mongodb(changes: dict[str, dict] | None = None) -> None:
+    """POI 클러스터를 MongoDB poi_clusters 컬렉션에 반영한다.
+
+    changes가 None이면 output/clusters 상태 전체를 저장한다.
+    """
+    import os
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    if not os.environ.get("MONGODB_URI"):
+        print("[MongoDB] MONGODB_URI 미설정, MongoDB 클러스터 저장 건너뜀")
+        return
+
+    if changes is None:
+        from src.transformers.poi_clusters import full_cluster_changes, load_cluster_state
+
+        changes = {}
+        for lang in ("kr", "en"):
+            state = load_cluster_state(lang)
+            if state is not None:
+                changes[lang] = full_cluster_changes(state)
+        if not changes:
+            print("[MongoDB] 저장할 클러스터가 없습니다.")
+            return
+
+    from src.storage.mongodb import save_poi_clusters_to_mongodb
+
+    print("[MongoDB] poi_clusters 저장 시작...")
+    stats = save_poi_clusters_to_mongodb(changes)
+    print(f"[MongoDB] poi_clusters 저장 완료: {stats}")
+
+
+def run_build_poi_links() -> dict | None:
+    """pois_kr ↔ pois_en 연결 테이블을 변경분만 갱신한다 (output/poi_links.json)."""
+    from src.transformers.poi_links import LINKS_PATH, update_poi_links
+
+    print("[Transform] 국문↔영문 POI 연결 시작...")
+    change = update_poi_links()
+    if change is not None:
+        mode = "전체" if change["full"] else "증분"
+        print(
+            f"[Transform] 연결 {change['links']}건 ({mode}, 재검토 kr={change['dirty']['kr']}, "
+            f"en={change['dirty']['en']}, 변경 {len(change['upserts'])}, 해제 {len(change['deleted'])}) → {LINKS_PATH}"
+        )
+    return change
+
+
+def _save_poi_links_to_mongodb(change: dict | None = None) -> None:
+    """국문↔영문 POI 연결을 MongoDB poi_links 컬렉션에 반영한다.
+
+    change가 None이면 output/poi_links.json 전체를 저장한다.
+    """
+    import json
+    import os
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    if not os.environ.get("MONGODB_URI"):
+        print("[MongoDB] MONGODB_URI 미설정, MongoDB 연결 테이블 저장 건너뜀")
+        return
+
+    if change is None:
+        from src.transformers.poi_links import LINKS_PATH
+
+        if not LINKS_PATH.exists():
+            print(f"[MongoDB] {LINKS_PATH} 파일 없음, 건너뜀")
+            return
+        links = json.loads(LINKS_PATH.read_text(encoding="utf-8"))
+        change = {"full": True, "upserts": links, "deleted": []}
+
+    from src.storage.mongodb import save_poi_links_to_mongodb
+
+    print("[MongoDB] poi_links 저장 시작...")
+    stats = save_poi_links_to_mongodb(change)
+    print(f"[MongoDB] poi_links 저장 완료: {stats}")
+
+
+def _update_search_index_from_festivals(festival_data: dict[str, list[dict]], summaries: list[dict]) -> None:
+    """Step 5 감사 요약의 신규/변경/삭제 행사만 검색 인덱스에 반영한다."""
+    from src.transformers.geo_delta import REMOVE_ACTIONS, UPSERT_ACTIONS
+
+    changed = {(s["lang"], s["contentId"]) for s in summaries if s["action"] in UPSERT_ACTIONS}
+    upserts = {
+        lang: [poi for poi in pois if (lang, poi["id"]) in changed]
+        for lang, pois in festival_data.items()
+    }
+    removed: dict[str, list[str]] = {}
+    for s in summaries:
+        if s["action"] in REMOVE_ACTIONS:
+            removed.setdefault(s["lang"], []).append(s["contentId"])
+    _update_search_index(upserts, removed)
+
+
+def run_build_search_index() -> None:
+    from src.transformers.search_index import SEARCH_DIR, build_search_index
+
+    print("[Transform] 검색 인덱스 생성 시작...")
+    for lang in ("kr", "en"):
+        meta = build_search_index(lang)
+        if meta is not None:
+            print(
+                f"[Transform] [{lang}] 문서 {meta['docs']}건, term {meta['terms']}개, "
+                f"포스팅 {meta['postings']}개 → {SEARCH_DIR / lang}"
+            )
+
+
+def run_build_autocomplete() -> None:
+    from src.transformers.autocomplete import build_autocomplete
+
+    print("[Transform] 자동완성 인덱스 생성 시작...")
+    for lang in ("kr", "en"):
+        path = build_autocomplete(lang)
+        if path is not None:
+            print(f"[Transform] 저장 완료: {path}")
+
+
+def _update_search_index(upserts: dict[str, list[dict]], removed: dict[str, list[str]]) -> None:
+    """Step 3/4/5 변경분을 검색 인덱스 변경분 세그먼트에 반영한다 (인덱스가 있을 때만).
+
+    Args:
+        upserts: {lang: [POI]} — 추가/변경 POI
+        removed: {lang: [id]} — 삭제된 POI id
+    """
+    from src.transformers.search_index import update_search_index
+
+    for lang in ("kr", "en"):
+        pois, ids = upserts.get(lang) or [], removed.get(lang) or []
+        if not pois and not ids:
+            continue
+        stats = update_search_index(lang, {poi["id"]: poi for poi in pois}, set(ids))
+        if stats is not None:
+            print(f"[Transform] [{lang}] 검색 인덱스 증분 갱신: {stats}")
 
 
 def _save_pois_to_mongodb(data: dict | None = None) -> None:
@@ -215,11 +576,38 @@ def _save_pois_to_mongodb(data: dict | None = None) -> None:
     print(f"[MongoDB] 저장 완료: 총 {total}건 ({stats})")
 
 
+def _apply_pois_delta_to_mongodb(results: dict[str, dict]) -> None:
+    """증분 재변환 변경분만 MongoDB에 반영한다 (추가/변경 upsert + 삭제)."""
+    import os
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    if not os.environ.get("MONGODB_URI"):
+        print("[MongoDB] MONGODB_URI 미설정, MongoDB 저장 건너뜀")
+        return
+
+    upserts = {lang: {"pois": r["upserts"]} for lang, r in results.items() if r["upserts"]}
+    removed = {lang: r["delta"]["removed"] for lang, r in results.items() if r["delta"]["removed"]}
+    if not upserts and not removed:
+        print("[MongoDB] 변경분 없음, MongoDB 저장 건너뜀")
+        return
+
+    from src.storage.mongodb import delete_pois_from_mongodb, save_pois_to_mongodb
+
+    print("[MongoDB] pois 변경분 반영 시작...")
+    stats = save_pois_to_mongodb(upserts) if upserts else {}
+    deleted = delete_pois_from_mongodb(removed) if removed else {}
+    print(f"[MongoDB] 변경분 반영 완료: upsert {stats}, 삭제 {deleted}")
+
+
 def _load_pois_from_output() -> dict | None:
-    """output 디렉토리에서 pois 파일을 로드한다."""
-    import json
+    """output 디렉토리에서 pois 파일을 열 기반 PoiTable로 로드한다."""
     from pathlib import Path
 
+    from src.transformers.poi_table import PoiTable
+
     output_dir = Path(__file__).resolve().parent / "output"
     data: dict[str, dict] = {}
 
@@ -231,7 +619,7 @@ def _load_pois_from_output() -> dict | None:
             continue
 
         data[lang] = {
-            "pois": json.loads(pois_path.read_text(encoding="utf-8")),
+            "pois": PoiTable.load(pois_path),
         }
 
     if not data:
@@ -242,23 +630,59 @@ def _load_pois_from_output() -> dict | None:
 
 
 async def run_step2() -> None:
-    """Phase 2: 관광정보 수신 + 변환 + MongoDB 저장"""
-    await run_fetch_area_based()
-    run_transform_pois()
-    _save_pois_to_mongodb()
+    """Phase 2: 관광정보 수신 + 변환 + MongoDB 저장 (페이지 단위 스트리밍)"""
+    from src.fetchers.area_based import stream_area_based
+
+    writer = _create_poi_writer()
+    try:
+        print("[Step 2] 지역기반 관광정보 수신 → 변환 → 저장 시작...")
+        stats = await stream_area_based(writer)
+        print(f"[Step 2] 완료: {stats}")
+    finally:
+        if writer is not None:
+            writer.close()
+    run_build_geo_shards()
+    run_build_spatial_index()
+    _save_poi_clusters_to_mongodb(run_build_poi_clusters())
+    links_change = run_build_poi_links()
+    if links_change is not None:
+        _save_poi_links_to_mongodb(links_change)
+    run_build_search_index()
+    run_build_autocomplete()
+
+
+def _print_api_key_usage() -> None:
+    """서비스 키별 엔드포인트 사용량을 출력한다 (키 원문 대신 지문 표시)."""
+    from src.client import get_key_pool
+
+    for label, usage in get_key_pool().summary().items():
+        if usage:
+            total = sum(usage.values())
+            print(f"[API 키] {label}: 총 {total:,}건 ({usage})")
 
 
 async def run_fetch_detail_update(
-    region: str | None = None, limit: int | None = None, force: bool = False
+    region: str | None = None,
+    limit: int | None = None,
+    force: bool = False,
+    dry_run: bool = False,
+    full_refresh: bool = False,
 ) -> tuple[dict, dict[str, list[str]]]:
-    from src.config import DETAIL_UPDATE_MAX_POIS
+    from src.config import API_KEYS, DETAIL_UPDATE_MAX_POIS
     from src.fetchers.detail_update import fetch_detail_update
 
-    effective_limit = limit if limit is not None else DETAIL_UPDATE_MAX_POIS
+    # 기본 제한: 서비스 키 수만큼 일일 한도가 늘어난다
+    effective_limit = limit if limit is not None else DETAIL_UPDATE_MAX_POIS * max(len(API_KEYS), 1)
     region_label = region or "전체"
-    print(f"[Fetch] POI 상세 업데이트 수신 시작 (지역: {region_label}, 제한: {effective_limit}건)...")
-    data, deleted_ids = await fetch_detail_update(region=region, limit=effective_limit, force=force)
+    mode_label = (", 전체 갱신" if full_refresh else "") + (", dry-run" if dry_run else "")
+    print(f"[Fetch] POI 상세 업데이트 수신 시작 (지역: {region_label}, 제한: {effective_limit}건{mode_label})...")
+    data, deleted_ids = await fetch_detail_update(
+        region=region, limit=effective_limit, force=force, dry_run=dry_run,
+        full_refresh=full_refresh,
+    )
     print("[Fetch] POI 상세 업데이트 수신 완료")
+    if not dry_run:
+        _print_api_key_usage()
     return data, deleted_ids
 
 
@@ -309,19 +733,20 @@ def _save_details_to_mongodb(data: dict | None = None) -> None:
 
 
 def _load_details_from_output() -> dict | None:
-    """output 디렉토리에서 pois_details 파일을 로드한다."""
-    import json
+    """output 디렉토리에서 pois_details 파일을 열 기반 PoiTable로 로드한다."""
     from pathlib import Path
 
+    from src.transformers.poi_table import PoiTable
+
     output_dir = Path(__file__).resolve().parent / "output"
-    data: dict[str, list[dict]] = {}
+    data: dict = {}
 
     for lang in ("kr", "en"):
         details_path = output_dir / f"pois_details_{lang}.json"
         if not details_path.exists():
             print(f"[MongoDB] {details_path} 파일 없음, 건너뜀")
             continue
-        data[lang] = json.loads(details_path.read_text(encoding="utf-8"))
+        data[lang] = PoiTable.load(details_path)
 
     if not data:
         print("[MongoDB] 저장할 pois_details 파일이 없습니다.")
@@ -330,6 +755,23 @@ def _load_details_from_output() -> dict | None:
     return data
 
 
+def _create_poi_writer():
+    """Step 2/4 스트리밍 저장용 PoiUpsertWriter를 생성한다 (MONGODB_URI 미설정 시 None)."""
+    import os
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    if not os.environ.get("MONGODB_URI"):
+        print("[MongoDB] MONGODB_URI 미설정, MongoDB 저장 건너뜀")
+        return None
+
+    from src.storage.mongodb import PoiUpsertWriter
+
+    return PoiUpsertWriter()
+
+
 def _save_sync_summary_to_mongodb(summaries: list[dict]) -> None:
     """동기화 요약을 MongoDB updated_content 컬렉션에 저장한다."""
     import os
@@ -349,39 +791,67 @@ def _save_sync_summary_to_mongodb(summaries: list[dict]) -> None:
     print(f"[MongoDB] 동기화 요약 저장 완료: {count}건")
 
 
-async def run_fetch_sync_update(modifiedtime: str) -> tuple[dict, dict, list]:
+async def run_fetch_sync_update(
+    modifiedtime: str,
+    full_refresh: bool = False,
+    writer=None,
+    watermarks: dict | None = None,
+    on_batch=None,
+) -> tuple[dict, dict, dict]:
     from src.fetchers.sync_update import fetch_sync_update
 
     print(f"[Fetch] 관광정보 동기화 수신 시작 (modifiedtime={modifiedtime})...")
-    upserted, deleted_ids, summaries = await fetch_sync_update(modifiedtime)
+    upserted, deleted_ids, next_watermarks = await fetch_sync_update(
+        modifiedtime, full_refresh, writer, watermarks, on_batch
+    )
     print("[Fetch] 관광정보 동기화 수신 완료")
-    return upserted, deleted_ids, summaries
+    return upserted, deleted_ids, next_watermarks
+
+
+def _apply_sync_batch(lang: str, batch) -> None:
+    """Step 4 [저장] 배치의 변경분이 닿은 벡터 타일/클러스터/검색 인덱스만 갱신한다 (배치마다 호출)."""
+    _update_tiles_from_summaries(batch.summaries)
+    _update_clusters_from_summaries(batch.summaries)
+    # MongoDB와 같이 같은 배치 안에서는 삭제가 upsert보다 나중에 반영된다
+    removed = set(batch.deleted_ids)
+    _update_search_index(
+        {lang: [poi for poi in batch.upserts if poi["id"] not in removed]},
+        {lang: batch.deleted_ids},
+    )
 
 
-async def run_step4(modifiedtime: str | None = None) -> None:
-    """Phase 4: 관광정보 동기화 (증분 업데이트)"""
+async def run_step4(modifiedtime: str | None = None, full_refresh: bool = False) -> None:
+    """Phase 4: 관광정보 동기화 (워터마크 기반 증분 업데이트)"""
     from datetime import date, timedelta
 
-    # modifiedtime 기본값: 2일 전 (매일 실행 시 1일 + 여유 1일)
+    from src.storage.watermark import load_watermarks, save_watermarks
+
+    # 기본: 언어별 워터마크(마지막 반영 수정시각)부터 요청, 워터마크가 없으면 2일 전부터
+    # --modifiedtime 지정 시: 해당 날짜부터 워터마크 필터 없이 재처리
+    watermarks: dict[str, dict] = {}
     if modifiedtime is None:
+        watermarks = load_watermarks()
         modifiedtime = (date.today() - timedelta(days=2)).strftime("%Y%m%d")
 
-    # 1. 수정된 POI 수신 + 변환 + 상세 업데이트
-    upserted, deleted_ids, summaries = await run_fetch_sync_update(modifiedtime)
-
-    # 2. MongoDB upsert (기존 save_pois_to_mongodb 재사용)
-    if any(upserted.values()):
-        _save_pois_to_mongodb({
-            lang: {"pois": pois} for lang, pois in upserted.items() if pois
-        })
-
-    # 3. MongoDB 삭제
-    if any(deleted_ids.values()):
-        _delete_pois_from_mongodb(deleted_ids)
-
-    # 4. 동기화 요약 저장
-    if summaries:
-        _save_sync_summary_to_mongodb(summaries)
+    # 1~3. 수정된 POI 수신 + 변환 + 상세 업데이트 + MongoDB upsert/삭제/요약 저장 (파이프라인 동시 진행)
+    # 저장 배치마다 변경분이 닿은 벡터 타일/클러스터/검색 인덱스 갱신
+    writer = _create_poi_writer()
+    try:
+        upserted, deleted_ids, next_watermarks = await run_fetch_sync_update(
+            modifiedtime, full_refresh, writer, watermarks, on_batch=_apply_sync_batch,
+        )
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is not None:
+        deleted = {lang: len(ids) for lang, ids in deleted_ids.items()}
+        print(f"[MongoDB] 동기화 반영 완료: upsert {upserted}, 삭제 {deleted}")
+
+    # 4. 워터마크 전진 (MongoDB upsert/삭제 반영이 끝난 뒤에만)
+    if writer is not None and next_watermarks:
+        path = save_watermarks(next_watermarks)
+        marks = ", ".join(f"{lang}={m['modifiedtime']}" for lang, m in next_watermarks.items())
+        print(f"[워터마크] 저장 완료: {marks} → {path}")
 
 
 def _delete_old_sync_summaries() -> None:
@@ -404,18 +874,20 @@ def _delete_old_sync_summaries() -> None:
 
 
 async def run_fetch_festival(
-    event_start_date: str | None = None, event_end_date: str | None = None
-) -> tuple[dict, list]:
+    event_start_date: str | None = None,
+    event_end_date: str | None = None,
+    full_refresh: bool = False,
+) -> dict:
     from src.fetchers.festival import fetch_festival
 
     print("[Fetch] 행사정보 수신 시작...")
-    festival_data, summaries = await fetch_festival(event_start_date, event_end_date)
+    festival_data = await fetch_festival(event_start_date, event_end_date, full_refresh)
     print("[Fetch] 행사정보 수신 완료")
-    return festival_data, summaries
+    return festival_data
 
 
-def _delete_event_pois_from_mongodb() -> tuple[dict, list]:
-    """EV 타입 POI를 MongoDB에서 전량 삭제한다."""
+def _replace_event_pois_in_mongodb(festival_data: dict) -> list[dict]:
+    """수신한 행사 POI와 MongoDB EV 문서의 차이만 반영하고 감사 요약을 반환한다."""
     import os
 
     from dotenv import load_dotenv
@@ -423,52 +895,221 @@ def _delete_event_pois_from_mongodb() -> tuple[dict, list]:
     load_dotenv()
 
     if not os.environ.get("MONGODB_URI"):
-        print("[MongoDB] MONGODB_URI 미설정, MongoDB EV 삭제 건너뜀")
-        return {}, []
+        print("[MongoDB] MONGODB_URI 미설정, MongoDB 행사 반영 건너뜀")
+        return []
+
+    from src.storage.mongodb import replace_event_pois_in_mongodb
+
+    print("[MongoDB] EV(행사) 문서 차이 반영 시작...")
+    stats, summaries = replace_event_pois_in_mongodb(festival_data)
+    print(f"[MongoDB] EV 반영 완료: 변경 {len(summaries)}건 ({stats})")
+    return summaries
+
+
+def run_build_festival_calendar(
+    festival_data: dict, event_start_date: str, event_end_date: str
+) -> dict:
+    """행사 POI로 지역별/일자별 캘린더를 만들어 output/festival_calendar_{lang}.json에 저장한다."""
+    from src.transformers.festival_calendar import build_festival_calendar, save_festival_calendar
+
+    print("[Transform] 행사 캘린더 생성 시작...")
+    calendars = {
+        lang: build_festival_calendar(pois, event_start_date, event_end_date)
+        for lang, pois in festival_data.items()
+        if pois
+    }
+    paths = save_festival_calendar(calendars)
+    for lang, calendar in calendars.items():
+        days = sum(len(d) for d in calendar.values())
+        print(f"  [{lang}] 지역 {len(calendar)}개, 지역×일자 {days}건")
+    for p in paths:
+        print(f"  → {p}")
+    print("[Transform] 행사 캘린더 생성 완료")
+    return calendars
 
-    from src.storage.mongodb import delete_event_pois_from_mongodb
 
-    print("[MongoDB] EV(행사) 문서 삭제 시작...")
-    stats, delete_summaries = delete_event_pois_from_mongodb()
-    total = sum(stats.values())
-    print(f"[MongoDB] EV 삭제 완료: 총 {total}건 ({stats})")
-    return stats, delete_summaries
+def _save_festival_calendar_to_mongodb(calendars: dict) -> None:
+    """행사 캘린더를 MongoDB festival_calendar 컬렉션에 저장한다."""
+    import os
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    if not os.environ.get("MONGODB_URI"):
+        print("[MongoDB] MONGODB_URI 미설정, MongoDB 행사 캘린더 저장 건너뜀")
+        return
+
+    from src.storage.mongodb import save_festival_calendar_to_mongodb
+
+    print("[MongoDB] 행사 캘린더 저장 시작...")
+    stats = save_festival_calendar_to_mongodb(calendars)
+    print(f"[MongoDB] 행사 캘린더 저장 완료: {stats}")
 
 
 async def run_step5(
-    event_start_date: str | None = None, event_end_date: str | None = None
+    event_start_date: str | None = None,
+    event_end_date: str | None = None,
+    full_refresh: bool = False,
 ) -> None:
-    """Phase 5: 행사정보조회 (전량 교체)"""
-    # 1. 행사정보 수신 + 변환 + 상세
-    festival_data, summaries = await run_fetch_festival(event_start_date, event_end_date)
-
-    # 2. 데이터가 있을 때만 기존 EV 문서 삭제 후 upsert
-    if any(len(pois) > 0 for pois in festival_data.values()):
-        delete_stats, delete_summaries = _delete_event_pois_from_mongodb()
-        summaries.extend(delete_summaries)
-        _save_pois_to_mongodb({
-            lang: {"pois": pois} for lang, pois in festival_data.items() if pois
-        })
-
-    # 3. 감사 요약 저장
+    """Phase 5: 행사정보조회 (변경분 반영)"""
+    from src.fetchers.festival import festival_window
+
+    event_start_date, event_end_date = festival_window(event_start_date, event_end_date)
+
+    # 1. 행사정보 수신 + 변환 + 상세 (원본 modifiedtime이 같은 행사는 캐시 재사용)
+    festival_data = await run_fetch_festival(event_start_date, event_end_date, full_refresh)
+
+    # 2. 데이터가 있는 언어만 신규/변경 upsert + 사라진 EV 문서 삭제
+    summaries: list[dict] = []
+    if any(festival_data.values()):
+        summaries = _replace_event_pois_in_mongodb(festival_data)
+
+        # 3. 지역별/일자별 행사 캘린더 (output/ + festival_calendar 컬렉션)
+        calendars = run_build_festival_calendar(festival_data, event_start_date, event_end_date)
+        _save_festival_calendar_to_mongodb(calendars)
+
+    # 4. 감사 요약 저장 (실제 변경분만) + 변경분이 닿은 벡터 타일/클러스터/검색 인덱스 갱신
     if summaries:
+        _update_tiles_from_summaries(summaries)
+        _update_clusters_from_summaries(summaries)
         _save_sync_summary_to_mongodb(summaries)
+        _update_search_index_from_festivals(festival_data, summaries)
 
-    # 4. updated_content 오래된 데이터 정리 (4일 이전)
+    # 5. updated_content 오래된 데이터 정리 (4일 이전)
     _delete_old_sync_summaries()
 
 
-async def run_step3(region: str | None = None, limit: int | None = None, force: bool = False) -> None:
+async def run_step3(
+    region: str | None = None,
+    limit: int | None = None,
+    force: bool = False,
+    dry_run: bool = False,
+    full_refresh: bool = False,
+) -> None:
     """Phase 3: POI 상세 업데이트 수신 + MongoDB 저장 + 삭제된 POI 정리"""
-    data, deleted_ids = await run_fetch_detail_update(region=region, limit=limit, force=force)
+    data, deleted_ids = await run_fetch_detail_update(
+        region=region, limit=limit, force=force, dry_run=dry_run, full_refresh=full_refresh
+    )
+    if dry_run:
+        return
     _save_details_to_mongodb(data)
     if any(deleted_ids.values()):
         _delete_pois_from_mongodb(deleted_ids)
+    _update_search_index(data, deleted_ids)
+
+
+async def run_detail_worker(
+    worker_id: str,
+    run_id: str | None = None,
+    region: str | None = None,
+    limit: int | None = None,
+    force: bool = False,
+    shard_by: str = "hash",
+    full_refresh: bool = False,
+) -> None:
+    """샤드 lease 워커 1개 실행 (journal 기록까지)"""
+    from datetime import date
+
+    from src.config import DETAIL_UPDATE_MAX_POIS
+    from src.fetchers.detail_worker import run_detail_worker as _run_worker
+
+    await _run_worker(
+        worker_id=worker_id,
+        run_id=run_id or date.today().strftime("%Y%m%d"),
+        region=region,
+        limit=limit if limit is not None else DETAIL_UPDATE_MAX_POIS,
+        force=force,
+        shard_by=shard_by,
+        full_refresh=full_refresh,
+    )
+    _print_api_key_usage()
+
+
+def run_merge_detail_journals(run_id: str | None = None) -> None:
+    """워커 journal 병합 + MongoDB 저장 + 삭제된 POI 정리"""
+    from src.fetchers.detail_worker import merge_detail_journals
+
+    print(f"[Merge] 워커 journal 병합 시작 (run: {run_id or '미병합 전체'})...")
+    data, deleted_ids = merge_detail_journals(run_id)
+    print("[Merge] 워커 journal 병합 완료")
+    if data:
+        _save_details_to_mongodb(data)
+    if any(deleted_ids.values()):
+        _delete_pois_from_mongodb(deleted_ids)
+    _update_search_index(data, deleted_ids)
+
+
+async def run_step3_workers(
+    workers: int,
+    run_id: str | None = None,
+    region: str | None = None,
+    limit: int | None = None,
+    force: bool = False,
+    shard_by: str = "hash",
+    full_refresh: bool = False,
+) -> None:
+    """Phase 3 (멀티 워커): 워커 프로세스 N개 실행 → journal 병합 → MongoDB 저장"""
+    import math
+    from datetime import datetime
+
+    from src.config import API_KEYS, DETAIL_LEASE_TTL, DETAIL_UPDATE_MAX_POIS
+
+    # 실행마다 새 샤드 목록을 만든다 (이어받기는 --run-id로 같은 식별자를 지정)
+    run_id = run_id or datetime.now().strftime("%Y%m%d%H%M%S")
+    total_limit = limit if limit is not None else DETAIL_UPDATE_MAX_POIS * max(len(API_KEYS), 1)
+    per_worker = math.ceil(total_limit / workers)
+    print(f"[Step 3] 워커 {workers}개 실행 (run: {run_id}, 워커당 제한: {per_worker}건, 샤드 기준: {shard_by})")
+
+    procs = []
+    for i in range(1, workers + 1):
+        cmd = [
+            sys.executable, __file__,
+            "--detail-worker", f"w{i}",
+            "--run-id", run_id,
+            "--limit", str(per_worker),
+            "--shard-by", shard_by,
+        ]
+        if region:
+            cmd += ["--region", region]
+        if force:
+            cmd.append("--force")
+        if full_refresh:
+            cmd.append("--full-refresh")
+        procs.append(await asyncio.create_subprocess_exec(*cmd))
+
+    codes = await asyncio.gather(*(proc.wait() for proc in procs))
+    failed = [f"w{i}" for i, code in enumerate(codes, 1) if code != 0]
+    if failed:
+        # 실패한 워커의 샤드는 lease 만료 후 같은 run-id 재실행 시 이어받는다
+        print(f"[Step 3] 비정상 종료 워커: {', '.join(failed)} (완료된 journal은 병합)")
+        print(
+            f"[Step 3] 남은 샤드 이어받기: 같은 명령에 --run-id {run_id} 를 지정해 "
+            f"재실행 (lease 만료 {DETAIL_LEASE_TTL}초 후)"
+        )
+
+    run_merge_detail_journals(run_id)
 
 
 async def main() -> None:
     args = parse_args()
 
+    if args.detail_worker:
+        await run_detail_worker(
+            worker_id=args.detail_worker,
+            run_id=args.run_id,
+            region=args.region,
+            limit=args.limit,
+            force=args.force,
+            shard_by=args.shard_by,
+            full_refresh=args.full_refresh,
+        )
+        return
+
+    if args.merge_journals:
+        run_merge_detail_journals(args.run_id)
+        return
+
     if args.save_mongodb_details:
         print("=== MongoDB 상세 업데이트만 실행 ===")
         _save_details_to_mongodb()
@@ -478,13 +1119,21 @@ async def main() -> None:
         print("=== MongoDB 저장만 실행 ===")
         _save_regions_to_mongodb()
         _save_pois_to_mongodb()
+        _save_poi_clusters_to_mongodb()
+        _save_poi_links_to_mongodb()
+        return
+
+    if args.build_tiles:
+        print("=== 벡터 타일 생성 ===")
+        run_build_tiles(args.workers)
         return
 
     if args.transform_only:
         print("=== 변환만 실행 (raw 데이터 사용) ===")
         run_transform_regions()
         run_transform_categories()
-        run_transform_pois()
+        run_build_reference_bundle()
+        run_transform_pois(args.workers, args.incremental)
         return
 
     if args.fetch:
@@ -495,13 +1144,16 @@ async def main() -> None:
         elif args.fetch == "area_based":
             await run_fetch_area_based()
         elif args.fetch == "detail_update":
-            await run_fetch_detail_update(region=args.region, limit=args.limit)
+            await run_fetch_detail_update(
+                region=args.region, limit=args.limit, dry_run=args.dry_run,
+                full_refresh=args.full_refresh,
+            )
         elif args.fetch == "sync_update":
             from datetime import date, timedelta
             mt = args.modifiedtime or (date.today() - timedelta(days=2)).strftime("%Y%m%d")
-            await run_fetch_sync_update(mt)
+            await run_fetch_sync_update(mt, args.full_refresh)
         elif args.fetch == "festival":
-            await run_fetch_festival(args.eventStartDate, args.eventEndDate)
+            await run_fetch_festival(args.eventStartDate, args.eventEndDate, args.full_refresh)
         return
 
     if args.step:
@@ -509,14 +1161,28 @@ async def main() -> None:
             await run_step1()
         elif args.step == 2:
             await run_step2()
+        elif args.step == 3 and args.workers > 1 and not args.dry_run:
+            await run_step3_workers(
+                workers=args.workers,
+                run_id=args.run_id,
+                region=args.region,
+                limit=args.limit,
+                force=args.force,
+                shard_by=args.shard_by,
+                full_refresh=args.full_refresh,
+            )
         elif args.step == 3:
-            await run_step3(region=args.region, limit=args.limit, force=args.force)
+            await run_step3(
+                region=args.region, limit=args.limit, force=args.force, dry_run=args.dry_run,
+                full_refresh=args.full_refresh,
+            )
         elif args.step == 4:
-            await run_step4(modifiedtime=args.modifiedtime)
+            await run_step4(modifiedtime=args.modifiedtime, full_refresh=args.full_refresh)
         elif args.step == 5:
             await run_step5(
                 event_start_date=args.eventStartDate,
                 event_end_date=args.eventEndDate,
+                full_refresh=args.full_refresh,
             )
         return
 
@@ -1,69 +1,374 @@
 import asyncio
+import atexit
+import hashlib
 import json
 import math
+import re
+import threading
+from collections.abc import AsyncIterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import httpx
 
-from src.config import API_KEY, COMMON_PARAMS, REQUEST_DELAY
+from src.config import (
+    API_DAILY_QUOTA,
+    API_KEY_ERROR_CODES,
+    API_KEYS,
+    API_QUOTA_ERROR_CODES,
+    COMMON_PARAMS,
+    REQUEST_DELAY,
+)
+from src.models import decode_items, response_items
 
 RAW_DIR = Path(__file__).resolve().parent.parent / "raw"
+QUOTA_STATE_PATH = Path(__file__).resolve().parent.parent / "output" / "api_quota.json"
+
+# 할당량 상태 파일 저장 주기 (호출 건수)
+QUOTA_SAVE_INTERVAL = 50
+
+KST = timezone(timedelta(hours=9))
+
+_SERVICE_KEY_RE = re.compile(r"(serviceKey=)[^&'\"\s]+", re.IGNORECASE)
+_RETURN_REASON_RE = re.compile(r"<returnReasonCode>\s*(\d+)\s*</returnReasonCode>")
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """프로세스 간 배타 잠금 (fcntl 미지원 플랫폼에서는 잠금 없이 진행)."""
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class QuotaExhaustedError(RuntimeError):
+    """사용 가능한 모든 서비스 키의 할당량이 소진되었을 때 발생한다."""
+
+
+class ApiKeyPool:
+    """data.go.kr 서비스 키 풀.
+
+    키 × 엔드포인트별 일일 호출 수(KST 기준)를 추적하고, 한도 도달 또는
+    할당량 오류 코드 수신 시 다음 키로 교체한다. 키 원문은 로그/상태 파일에
+    남기지 않고 sha256 지문(fingerprint)으로만 식별한다.
+
+    acquire()는 await 없이 선택과 카운트를 한 번에 처리하고 lock으로 보호하므로
+    asyncio 동시 요청 수나 스레드 사용 여부와 관계없이 한도를 초과 배정하지 않는다.
+    """
+
+    def __init__(
+        self,
+        keys: list[str],
+        daily_quota: int = API_DAILY_QUOTA,
+        state_path: Path | None = QUOTA_STATE_PATH,
+    ) -> None:
+        self._keys = keys or [""]
+        self._fingerprints = [
+            hashlib.sha256(key.encode("utf-8")).hexdigest()[:8] for key in self._keys
+        ]
+        self._daily_quota = daily_quota
+        self._state_path = state_path
+        self._lock = threading.Lock()
+        self._date = ""
+        # {fingerprint: {endpoint: count}}
+        self._usage: dict[str, dict[str, int]] = {}
+        # {fingerprint: [endpoint, ...]} — 할당량 오류로 소진 처리된 엔드포인트 ("*"는 키 전체)
+        self._blocked: dict[str, set[str]] = {}
+        # 마지막으로 상태 파일에 반영된 사용량 (프로세스 간 증분 병합용)
+        self._saved: dict[str, dict[str, int]] = {}
+        self._unsaved = 0
+        self._load()
+
+    def _today(self) -> str:
+        return datetime.now(KST).date().isoformat()
+
+    def _read_state(self) -> dict:
+        """상태 파일에서 오늘 날짜의 사용량을 읽는다 (없거나 날짜가 다르면 빈 상태)."""
+        if self._state_path is None or not self._state_path.exists():
+            return {}
+        try:
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if state.get("date") != self._date:
+            return {}
+        return state
+
+    def _load(self) -> None:
+        """상태 파일에서 오늘 날짜의 사용량을 복원한다."""
+        self._date = self._today()
+        state = self._read_state()
+        self._usage = {fp: dict(eps) for fp, eps in state.get("usage", {}).items()}
+        self._blocked = {fp: set(eps) for fp, eps in state.get("blocked", {}).items()}
+        self._saved = {fp: dict(eps) for fp, eps in self._usage.items()}
+
+    def _roll_date(self) -> None:
+        """날짜가 바뀌면 사용량을 초기화한다."""
+        today = self._today()
+        if today != self._date:
+            self._date = today
+            self._usage = {}
+            self._blocked = {}
+            self._saved = {}
+
+    def save(self) -> None:
+        """현재 사용량을 상태 파일에 저장한다 (키 원문은 저장하지 않음).
+
+        여러 프로세스(멀티 워커)가 같은 상태 파일을 공유하므로, 파일의 최신 값에
+        마지막 저장 이후 이 프로세스가 사용한 증분만 더해 기록하고 그 결과를
+        다시 메모리에 반영한다 (다른 워커의 사용량도 함께 보이게 된다).
+        """
+        if self._state_path is None:
+            return
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, _file_lock(self._state_path.with_suffix(".lock")):
+            disk = self._read_state()
+            merged = {fp: dict(eps) for fp, eps in disk.get("usage", {}).items()}
+            for fp, eps in self._usage.items():
+                saved_eps = self._saved.get(fp, {})
+                merged_eps = merged.setdefault(fp, {})
+                for ep, count in eps.items():
+                    delta = count - saved_eps.get(ep, 0)
+                    merged_eps[ep] = merged_eps.get(ep, 0) + delta
+            blocked = {fp: set(eps) for fp, eps in disk.get("blocked", {}).items()}
+            for fp, eps in self._blocked.items():
+                blocked.setdefault(fp, set()).update(eps)
+
+            state = {
+                "date": self._date,
+                "usage": merged,
+                "blocked": {fp: sorted(eps) for fp, eps in blocked.items()},
+            }
+            self._state_path.write_text(
+                json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+            self._usage = {fp: dict(eps) for fp, eps in merged.items()}
+            self._saved = {fp: dict(eps) for fp, eps in merged.items()}
+            self._blocked = blocked
+            self._unsaved = 0
+
+    def label(self, index: int) -> str:
+        """로그 출력용 키 식별자 (예: key#1(3fa2c91b))."""
+        return f"key#{index + 1}({self._fingerprints[index]})"
+
+    def _available(self, index: int, endpoint: str) -> bool:
+        fp = self._fingerprints[index]
+        blocked = self._blocked.get(fp, set())
+        if "*" in blocked or endpoint in blocked:
+            return False
+        return self._usage.get(fp, {}).get(endpoint, 0) < self._daily_quota
+
+    def acquire(self, endpoint: str) -> tuple[int, str]:
+        """endpoint 호출에 사용할 키를 선택하고 사용량을 1 증가시킨다.
+
+        Raises:
+            QuotaExhaustedError: 모든 키가 해당 엔드포인트 한도에 도달한 경우
+        """
+        with self._lock:
+            self._roll_date()
+            for index in range(len(self._keys)):
+                if self._available(index, endpoint):
+                    fp = self._fingerprints[index]
+                    eps = self._usage.setdefault(fp, {})
+                    eps[endpoint] = eps.get(endpoint, 0) + 1
+                    self._unsaved += 1
+                    need_save = self._unsaved >= QUOTA_SAVE_INTERVAL
+                    break
+            else:
+                raise QuotaExhaustedError(
+                    f"모든 API 키({len(self._keys)}개)의 할당량 소진: {endpoint}"
+                )
+        if need_save:
+            self.save()
+        return index, self._keys[index]
+
+    def mark_exhausted(self, index: int, endpoint: str) -> None:
+        """할당량 오류를 받은 키의 해당 엔드포인트를 오늘 하루 사용 중지한다."""
+        with self._lock:
+            self._blocked.setdefault(self._fingerprints[index], set()).add(endpoint)
+        print(f"    [API 키] {self.label(index)} {endpoint} 할당량 소진 → 다음 키로 교체")
+        self.save()
+
+    def mark_invalid(self, index: int, code: str) -> None:
+        """키 자체 오류(미등록/만료 등)를 받은 키를 오늘 하루 전체 사용 중지한다."""
+        with self._lock:
+            self._blocked.setdefault(self._fingerprints[index], set()).add("*")
+        print(f"    [API 키] {self.label(index)} 사용 불가 (resultCode={code}) → 다음 키로 교체")
+        self.save()
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """키 식별자별 엔드포인트 사용량을 반환한다."""
+        with self._lock:
+            return {
+                self.label(i): dict(self._usage.get(fp, {}))
+                for i, fp in enumerate(self._fingerprints)
+            }
+
+
+_key_pool: ApiKeyPool | None = None
+
+
+def get_key_pool() -> ApiKeyPool:
+    """프로세스 전역 서비스 키 풀을 반환한다 (최초 호출 시 생성)."""
+    global _key_pool
+    if _key_pool is None:
+        _key_pool = ApiKeyPool(API_KEYS)
+        atexit.register(_key_pool.save)
+    return _key_pool
+
+
+def _redact(text: str) -> str:
+    """문자열에 포함된 serviceKey 값을 가린다."""
+    return _SERVICE_KEY_RE.sub(r"\1***", text)
+
+
+def _endpoint_name(endpoint_url: str) -> str:
+    """할당량 집계용 엔드포인트 이름 (예: KorService2/detailCommon2)."""
+    return "/".join(endpoint_url.rstrip("/").rsplit("/", 2)[-2:])
+
+
+def _detect_gateway_error(resp: httpx.Response) -> str | None:
+    """게이트웨이 오류 응답에서 서비스 키 관련 오류 코드를 추출한다.
+
+    data.go.kr 게이트웨이는 _type=json 요청에도 XML(OpenAPI_ServiceResponse)로
+    오류를 반환하므로 JSON이 아닌 응답만 검사한다.
+    """
+    if resp.status_code == 429:
+        return next(iter(API_QUOTA_ERROR_CODES))
+    content_type = resp.headers.get("content-type", "")
+    if "json" in content_type:
+        return None
+    text = resp.text
+    if text.lstrip().startswith("{"):
+        return None
+    match = _RETURN_REASON_RE.search(text)
+    if match:
+        return match.group(1)
+    if "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS" in text:
+        return next(iter(API_QUOTA_ERROR_CODES))
+    return None
+
+
+async def _request_json(
+    client: httpx.AsyncClient, endpoint_url: str, params: dict
+) -> dict:
+    """키 풀에서 서비스 키를 배정받아 요청하고 JSON 응답을 반환한다.
+
+    할당량/키 오류 응답(XML returnReasonCode 또는 JSON header.resultCode)을 받으면
+    다음 키로 교체하여 재요청한다. 예외 메시지에서는 serviceKey 값을 제거한다.
+
+    Raises:
+        QuotaExhaustedError: 사용 가능한 키가 없는 경우
+    """
+    pool = get_key_pool()
+    endpoint = _endpoint_name(endpoint_url)
+
+    while True:
+        data = None
+        index, key = pool.acquire(endpoint)
+        try:
+            resp = await client.get(endpoint_url, params={**params, "serviceKey": key})
+        except httpx.RequestError as e:
+            message = str(e)
+            if _SERVICE_KEY_RE.search(message):
+                raise httpx.RequestError(_redact(message)) from None
+            raise
+
+        code = _detect_gateway_error(resp)
+        if code is None:
+            try:
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise httpx.HTTPStatusError(
+                    _redact(str(e)), request=e.request, response=e.response
+                ) from None
+            data = resp.json()
+            header = data.get("response", {}).get("header", {}) if isinstance(data, dict) else {}
+            code = str(header.get("resultCode", ""))
+
+        if code in API_QUOTA_ERROR_CODES:
+            pool.mark_exhausted(index, endpoint)
+            continue
+        if code in API_KEY_ERROR_CODES:
+            pool.mark_invalid(index, code)
+            continue
+        if data is None:
+            raise httpx.HTTPStatusError(
+                f"API 게이트웨이 오류 (returnReasonCode={code}, endpoint={endpoint})",
+                request=resp.request,
+                response=resp,
+            )
+        return data
 
 
 def _build_params(extra: dict | None = None) -> dict:
-    """공통 파라미터에 serviceKey와 추가 파라미터를 병합한다."""
+    """공통 파라미터에 추가 파라미터를 병합한다 (serviceKey는 요청 시점에 키 풀에서 배정)."""
     params = {**COMMON_PARAMS}
-    params["serviceKey"] = API_KEY
     if extra:
         params.update(extra)
     return params
 
 
-def _parse_response(data: dict) -> tuple[list[dict], int]:
-    """API 응답에서 items 리스트와 totalCount를 추출한다."""
-    body = data.get("response", {}).get("body", {})
-    total_count = body.get("totalCount", 0)
+def _parse_response(data: dict, model=None) -> tuple[list, int]:
+    """API 응답에서 items 리스트와 totalCount를 추출한다 (model을 주면 항목을 모델로 검증/변환)."""
+    items, total_count = response_items(data)
+    if model is not None:
+        items = decode_items(model, items)
+    return items, total_count
 
-    items_wrapper = body.get("items", "")
-    if not items_wrapper or items_wrapper == "":
-        return [], total_count
 
-    item = items_wrapper.get("item", [])
-    if isinstance(item, dict):
-        item = [item]
-    return item, total_count
-
-
-async def fetch_all_pages(
+async def iter_pages(
     client: httpx.AsyncClient,
     endpoint_url: str,
     extra_params: dict | None = None,
-) -> list[dict]:
-    """totalCount 기반으로 모든 페이지를 순회하여 전체 items를 반환한다."""
+    start_page: int = 1,
+    model=None,
+) -> AsyncIterator[tuple[int, list]]:
+    """totalCount 기반으로 페이지를 순회하며 (pageNo, items)를 순서대로 반환한다.
+
+    start_page부터 시작하므로 중간 실패 시 마지막으로 받은 다음 페이지부터 재개할 수 있다.
+    model(src.models)을 주면 items는 검증된 모델 목록이다.
+    """
     params = _build_params(extra_params)
-    params["pageNo"] = 1
+    params["pageNo"] = start_page
 
-    resp = await client.get(endpoint_url, params=params)
-    resp.raise_for_status()
-    data = resp.json()
+    data = await _request_json(client, endpoint_url, params)
 
-    items, total_count = _parse_response(data)
+    items, total_count = _parse_response(data, model)
     if total_count == 0:
-        return []
+        return
 
-    all_items = list(items)
+    yield start_page, items
     num_of_rows = int(params.get("numOfRows", 100))
     total_pages = math.ceil(total_count / num_of_rows)
 
-    for page in range(2, total_pages + 1):
+    for page in range(start_page + 1, total_pages + 1):
         await asyncio.sleep(REQUEST_DELAY)
         params["pageNo"] = page
-        resp = await client.get(endpoint_url, params=params)
-        resp.raise_for_status()
-        data = resp.json()
-        page_items, _ = _parse_response(data)
-        all_items.extend(page_items)
+        data = await _request_json(client, endpoint_url, params)
+        page_items, _ = _parse_response(data, model)
+        yield page, page_items
+
 
+async def fetch_all_pages(
+    client: httpx.AsyncClient,
+    endpoint_url: str,
+    extra_params: dict | None = None,
+    model=None,
+) -> list:
+    """totalCount 기반으로 모든 페이지를 순회하여 전체 items를 반환한다 (model은 iter_pages()와 같다)."""
+    all_items: list = []
+    async for _, items in iter_pages(client, endpoint_url, extra_params, model=model):
+        all_items.extend(items)
     return all_items
 
 
@@ -71,13 +376,12 @@ async def fetch_single(
     client: httpx.AsyncClient,
     endpoint_url: str,
     extra_params: dict | None = None,
-) -> list[dict]:
-    """단일 페이지만 조회하여 items를 반환한다."""
+    model=None,
+) -> list:
+    """단일 페이지만 조회하여 items를 반환한다 (model은 iter_pages()와 같다)."""
     params = _build_params(extra_params)
-    resp = await client.get(endpoint_url, params=params)
-    resp.raise_for_status()
-    data = resp.json()
-    items, _ = _parse_response(data)
+    data = await _request_json(client, endpoint_url, params)
+    items, _ = _parse_response(data, model)
     return items
 
 
@@ -4,7 +4,19 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-API_KEY = os.environ.get("DATA_GO_KR_API_KEY", "")
+# 서비스 키 풀: DATA_GO_KR_API_KEYS(쉼표 구분) + DATA_GO_KR_API_KEY (중복 제거, 순서 유지)
+API_KEYS: list[str] = list(dict.fromkeys(
+    key.strip()
+    for key in [
+        *os.environ.get("DATA_GO_KR_API_KEYS", "").split(","),
+        os.environ.get("DATA_GO_KR_API_KEY", ""),
+    ]
+    if key.strip()
+))
+API_KEY = API_KEYS[0] if API_KEYS else ""
+
+# API 기본 URL (로컬 테스트 시 mock 서버 주소로 교체: 예) http://127.0.0.1:8765/B551011)
+API_BASE_URL = os.environ.get("DATA_GO_KR_API_BASE_URL", "https://apis.data.go.kr/B551011").rstrip("/")
 
 COMMON_PARAMS = {
     "numOfRows": 200,
@@ -16,45 +28,93 @@ COMMON_PARAMS = {
 
 ENDPOINTS = {
     "ldong_code": {
-        "kr": "https://apis.data.go.kr/B551011/KorService2/ldongCode2",
-        "en": "https://apis.data.go.kr/B551011/EngService2/ldongCode2",
+        "kr": f"{API_BASE_URL}/KorService2/ldongCode2",
+        "en": f"{API_BASE_URL}/EngService2/ldongCode2",
     },
     "category_code": {
-        "kr": "https://apis.data.go.kr/B551011/KorService2/lclsSystmCode2",
-        "en": "https://apis.data.go.kr/B551011/EngService2/lclsSystmCode2",
+        "kr": f"{API_BASE_URL}/KorService2/lclsSystmCode2",
+        "en": f"{API_BASE_URL}/EngService2/lclsSystmCode2",
     },
     "area_based": {
-        "kr": "https://apis.data.go.kr/B551011/KorService2/areaBasedList2",
-        "en": "https://apis.data.go.kr/B551011/EngService2/areaBasedList2",
+        "kr": f"{API_BASE_URL}/KorService2/areaBasedList2",
+        "en": f"{API_BASE_URL}/EngService2/areaBasedList2",
     },
     "detail_common": {
-        "kr": "https://apis.data.go.kr/B551011/KorService2/detailCommon2",
-        "en": "https://apis.data.go.kr/B551011/EngService2/detailCommon2",
+        "kr": f"{API_BASE_URL}/KorService2/detailCommon2",
+        "en": f"{API_BASE_URL}/EngService2/detailCommon2",
     },
     "detail_intro": {
-        "kr": "https://apis.data.go.kr/B551011/KorService2/detailIntro2",
-        "en": "https://apis.data.go.kr/B551011/EngService2/detailIntro2",
+        "kr": f"{API_BASE_URL}/KorService2/detailIntro2",
+        "en": f"{API_BASE_URL}/EngService2/detailIntro2",
     },
     "detail_info": {
-        "kr": "https://apis.data.go.kr/B551011/KorService2/detailInfo2",
-        "en": "https://apis.data.go.kr/B551011/EngService2/detailInfo2",
+        "kr": f"{API_BASE_URL}/KorService2/detailInfo2",
+        "en": f"{API_BASE_URL}/EngService2/detailInfo2",
     },
     "detail_image": {
-        "kr": "https://apis.data.go.kr/B551011/KorService2/detailImage2",
-        "en": "https://apis.data.go.kr/B551011/EngService2/detailImage2",
+        "kr": f"{API_BASE_URL}/KorService2/detailImage2",
+        "en": f"{API_BASE_URL}/EngService2/detailImage2",
     },
     "detail_pet": {
-        "kr": "https://apis.data.go.kr/B551011/KorService2/detailPetTour2",
+        "kr": f"{API_BASE_URL}/KorService2/detailPetTour2",
     },
     "area_based_sync": {
-        "kr": "https://apis.data.go.kr/B551011/KorService2/areaBasedSyncList2",
-        "en": "https://apis.data.go.kr/B551011/EngService2/areaBasedSyncList2",
+        "kr": f"{API_BASE_URL}/KorService2/areaBasedSyncList2",
+        "en": f"{API_BASE_URL}/EngService2/areaBasedSyncList2",
     },
     "search_festival": {
-        "kr": "https://apis.data.go.kr/B551011/KorService2/searchFestival2",
-        "en": "https://apis.data.go.kr/B551011/EngService2/searchFestival2",
+        "kr": f"{API_BASE_URL}/KorService2/searchFestival2",
+        "en": f"{API_BASE_URL}/EngService2/searchFestival2",
     },
 }
 
 REQUEST_DELAY = 0.3  # 요청 간 대기 시간 (초)
+API_DAILY_QUOTA = 5000  # 서비스 키 × 엔드포인트(언어별 API)당 일일 호출 한도
+API_QUOTA_ERROR_CODES = {"22"}  # LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR → 해당 엔드포인트만 소진 처리
+API_KEY_ERROR_CODES = {"20", "30", "31", "32"}  # 접근 거부/미등록/기한 만료/미등록 IP → 키 전체 사용 중지
 DETAIL_UPDATE_MAX_POIS = 5000  # 각 언어당 기본 최대 POI 수 (API별 5000건/일/언어)
+DETAIL_FULL_REFRESH_DAYS = 30  # 원본 modifiedtime이 같아도 상세 수신 후 N일이 지나면 재수신 (0이면 비활성)
+
+# Step 4 동기화 파이프라인 (목록 수신 → 변환/상세 수신 → MongoDB upsert 동시 진행)
+SYNC_QUEUE_SIZE = 200  # 단계 간 큐 최대 길이 (메모리 상한)
+SYNC_WRITE_BATCH_SIZE = 100  # MongoDB upsert 배치 크기
+SYNC_FLUSH_INTERVAL = 10.0  # 배치가 차지 않아도 upsert하는 최대 대기 시간 (초)
+
+# POI 변환 멀티 프로세스 (--transform-only --workers N)
+TRANSFORM_CHUNK_SIZE = 5000  # 프로세스에 넘기는 청크당 최대 항목 수
+
+# Step 3 우선순위 스케줄러 가중치 (지정되지 않은 지역/카테고리는 1.0)
+DETAIL_PRIORITY_REGION_WEIGHTS: dict[str, float] = {
+    "seoul": 1.5,
+    "busan": 1.3,
+    "jeju": 1.3,
+    "gyeonggi": 1.2,
+    "incheon": 1.1,
+    "gangwon": 1.1,
+}
+DETAIL_PRIORITY_CATEGORY_WEIGHTS: dict[str, float] = {  # appCategory 기준
+    "festival": 1.5,
+    "attraction": 1.2,
+    "culture": 1.2,
+    "nature": 1.2,
+    "restaurant": 1.0,
+    "leisure": 1.0,
+    "accommodation": 0.8,
+    "shopping": 0.7,
+}
+
+# Step 3 멀티 워커 (샤드 + lease)
+DETAIL_SHARD_COUNT = 64  # contentId 해시 기반 샤드 수
+DETAIL_LEASE_TTL = 300  # lease 만료 시간 (초) — 워커 비정상 종료 시 다른 워커가 이어받음
+# lease 저장소: auto(MONGODB_URI 있으면 mongo, 없으면 sqlite) | sqlite | mongo
+DETAIL_LEASE_BACKEND = os.environ.get("DETAIL_LEASE_BACKEND", "auto")
+
+# 벡터 타일 (--build-tiles, Step 4/5 증분 갱신)
+TILE_MIN_ZOOM = 5
+TILE_MAX_ZOOM = 14
+TILE_EXTENT = 4096  # 타일 내부 좌표 범위 (MVT 기본값)
+
+# POI 클러스터 (줌별 격자 계층 클러스터, output/clusters + poi_clusters 컬렉션)
+CLUSTER_MIN_ZOOM = 5
+CLUSTER_MAX_ZOOM = 13  # 이보다 큰 줌에서는 개별 POI(벡터 타일) 사용
+CLUSTER_CELL_PX = 64  # 256px 타일 기준 클러스터 격자 크기 (256의 약수인 2의 거듭제곱)
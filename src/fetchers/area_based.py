@@ -4,38 +4,34 @@ from pathlib import Path
 
 import httpx
 
-from src.client import create_client, fetch_all_pages, save_raw
+from src.client import RAW_DIR, create_client, fetch_all_pages, iter_pages, save_raw
 from src.config import ENDPOINTS, REQUEST_DELAY
+from src.models import AreaBasedItem, try_decode
+from src.utils import JsonArrayWriter
 
 OUTPUT_DIR = Path(__file__).resolve().parent.parent.parent / "output"
-CONTENT_TYPES_PATH = OUTPUT_DIR / "content-types.json"
 REGIONS_PATH = OUTPUT_DIR / "regions.json"
 
 
-def _load_content_types() -> list[dict]:
-    return json.loads(CONTENT_TYPES_PATH.read_text(encoding="utf-8"))
-
-
 def _load_regions() -> list[dict]:
     return json.loads(REGIONS_PATH.read_text(encoding="utf-8"))
 
 
 def _get_content_type_ids(lang: str) -> list[str]:
-    """언어별 사용 가능한 contentTypeId 목록을 반환한다."""
-    content_types = _load_content_types()
-    ids = []
-    for ct in content_types:
-        code = ct.get("code", {})
-        if lang in code and code[lang]:
-            ids.append(str(code[lang]))
-    return ids
+    """언어별 사용 가능한 contentTypeId 목록을 반환한다 (참조 데이터 번들)."""
+    from src.transformers.reference import CONTENT_TYPES_PATH, load_reference_bundle
+
+    content_type_ids = load_reference_bundle()["content_type_ids"]
+    if content_type_ids is None:
+        raise FileNotFoundError(f"콘텐츠 타입 파일 없음: {CONTENT_TYPES_PATH}")
+    return content_type_ids[lang]
 
 
 def _get_region_codes() -> list[str]:
-    """API 조회용 법정동 숫자 코드 목록을 반환한다."""
-    from src.transformers.regions import REGION_CODE_MAP
+    """API 조회용 법정동 숫자 코드 목록을 반환한다 (참조 데이터 번들)."""
+    from src.transformers.reference import load_reference_bundle
 
-    return list(REGION_CODE_MAP.keys())
+    return list(load_reference_bundle()["region_code_map"].keys())
 
 
 async def fetch_area_based() -> dict:
@@ -87,6 +83,111 @@ async def fetch_area_based() -> dict:
     return result
 
 
+async def stream_area_based(writer=None, batch_size: int = 300) -> dict[str, dict[str, int]]:
+    """지역기반 관광정보 수신 → POI 변환 → 파일/MongoDB 저장을 페이지 단위로 한 번에 수행한다.
+
+    fetch_area_based() + transform_pois() + save_pois() + save_pois_to_mongodb()와 같은 결과를
+    만들지만, 전체 목록을 메모리에 모으지 않고 수신한 페이지를 바로 흘려보낸다.
+    - raw/area_based/{lang}/ct{id}_rg{code}.json, area_based_{lang}.json: 원본 항목 스트리밍 기록
+    - pois_{lang}.json, pois_geo_{lang}.json, pois_exclude_{lang}.json: PoiOutputWriter
+    - MongoDB: batch_size건마다 writer.upsert() (제외 항목 제외)
+
+    출력 파일은 기존 경로와 바이트 단위로 같다. 중간에 실패하면 기존 output 파일을 유지한다.
+
+    Args:
+        writer: PoiUpsertWriter (None이면 MongoDB 저장 없음)
+        batch_size: MongoDB upsert 배치 크기
+
+    Returns:
+        언어별 건수 {"kr": {"received", "pois", "excluded", "upserted"}, "en": {...}}
+    """
+    from src.transformers.pois import PoiOutputWriter, TransformPlan, build_category_map
+
+    region_codes = _get_region_codes()
+    category_map = build_category_map()
+    stats: dict[str, dict[str, int]] = {}
+
+    async with create_client() as client:
+        for lang in ("kr", "en"):
+            url = ENDPOINTS["area_based"][lang]
+            plan = TransformPlan(lang, category_map)
+            content_type_ids = _get_content_type_ids(lang)
+            total_combos = len(content_type_ids) * len(region_codes)
+            count = 0
+            lang_stats = {"received": 0, "pois": 0, "excluded": 0, "upserted": 0}
+            buffer: list[dict] = []
+
+            area_out = JsonArrayWriter(OUTPUT_DIR / f"area_based_{lang}.json")
+            poi_out = PoiOutputWriter(lang)
+            try:
+                for ct_id in content_type_ids:
+                    for region_code in region_codes:
+                        count += 1
+                        print(
+                            f"  [{lang}] ({count}/{total_combos}) "
+                            f"contentTypeId={ct_id}, lDongRegnCd={region_code}"
+                        )
+                        await asyncio.sleep(REQUEST_DELAY)
+                        raw_out = JsonArrayWriter(
+                            RAW_DIR / "area_based" / lang / f"ct{ct_id}_rg{region_code}.json"
+                        )
+                        try:
+                            async for _, items in iter_pages(
+                                client,
+                                url,
+                                {
+                                    "arrange": "A",
+                                    "contentTypeId": ct_id,
+                                    "lDongRegnCd": region_code,
+                                },
+                            ):
+                                raw_out.write_all(items)
+                                area_out.write_all(items)
+                                for raw in items:
+                                    item = try_decode(AreaBasedItem, raw)
+                                    if item is None:
+                                        continue
+                                    excluded = plan.is_excluded(item)
+                                    poi = plan.transform(item)
+                                    poi_out.write(poi, excluded)
+                                    if excluded:
+                                        lang_stats["excluded"] += 1
+                                    else:
+                                        lang_stats["pois"] += 1
+                                        if writer is not None:
+                                            buffer.append(poi)
+                                if len(buffer) >= batch_size:
+                                    lang_stats["upserted"] += await asyncio.to_thread(
+                                        writer.upsert, lang, buffer
+                                    )
+                                    buffer = []
+                        except BaseException:
+                            raw_out.abort()
+                            raise
+                        raw_out.close()
+                        lang_stats["received"] += raw_out.count
+                        print(f"    → {raw_out.count}건 수신")
+
+                if buffer:
+                    lang_stats["upserted"] += await asyncio.to_thread(writer.upsert, lang, buffer)
+            except BaseException:
+                area_out.abort()
+                poi_out.abort()
+                raise
+
+            print(f"  [Output] {area_out.close()} ({lang_stats['received']}건)")
+            for path in poi_out.close():
+                print(f"[Transform] 저장 완료: {path}")
+            print(
+                f"  [{lang}] 총 {lang_stats['received']}건 수신 → POI {lang_stats['pois']}건, "
+                f"제외 {lang_stats['excluded']}건"
+                + (f", MongoDB upsert {lang_stats['upserted']}건" if writer is not None else "")
+            )
+            stats[lang] = lang_stats
+
+    return stats
+
+
 def _save_output(data: dict[str, list[dict]]) -> None:
     """output 디렉토리에 area_based_kr.json, area_based_en.json으로 저장한다."""
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -1,25 +1,42 @@
 """POI 상세 정보(detailCommon2, detailIntro2, detailInfo2) 수신 및 병합 로직."""
 
 import asyncio
+import heapq
 import json
 from pathlib import Path
 
-from src.client import create_client, fetch_single, save_raw
-from src.config import DETAIL_UPDATE_MAX_POIS, ENDPOINTS, REQUEST_DELAY
-from src.transformers.pois_detail import merge_detail_to_poi
+from src.client import QuotaExhaustedError, create_client, fetch_single, save_raw
+from src.config import (
+    DETAIL_FULL_REFRESH_DAYS,
+    DETAIL_PRIORITY_CATEGORY_WEIGHTS,
+    DETAIL_PRIORITY_REGION_WEIGHTS,
+    DETAIL_UPDATE_MAX_POIS,
+    ENDPOINTS,
+    REQUEST_DELAY,
+)
+from src.models import DetailCommonItem, DetailImageItem, decode_item, decode_items
+from src.transformers.poi_projection import LazyPoiTable
+from src.transformers.poi_table import PoiTable
+from src.transformers.pois_detail import DetailMerge, merge_details, merge_details_async
+from src.utils import JsonArrayWriter
 
 OUTPUT_DIR = Path(__file__).resolve().parent.parent.parent / "output"
 
 # 중간 저장 주기 (건)
 CHECKPOINT_INTERVAL = 50
+# 상세 병합을 모아서 처리하는 건수 (이벤트 루프 밖 스레드에서 한 번에 병합)
+DETAIL_MERGE_BATCH_SIZE = 25
 
+# 스케줄링/진행 상황 표시에 쓰는 필드 — 나머지 필드는 처리 대상 POI만 원문에서 읽는다
+POI_SCHEDULE_FIELDS = ("id", "region", "appCategory", "updatedAt", "source.modifiedtime")
+DETAIL_SCHEDULE_FIELDS = (
+    "id", "region", "detailUpdatedAt", "detailModifiedTime", "detailImageUpdated", "detailPetUpdated",
+)
 
-def _load_pois(lang: str) -> list[dict]:
-    """output/pois_{lang}.json에서 전체 POI 목록을 로드한다."""
-    path = OUTPUT_DIR / f"pois_{lang}.json"
-    if not path.exists():
-        return []
-    return json.loads(path.read_text(encoding="utf-8"))
+
+def _load_pois(lang: str) -> LazyPoiTable:
+    """output/pois_{lang}.json을 스케줄링 필드만 투영한 테이블로 연다 (파일이 없으면 빈 테이블)."""
+    return LazyPoiTable.open(OUTPUT_DIR / f"pois_{lang}.json", POI_SCHEDULE_FIELDS)
 
 
 def _load_details(lang: str) -> list[dict]:
@@ -30,25 +47,219 @@ def _load_details(lang: str) -> list[dict]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def _save_details(lang: str, details: list[dict]) -> Path:
-    """업데이트된 POI 목록을 output/pois_details_{lang}.json으로 저장한다."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    path = OUTPUT_DIR / f"pois_details_{lang}.json"
-    path.write_text(
-        json.dumps(details, ensure_ascii=False, indent=2), encoding="utf-8"
+def _open_detail_table(lang: str) -> LazyPoiTable:
+    """기존 상세 결과를 스케줄링 필드만 투영한 테이블로 연다 (같은 id는 마지막 항목)."""
+    return LazyPoiTable.open(
+        OUTPUT_DIR / f"pois_details_{lang}.json", DETAIL_SCHEDULE_FIELDS, unique=True
     )
-    return path
+
+
+def _load_detail_table(lang: str) -> LazyPoiTable:
+    """기존 상세 결과를 투영 테이블로 열고 완료 플래그를 백필한다 (백필 대상만 원문을 읽음)."""
+    details = _open_detail_table(lang)
+    backfill = [
+        row.to_dict()
+        for row in details
+        if row.get("detailUpdatedAt")
+        and ("detailImageUpdated" not in row or (lang == "kr" and "detailPetUpdated" not in row))
+    ]
+    _backfill_detail_flags(backfill, lang)
+    for doc in backfill:
+        details.upsert(doc)
+    return details
+
+
+def _write_poi_array(path: Path, pois) -> Path:
+    """POI dict/PoiTable을 JSON 배열로 스트리밍 저장한다 (json.dumps(indent=2)와 같은 내용).
+
+    LazyPoiTable은 바뀌지 않은 항목의 원문을 복사하고 투영 파일도 갱신한다.
+    """
+    if isinstance(pois, LazyPoiTable):
+        return pois.save(path)
+    writer = JsonArrayWriter(path)
+    try:
+        writer.write_all(pois.iter_dicts() if isinstance(pois, PoiTable) else pois)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
+
+
+def _save_details(lang: str, details) -> Path:
+    """업데이트된 POI 목록(dict 목록 또는 PoiTable)을 output/pois_details_{lang}.json으로 저장한다."""
+    return _write_poi_array(OUTPUT_DIR / f"pois_details_{lang}.json", details)
+
+
+def _backfill_detail_flags(existing_details: list[dict], lang: str) -> None:
+    """기존 데이터 백필: detailUpdatedAt이 있지만 플래그가 누락된 항목 보정."""
+    for d in existing_details:
+        if d.get("detailUpdatedAt"):
+            if "detailImageUpdated" not in d:
+                d["detailImageUpdated"] = True
+            if lang == "kr" and "detailPetUpdated" not in d:
+                d["detailPetUpdated"] = True
+
+
+def _missing_detail_fields(detail: dict, lang: str) -> list[str]:
+    """상세 문서에서 아직 채워지지 않은 항목 목록을 반환한다.
+
+    kr: intro + info + detailImageUpdated + detailPetUpdated
+    en: intro + info + detailImageUpdated (pet 미지원)
+    """
+    missing = [key for key in ("intro", "info") if key not in detail]
+    if not detail.get("detailImageUpdated"):
+        missing.append("image")
+    if lang == "kr" and not detail.get("detailPetUpdated"):
+        missing.append("pet")
+    return missing
+
+
+def _stale_days(updated_at: str, detail_updated_at: str) -> int:
+    """원본 수정일(updatedAt)이 상세 수신일(detailUpdatedAt)보다 며칠 뒤인지 반환한다.
+
+    날짜 형식이 올바르지 않으면 0을 반환한다.
+    """
+    from datetime import date
+
+    try:
+        modified = date.fromisoformat(updated_at)
+        fetched = date.fromisoformat(detail_updated_at)
+    except (TypeError, ValueError):
+        return 0
+    return max((modified - fetched).days, 0)
+
+
+def _source_modifiedtime(poi: dict) -> str:
+    """POI의 원본 modifiedtime (areaBasedList2/areaBasedSyncList2 기준)을 반환한다."""
+    return poi.get("source", {}).get("modifiedtime", "")
+
+
+def _detail_is_current(poi: dict, detail: dict | None, full_refresh: bool = False) -> bool:
+    """상세 데이터가 원본 modifiedtime 기준으로 최신인지 판정한다 (변경 감지 게이트).
+
+    - full_refresh이면 항상 False
+    - 원본 또는 상세의 modifiedtime이 없으면 False (판정 불가 → 재수신)
+    - 상세 수신 후 DETAIL_FULL_REFRESH_DAYS일이 지났으면 False (주기적 전체 갱신)
+    """
+    from datetime import date
+
+    if full_refresh or not detail:
+        return False
+    source_mt = _source_modifiedtime(poi)
+    if not source_mt or detail.get("detailModifiedTime") != source_mt:
+        return False
+    if DETAIL_FULL_REFRESH_DAYS > 0:
+        try:
+            fetched = date.fromisoformat(detail.get("detailUpdatedAt", ""))
+        except (TypeError, ValueError):
+            return False
+        if (date.today() - fetched).days >= DETAIL_FULL_REFRESH_DAYS:
+            return False
+    return True
+
+
+def _score_pending_poi(
+    poi: dict,
+    detail: dict | None,
+    lang: str,
+    force: bool = False,
+    full_refresh: bool = False,
+) -> tuple[float, str] | None:
+    """POI의 상세 업데이트 우선순위 점수와 사유를 계산한다.
+
+    - 상세 미수신: 3.0
+    - 원본 수정일이 상세 수신일 이후(stale): 2.0 + 경과일/365 (최대 1.0)
+    - 원본 modifiedtime이 상세 수신 기준(detailModifiedTime)과 다름: 2.0
+    - 누락 항목 존재: 1.0 + 누락 항목당 0.25
+    - 위 조건에 해당하지 않으면 None (force/full_refresh 모드에서는 0.5)
+
+    force 모드라도 원본 modifiedtime이 상세 수신 시점과 같으면 재수신하지 않는다
+    (_detail_is_current). full_refresh는 이 게이트를 무시한다.
+
+    기본 점수에 지역/카테고리 가중치를 곱한다.
+
+    Returns:
+        (score, reason) 또는 업데이트가 필요 없으면 None
+    """
+    if detail is None or not detail.get("detailUpdatedAt"):
+        base, reason = 3.0, "new"
+    else:
+        base = 0.0
+        reasons = []
+        current = _detail_is_current(poi, detail, full_refresh)
+        stale = 0 if current else _stale_days(poi.get("updatedAt", ""), detail["detailUpdatedAt"])
+        if stale > 0:
+            base += 2.0 + min(stale, 365) / 365
+            reasons.append(f"stale+{stale}d")
+        elif detail.get("detailModifiedTime") and detail["detailModifiedTime"] != _source_modifiedtime(poi):
+            # 같은 날 수정되어 날짜 비교로는 감지되지 않는 변경
+            base += 2.0
+            reasons.append("modified")
+        missing = _missing_detail_fields(detail, lang)
+        if missing:
+            base += 1.0 + 0.25 * len(missing)
+            reasons.append("missing:" + ",".join(missing))
+        if base == 0.0:
+            if current or not (force or full_refresh):
+                return None
+            base, reasons = 0.5, ["full-refresh" if full_refresh else "force"]
+        reason = " ".join(reasons)
+
+    weight = DETAIL_PRIORITY_REGION_WEIGHTS.get(poi.get("region", ""), 1.0)
+    weight *= DETAIL_PRIORITY_CATEGORY_WEIGHTS.get(poi.get("appCategory", ""), 1.0)
+    return base * weight, reason
+
+
+def _schedule_pending_pois(
+    all_pois: PoiTable | list[dict],
+    existing_details: PoiTable | list[dict],
+    region: str | None,
+    limit: int,
+    lang: str = "kr",
+    force: bool = False,
+    full_refresh: bool = False,
+) -> list[tuple[float, str, dict]]:
+    """업데이트가 필요한 POI를 우선순위 순으로 정렬하여 limit개까지 반환한다.
+
+    점수가 같으면 pois_{lang}.json의 파일 순서를 유지한다.
+    PoiTable을 받으면 행 뷰(PoiRow)로 점수를 매기고 결과 poi도 행 뷰로 반환한다.
+
+    Returns:
+        [(score, reason, poi), ...] (점수 내림차순, limit개 이하)
+    """
+    if isinstance(existing_details, PoiTable):
+        details_map = existing_details
+    else:
+        details_map = {d["id"]: d for d in existing_details}
+
+    scored: list[tuple[float, int, str, dict]] = []
+    for idx, poi in enumerate(all_pois):
+        # 지역 필터 적용
+        if region and poi.get("region") != region:
+            continue
+        scored_poi = _score_pending_poi(
+            poi, details_map.get(poi["id"]), lang, force, full_refresh
+        )
+        if scored_poi is None:
+            continue
+        score, reason = scored_poi
+        scored.append((-score, idx, reason, poi))
+
+    # 예산(limit)만큼 점수 높은 순으로 채운다
+    best = heapq.nsmallest(limit, scored, key=lambda s: (s[0], s[1]))
+    return [(-neg_score, reason, poi) for neg_score, _, reason, poi in best]
 
 
 def _filter_pending_pois(
-    all_pois: list[dict],
-    existing_details: list[dict],
+    all_pois: PoiTable | list[dict],
+    existing_details: PoiTable | list[dict],
     region: str | None,
     limit: int,
     lang: str = "kr",
     force: bool = False,
+    full_refresh: bool = False,
 ) -> list[dict]:
-    """업데이트가 필요한 POI만 필터링한다.
+    """업데이트가 필요한 POI만 우선순위 순으로 필터링한다.
 
     Args:
         all_pois: 전체 POI 목록
@@ -56,45 +267,36 @@ def _filter_pending_pois(
         region: 지역 slug 필터 (None이면 전체)
         limit: 최대 처리 건수
         lang: 언어 코드 (kr/en) — kr일 때만 detailPetUpdated 체크
-        force: True이면 완료 체크를 무시하고 모든 POI를 재수신 대상으로 포함
+        force: True이면 완료된 POI도 재수신 대상으로 포함 (우선순위는 가장 낮음, modifiedtime 불변 POI 제외)
+        full_refresh: True이면 modifiedtime 변경 감지 게이트를 무시하고 완료된 POI 전체 재수신
 
     Returns:
-        업데이트가 필요한 POI 목록 (limit개 이하)
+        업데이트가 필요한 POI 목록 (limit개 이하, 우선순위 내림차순)
     """
-    # force 모드일 때는 완료 체크 무시
-    if force:
-        updated_ids: set[str] = set()
-    else:
-        # 이미 업데이트된 ID 집합
-        # kr: detailUpdatedAt + intro + info + detailImageUpdated + detailPetUpdated 모두 존재해야 스킵
-        # en: detailUpdatedAt + intro + info + detailImageUpdated 있으면 스킵 (pet 미지원)
-        def _is_complete(d: dict) -> bool:
-            base = d.get("detailUpdatedAt") and "intro" in d and "info" in d and d.get("detailImageUpdated")
-            if not base:
-                return False
-            if lang == "kr":
-                return bool(d.get("detailPetUpdated"))
-            return True
-
-        updated_ids = {
-            d["id"]
-            for d in existing_details
-            if _is_complete(d)
-        }
-
-    pending = []
-    for poi in all_pois:
-        # intro와 info가 모두 있는 POI만 스킵
-        if poi["id"] in updated_ids:
-            continue
-        # 지역 필터 적용
-        if region and poi.get("region") != region:
-            continue
-        pending.append(poi)
-        if len(pending) >= limit:
-            break
+    return [
+        poi if isinstance(poi, dict) else poi.to_dict()
+        for _, _, poi in _schedule_pending_pois(
+            all_pois, existing_details, region, limit, lang, force, full_refresh
+        )
+    ]
 
-    return pending
+
+def _print_schedule(lang: str, scheduled: list[tuple[float, str, dict]], top: int = 20) -> None:
+    """--dry-run 시 선택될 POI 목록과 지역/카테고리 분포를 출력한다."""
+    from collections import Counter
+
+    print(f"[{lang}] [dry-run] 선택 예정 {len(scheduled):,}건 (상위 {min(top, len(scheduled))}건 표시)")
+    for rank, (score, reason, poi) in enumerate(scheduled[:top], 1):
+        print(
+            f"  {rank:>3}. score={score:.2f} contentId={poi['id']} "
+            f"region={poi.get('region', '')} appCategory={poi.get('appCategory', '')} "
+            f"({reason}) — {poi.get('name', '')}"
+        )
+
+    region_dist = Counter(poi.get("region", "") or "-" for _, _, poi in scheduled)
+    category_dist = Counter(poi.get("appCategory", "") or "-" for _, _, poi in scheduled)
+    print(f"[{lang}] [dry-run] 지역 분포: " + ", ".join(f"{k}({n}건)" for k, n in region_dist.most_common()))
+    print(f"[{lang}] [dry-run] 카테고리 분포: " + ", ".join(f"{k}({n}건)" for k, n in category_dist.most_common()))
 
 
 def _print_progress(lang: str, total: int, done: int, batch: int) -> None:
@@ -114,7 +316,9 @@ async def fetch_detail_for_poi(
     poi: dict,
     *,
     save_raw_data: bool = True,
-) -> tuple[dict | None, list[dict] | None, list[dict] | None, list[dict] | None, dict | None, bool]:
+) -> tuple[
+    DetailCommonItem | None, list[dict] | None, list[dict] | None, list[DetailImageItem] | None, dict | None, bool
+]:
     """단일 POI에 대해 detailCommon2, detailIntro2, detailInfo2, detailImage2, detailPetTour2를 호출한다.
 
     Args:
@@ -126,6 +330,10 @@ async def fetch_detail_for_poi(
     Returns:
         (common_item, intro_items, info_items, image_items, pet_item, had_exception)
         — 각각 API 응답 또는 None, had_exception은 호출 중 예외 발생 여부
+        (detailCommon2/detailImage2는 src.models 모델로 검증 — 검증 실패는 호출 실패와 같이 처리)
+
+    Raises:
+        QuotaExhaustedError: 모든 API 키의 할당량이 소진된 경우 (호출 중단)
     """
     content_id = poi["id"]
     content_type_id = poi.get("source", {}).get("contentTypeId", "")
@@ -146,9 +354,11 @@ async def fetch_detail_for_poi(
             {"contentId": content_id},
         )
         if items:
-            common_item = items[0]
             if save_raw_data:
                 save_raw(items, "detail_common", lang, content_id)
+            common_item = decode_item(DetailCommonItem, items[0])
+    except QuotaExhaustedError:
+        raise
     except Exception as e:
         had_exception = True
         print(f"    [경고] detailCommon2 호출 실패 (contentId={content_id}): {e}")
@@ -166,6 +376,8 @@ async def fetch_detail_for_poi(
             intro_items = items
             if save_raw_data:
                 save_raw(items, "detail_intro", lang, content_id)
+    except QuotaExhaustedError:
+        raise
     except Exception as e:
         had_exception = True
         print(f"    [경고] detailIntro2 호출 실패 (contentId={content_id}): {e}")
@@ -183,6 +395,8 @@ async def fetch_detail_for_poi(
             info_items = items
             if save_raw_data:
                 save_raw(items, "detail_info", lang, content_id)
+    except QuotaExhaustedError:
+        raise
     except Exception as e:
         had_exception = True
         print(f"    [경고] detailInfo2 호출 실패 (contentId={content_id}): {e}")
@@ -198,9 +412,11 @@ async def fetch_detail_for_poi(
             {"contentId": content_id},
         )
         if items:
-            image_items = items
             if save_raw_data:
                 save_raw(items, "detail_image", lang, content_id)
+            image_items = decode_items(DetailImageItem, items)
+    except QuotaExhaustedError:
+        raise
     except Exception as e:
         had_exception = True
         print(f"    [경고] detailImage2 호출 실패 (contentId={content_id}): {e}")
@@ -219,6 +435,8 @@ async def fetch_detail_for_poi(
                 pet_item = items[0]
                 if save_raw_data:
                     save_raw(items, "detail_pet", lang, content_id)
+        except QuotaExhaustedError:
+            raise
         except Exception as e:
             had_exception = True
             print(f"    [경고] detailPetTour2 호출 실패 (contentId={content_id}): {e}")
@@ -226,22 +444,85 @@ async def fetch_detail_for_poi(
     return common_item, intro_items, info_items, image_items, pet_item, had_exception
 
 
+def _detail_merge_entry(
+    poi: dict,
+    base_poi: dict,
+    results: tuple,
+) -> tuple[str, DetailMerge | None]:
+    """fetch_detail_for_poi() 결과를 판정하고 병합 입력을 만든다 (병합은 하지 않음).
+
+    Args:
+        poi: 처리 대상 POI (pois_{lang}.json 항목)
+        base_poi: 병합 기준 문서 (기존 상세 데이터가 있으면 그것, --force 재수신 시 기존 데이터 보존)
+        results: fetch_detail_for_poi()의 반환값
+
+    Returns:
+        ("merge", DetailMerge) | ("deleted", None) | ("skipped", None)
+    """
+    common, intro_items, info_items, image_items, pet_item, had_exception = results
+
+    # 모든 API 응답이 없는 경우
+    all_none = (
+        common is None
+        and intro_items is None
+        and info_items is None
+        and image_items is None
+        and pet_item is None
+    )
+
+    if all_none:
+        if had_exception:
+            # 네트워크/HTTP 오류로 실패 — 스킵 (삭제 안함)
+            print(f"    → 스킵 (API 호출 오류)")
+            return "skipped", None
+        # 정상 응답이지만 모든 API에서 데이터 없음 — 삭제된 POI
+        print(f"    → 삭제 후보 (모든 API 응답 비어있음)")
+        return "deleted", None
+
+    # base_poi가 이전 상세 문서여도 현재 원본 modifiedtime을 기록한다
+    return "merge", DetailMerge(
+        base_poi, common, intro_items, info_items, image_items, pet_item,
+        modifiedtime=_source_modifiedtime(poi),
+    )
+
+
+def _finish_merged(lang: str, updated_poi: dict) -> dict:
+    """kr에서 pet API를 호출했지만 결과가 없는 경우에도 완료 플래그를 설정한다."""
+    if lang == "kr" and "detailPetUpdated" not in updated_poi:
+        updated_poi["detailPetUpdated"] = True
+    return updated_poi
+
+
+def _merge_detail_result(
+    lang: str,
+    poi: dict,
+    base_poi: dict,
+    results: tuple,
+) -> tuple[str, dict | None]:
+    """fetch_detail_for_poi() 결과를 판정하고 병합한다 (한 건씩 처리하는 경로용).
+
+    Returns:
+        ("updated", 병합된 POI) | ("deleted", poi) | ("skipped", None)
+    """
+    status, entry = _detail_merge_entry(poi, base_poi, results)
+    if status == "skipped":
+        return status, None
+    if status == "deleted":
+        return status, poi
+    return "updated", _finish_merged(lang, merge_details([entry])[0])
+
+
 def _remove_deleted_pois(lang: str, deleted_ids: list[str]) -> None:
     """pois_{lang}.json에서 삭제된 POI를 제거하고 재저장한다."""
     pois = _load_pois(lang)
     if not pois:
         return
 
-    deleted_set = set(deleted_ids)
-    filtered = [p for p in pois if p["id"] not in deleted_set]
-    removed_count = len(pois) - len(filtered)
+    removed_count = pois.remove_ids(deleted_ids)
 
     if removed_count > 0:
-        path = OUTPUT_DIR / f"pois_{lang}.json"
-        path.write_text(
-            json.dumps(filtered, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
-        print(f"[{lang}] pois_{lang}.json에서 {removed_count}건 삭제 → 남은 {len(filtered)}건")
+        _write_poi_array(OUTPUT_DIR / f"pois_{lang}.json", pois)
+        print(f"[{lang}] pois_{lang}.json에서 {removed_count}건 삭제 → 남은 {len(pois)}건")
 
 
 def _save_deleted_log(lang: str, deleted_pois: list[dict]) -> None:
@@ -275,13 +556,19 @@ async def fetch_detail_update(
     region: str | None = None,
     limit: int = DETAIL_UPDATE_MAX_POIS,
     force: bool = False,
+    dry_run: bool = False,
+    full_refresh: bool = False,
 ) -> tuple[dict[str, list[dict]], dict[str, list[str]]]:
     """POI 상세 정보를 수신하여 기존 POI에 병합한다.
 
+    처리 대상은 우선순위 스케줄러(_schedule_pending_pois)가 점수 순으로 선정한다.
+
     Args:
         region: 지역 slug 필터 (None이면 전체)
         limit: 각 언어당 최대 처리 건수
-        force: 완료된 POI도 재수신
+        force: 완료된 POI도 재수신 (원본 modifiedtime이 그대로인 POI는 제외)
+        dry_run: True이면 API 호출 없이 선택될 POI만 출력
+        full_refresh: modifiedtime 변경 감지 게이트를 무시하고 완료된 POI도 재수신
 
     Returns:
         (result, deleted_ids)
@@ -302,38 +589,30 @@ async def fetch_detail_update(
                 print(f"[{lang}] pois_{lang}.json 파일 없음, 건너뜀")
                 continue
 
-            existing_details = _load_details(lang)
-
-            # 기존 데이터 백필: detailUpdatedAt이 있지만 플래그가 누락된 항목 보정
-            for d in existing_details:
-                if d.get("detailUpdatedAt"):
-                    if "detailImageUpdated" not in d:
-                        d["detailImageUpdated"] = True
-                    if lang == "kr" and "detailPetUpdated" not in d:
-                        d["detailPetUpdated"] = True
-
-            # 기존 업데이트 결과를 딕셔너리로 변환 (빠른 조회용)
-            details_map = {d["id"]: d for d in existing_details}
+            # 기존 업데이트 결과 (id로 조회/교체/삭제하는 열 기반 테이블)
+            details = _load_detail_table(lang)
 
             # 지역 필터 적용한 전체 대상 수 (진행 상황 표시용)
             if region:
-                total_target = len(
-                    [p for p in all_pois if p.get("region") == region]
-                )
+                total_target = sum(1 for p in all_pois if p.get("region") == region)
             else:
                 total_target = len(all_pois)
 
-            done_count = len(
-                [d for d in existing_details if d.get("detailUpdatedAt")]
-            )
+            done_count = sum(1 for d in details if d.get("detailUpdatedAt"))
 
-            # 미처리 POI 필터링
-            pending = _filter_pending_pois(
-                all_pois, existing_details, region, limit, lang, force
+            # 미처리 POI 우선순위 스케줄링 — 처리 대상만 dict로 바꾼다
+            scheduled = _schedule_pending_pois(
+                all_pois, details, region, limit, lang, force, full_refresh
             )
+            pending = [poi.to_dict() for _, _, poi in scheduled]
 
             _print_progress(lang, total_target, done_count, len(pending))
 
+            if dry_run:
+                _print_schedule(lang, scheduled)
+                result[lang] = []
+                continue
+
             if not pending:
                 print(f"[{lang}] 모든 POI가 이미 업데이트 완료됨")
                 result[lang] = []
@@ -343,6 +622,29 @@ async def fetch_detail_update(
             newly_updated = []  # 새로 업데이트한 POI만 추적
             deleted_ids: list[str] = []
             deleted_pois: list[dict] = []
+            # 병합 대기 (응답 판정까지만 하고 병합은 DETAIL_MERGE_BATCH_SIZE건씩 이벤트 루프 밖에서)
+            batch: list[DetailMerge] = []
+            batch_ids: set[str] = set()
+
+            async def flush_batch() -> None:
+                nonlocal success_count
+                if not batch:
+                    return
+                merged = await merge_details_async(batch, in_place=True)
+                batch.clear()
+                batch_ids.clear()
+                for updated_poi in merged:
+                    updated_poi = _finish_merged(lang, updated_poi)
+                    details.upsert(updated_poi)
+                    newly_updated.append(updated_poi)
+                    success_count += 1
+
+                    # 중간 저장 (checkpoint)
+                    if success_count % CHECKPOINT_INTERVAL == 0:
+                        _save_details(lang, details)
+                        print(
+                            f"    [체크포인트] {success_count}건 중간 저장 완료"
+                        )
 
             for idx, poi in enumerate(pending, 1):
                 print(
@@ -351,57 +653,43 @@ async def fetch_detail_update(
                 )
 
                 await asyncio.sleep(REQUEST_DELAY)
-                common, intro_items, info_items, image_items, pet_item, had_exception = (
-                    await fetch_detail_for_poi(client, lang, poi)
-                )
+                try:
+                    results = await fetch_detail_for_poi(client, lang, poi)
+                except QuotaExhaustedError as e:
+                    # 할당량 소진 — 지금까지의 결과만 저장하고 다음 언어로 진행
+                    print(f"    → 중단: {e}")
+                    break
 
-                # 모든 API 응답이 없는 경우
-                all_none = (
-                    common is None
-                    and intro_items is None
-                    and info_items is None
-                    and image_items is None
-                    and pet_item is None
-                )
-
-                if all_none:
-                    if had_exception:
-                        # 네트워크/HTTP 오류로 실패 — 스킵 (삭제 안함)
-                        print(f"    → 스킵 (API 호출 오류)")
-                    else:
-                        # 정상 응답이지만 모든 API에서 데이터 없음 — 삭제된 POI
-                        print(f"    → 삭제 후보 (모든 API 응답 비어있음)")
-                        deleted_ids.append(poi["id"])
-                        deleted_pois.append(poi)
-                    continue
+                # 같은 id가 다시 나오면 앞 건의 병합 결과를 기준으로 삼도록 먼저 병합한다
+                if poi["id"] in batch_ids:
+                    await flush_batch()
 
-                # 병합
                 # 기존 상세 데이터가 있으면 그것을 기반으로 병합 (--force 재수신 시 기존 데이터 보존)
-                base_poi = details_map.get(poi["id"], poi)
-                updated_poi = merge_detail_to_poi(
-                    base_poi, common, intro_items, info_items, image_items, pet_item
+                # (to_dict()/pending 항목은 이 루프가 소유한 dict이므로 복사 없이 병합)
+                base = details.get(poi["id"])
+                status, entry = _detail_merge_entry(
+                    poi, base.to_dict() if base is not None else poi, results
                 )
-                # kr에서 pet API를 호출했지만 결과가 없는 경우에도 완료 플래그 설정
-                if lang == "kr" and "detailPetUpdated" not in updated_poi:
-                    updated_poi["detailPetUpdated"] = True
-                details_map[updated_poi["id"]] = updated_poi
-                newly_updated.append(updated_poi)
-                success_count += 1
-
-                # 중간 저장 (checkpoint)
-                if success_count % CHECKPOINT_INTERVAL == 0:
-                    checkpoint_list = list(details_map.values())
-                    _save_details(lang, checkpoint_list)
-                    print(
-                        f"    [체크포인트] {success_count}건 중간 저장 완료"
-                    )
+                if status == "skipped":
+                    continue
+                if status == "deleted":
+                    deleted_ids.append(poi["id"])
+                    deleted_pois.append(poi)
+                    continue
+
+                batch.append(entry)
+                batch_ids.add(poi["id"])
+                if len(batch) >= DETAIL_MERGE_BATCH_SIZE:
+                    await flush_batch()
+
+            await flush_batch()
 
             # 삭제된 POI 정리
             if deleted_ids:
                 print(f"[{lang}] 삭제된 POI {len(deleted_ids)}건 정리 중...")
-                # details_map에서 삭제 ID 제거
+                # 상세 테이블에서 삭제 ID 제거
                 for did in deleted_ids:
-                    details_map.pop(did, None)
+                    details.discard(did)
                 # pois_{lang}.json에서 삭제
                 _remove_deleted_pois(lang, deleted_ids)
                 # 삭제 로그 기록
@@ -409,12 +697,11 @@ async def fetch_detail_update(
                 deleted_result[lang] = deleted_ids
 
             # 최종 저장
-            final_list = list(details_map.values())
-            path = _save_details(lang, final_list)
+            path = _save_details(lang, details)
             result[lang] = newly_updated  # 새로 업데이트한 POI만 반환
             print(
                 f"[{lang}] 완료: {success_count}건 업데이트, "
-                f"총 {len(final_list)}건 저장 → {path}"
+                f"총 {len(details)}건 저장 → {path}"
             )
             if deleted_ids:
                 print(f"[{lang}] 삭제: {len(deleted_ids)}건")
@@ -0,0 +1,286 @@
+"""Step 3 멀티 워커: 샤드 lease 기반 POI 상세 업데이트 + 워커별 journal 병합.
+
+여러 워커(프로세스/호스트)가 같은 미처리 POI 집합을 샤드 단위로 나눠 처리한다.
+
+- 샤드: contentId 해시(h00~h63) 또는 지역 slug
+- lease: SQLite(output/leases.sqlite) 또는 MongoDB(detail_leases) — src/storage/leases.py
+- journal: 워커별 output/journals/{run_id}/detail_{lang}_{worker_id}.jsonl (POI 1건마다 append)
+- 병합: merge_detail_journals()가 journal을 pois_details_{lang}.json에 반영
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import socket
+import time
+from pathlib import Path
+
+from src.client import QuotaExhaustedError, create_client
+from src.config import DETAIL_LEASE_TTL, DETAIL_SHARD_COUNT, DETAIL_UPDATE_MAX_POIS, REQUEST_DELAY
+from src.fetchers.detail_update import (
+    OUTPUT_DIR,
+    _load_detail_table,
+    _load_pois,
+    _open_detail_table,
+    _merge_detail_result,
+    _remove_deleted_pois,
+    _save_deleted_log,
+    _save_details,
+    _schedule_pending_pois,
+    fetch_detail_for_poi,
+)
+
+JOURNAL_DIR = OUTPUT_DIR / "journals"
+
+
+def shard_of(poi: dict, shard_by: str = "hash", shard_count: int = DETAIL_SHARD_COUNT) -> str:
+    """POI가 속한 샤드 이름을 반환한다.
+
+    hash: contentId의 md5 기반 (프로세스/호스트와 무관하게 동일한 결과)
+    region: 지역 slug (지역 정보가 없으면 "_none")
+    """
+    if shard_by == "region":
+        return poi.get("region") or "_none"
+    digest = hashlib.md5(poi["id"].encode("utf-8")).digest()
+    return f"h{int.from_bytes(digest[:4], 'big') % shard_count:02d}"
+
+
+def _group_by_shard(
+    scheduled: list[tuple[float, str, dict]], shard_by: str
+) -> dict[str, list[tuple[float, str, dict]]]:
+    """스케줄 결과를 샤드별로 묶는다 (샤드 내 우선순위 순서 유지)."""
+    shards: dict[str, list[tuple[float, str, dict]]] = {}
+    for entry in scheduled:
+        shards.setdefault(shard_of(entry[2], shard_by), []).append(entry)
+    return shards
+
+
+def _safe_name(value: str) -> str:
+    """파일명에 사용할 수 없는 문자를 치환한다."""
+    return re.sub(r"[^\w.-]", "_", value)
+
+
+def _journal_path(run_id: str, lang: str, worker_id: str) -> Path:
+    return JOURNAL_DIR / _safe_name(run_id) / f"detail_{lang}_{_safe_name(worker_id)}.jsonl"
+
+
+async def run_detail_worker(
+    worker_id: str,
+    run_id: str,
+    region: str | None = None,
+    limit: int = DETAIL_UPDATE_MAX_POIS,
+    force: bool = False,
+    shard_by: str = "hash",
+    full_refresh: bool = False,
+) -> dict[str, int]:
+    """샤드 lease를 점유하며 POI 상세 정보를 수신하고 결과를 journal에 기록한다.
+
+    pois_details_{lang}.json은 직접 수정하지 않는다 (merge_detail_journals()에서 병합).
+    샤드의 처리 대상 contentId 목록은 샤드를 처음 만들 때 lease 저장소에 고정하고,
+    lease가 만료된 샤드는 그 목록의 progress 위치부터 이어받는다.
+    고정 목록 중 지금은 미처리 대상이 아닌 POI(이미 병합된 POI 등)는 수신하지 않고 건너뛴다.
+
+    Args:
+        worker_id: 워커 식별자 (journal 파일명에 사용)
+        run_id: 실행 식별자 — 같은 run_id의 워커끼리 샤드를 나눠 갖는다
+        region: 지역 slug 필터 (None이면 전체)
+        limit: 이 워커의 언어당 최대 처리 건수
+        force: 완료된 POI도 재수신
+        shard_by: 샤드 기준 ("hash" | "region")
+        full_refresh: modifiedtime 변경 감지 게이트 무시
+
+    Returns:
+        언어별 처리 건수 {"kr": N, "en": N}
+    """
+    from src.storage.leases import create_lease_store
+
+    owner = f"{worker_id}@{socket.gethostname()}:{os.getpid()}"
+    store = create_lease_store()
+    stats: dict[str, int] = {}
+
+    print("=" * 50)
+    print(f"[워커 {worker_id}] POI 상세 업데이트 (run={run_id}, 샤드 기준={shard_by}, 제한={limit}건)")
+    print("=" * 50)
+
+    try:
+        async with create_client() as client:
+            for lang in ("kr", "en"):
+                all_pois = _load_pois(lang)
+                if not all_pois:
+                    print(f"[워커 {worker_id}][{lang}] pois_{lang}.json 파일 없음, 건너뜀")
+                    continue
+
+                details = _load_detail_table(lang)
+
+                # 전체 미처리 POI를 우선순위 순으로 정렬 후 샤드별로 분배 (행 뷰 그대로)
+                scheduled = _schedule_pending_pois(
+                    all_pois, details, region, len(all_pois), lang, force, full_refresh
+                )
+                pending = {entry[2]["id"]: entry for entry in scheduled}
+                shards = _group_by_shard(scheduled, shard_by)
+                # 샤드가 이미 있으면(같은 run_id 재실행/다른 워커) 처음 고정한 목록을 유지한다
+                store.ensure_shards(
+                    run_id,
+                    lang,
+                    {
+                        shard: (entries[0][0], [entry[2]["id"] for entry in entries])
+                        for shard, entries in shards.items()
+                    },
+                )
+
+                journal_path = _journal_path(run_id, lang, worker_id)
+                journal_path.parent.mkdir(parents=True, exist_ok=True)
+                budget = limit
+                processed = 0
+                quota_exhausted = False
+
+                with journal_path.open("a", encoding="utf-8") as journal:
+                    while budget > 0 and not quota_exhausted:
+                        claimed = store.claim(run_id, lang, owner, DETAIL_LEASE_TTL)
+                        if claimed is None:
+                            break
+                        shard, progress, shard_ids = claimed
+                        print(
+                            f"[워커 {worker_id}][{lang}] 샤드 {shard} 점유 "
+                            f"({progress}/{len(shard_ids)}건 완료 상태에서 시작)"
+                        )
+
+                        idx = progress
+                        lease_lost = False
+                        while idx < len(shard_ids) and budget > 0:
+                            entry = pending.get(shard_ids[idx])
+                            if entry is None:
+                                # 샤드 생성 이후 처리 완료(병합)되었거나 대상에서 빠진 POI
+                                idx += 1
+                                continue
+                            # 처리 직전에만 dict로 바꾼다 (journal 기록/병합 대상)
+                            poi = entry[2].to_dict()
+                            print(
+                                f"  [워커 {worker_id}][{lang}][{shard}] ({idx + 1}/{len(shard_ids)}) "
+                                f"contentId={poi['id']} — {poi.get('name', '')}"
+                            )
+                            await asyncio.sleep(REQUEST_DELAY)
+                            try:
+                                results = await fetch_detail_for_poi(client, lang, poi)
+                            except QuotaExhaustedError as e:
+                                print(f"    → 중단: {e}")
+                                quota_exhausted = True
+                                break
+
+                            # 병합(CPU 작업)은 이벤트 루프 밖 스레드에서
+                            base = details.get(poi["id"])
+                            status, updated_poi = await asyncio.to_thread(
+                                _merge_detail_result,
+                                lang, poi, base.to_dict() if base is not None else poi, results,
+                            )
+                            if status != "skipped":
+                                record = {
+                                    "op": "update" if status == "updated" else "delete",
+                                    "ts": time.time(),
+                                    "worker": worker_id,
+                                    "poi": updated_poi,
+                                }
+                                journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+                                journal.flush()
+
+                            idx += 1
+                            budget -= 1
+                            processed += 1
+                            if not store.renew(run_id, lang, shard, owner, DETAIL_LEASE_TTL, idx):
+                                print(f"[워커 {worker_id}][{lang}] 샤드 {shard} lease 상실, 다음 샤드로 이동")
+                                lease_lost = True
+                                break
+
+                        if lease_lost:
+                            continue
+                        if idx >= len(shard_ids):
+                            store.complete(run_id, lang, shard, owner, idx)
+                        else:
+                            store.release(run_id, lang, shard, owner, idx)
+
+                stats[lang] = processed
+                shard_status = store.status(run_id, lang)
+                print(
+                    f"[워커 {worker_id}][{lang}] 처리 {processed}건 → {journal_path} "
+                    f"(샤드 완료 {shard_status['done']}/{shard_status['total']})"
+                )
+    finally:
+        store.close()
+
+    return stats
+
+
+def merge_detail_journals(
+    run_id: str | None = None,
+) -> tuple[dict[str, list[dict]], dict[str, list[str]]]:
+    """워커 journal을 pois_details_{lang}.json에 병합한다.
+
+    journal 레코드는 기록 시각(ts) 순으로 적용하며, 병합이 끝난 journal 파일은
+    .merged 확장자로 변경하여 재병합을 방지한다.
+
+    Args:
+        run_id: 병합할 실행 식별자 (None이면 미병합 journal 전체)
+
+    Returns:
+        (result, deleted_ids) — fetch_detail_update()와 동일한 구조
+    """
+    result: dict[str, list[dict]] = {}
+    deleted_result: dict[str, list[str]] = {"kr": [], "en": []}
+
+    run_dirs = (
+        [JOURNAL_DIR / _safe_name(run_id)]
+        if run_id
+        else sorted(p for p in JOURNAL_DIR.glob("*") if p.is_dir())
+    )
+
+    for lang in ("kr", "en"):
+        journal_files = [
+            path for run_dir in run_dirs for path in sorted(run_dir.glob(f"detail_{lang}_*.jsonl"))
+        ]
+        if not journal_files:
+            continue
+
+        records = []
+        for path in journal_files:
+            with path.open(encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        records.append(json.loads(line))
+        records.sort(key=lambda r: r["ts"])
+
+        details = _open_detail_table(lang)
+        updated: dict[str, dict] = {}
+        deleted: dict[str, dict] = {}
+
+        for record in records:
+            poi = record["poi"]
+            if record["op"] == "update":
+                details.upsert(poi)
+                updated[poi["id"]] = poi
+                deleted.pop(poi["id"], None)
+            else:
+                details.discard(poi["id"])
+                updated.pop(poi["id"], None)
+                deleted[poi["id"]] = poi
+
+        if deleted:
+            deleted_ids = list(deleted)
+            print(f"[{lang}] 삭제된 POI {len(deleted_ids)}건 정리 중...")
+            _remove_deleted_pois(lang, deleted_ids)
+            _save_deleted_log(lang, list(deleted.values()))
+            deleted_result[lang] = deleted_ids
+
+        path = _save_details(lang, details)
+        result[lang] = list(updated.values())
+        print(
+            f"[{lang}] journal {len(journal_files)}개 병합: {len(updated)}건 업데이트, "
+            f"{len(deleted)}건 삭제, 총 {len(details)}건 저장 → {path}"
+        )
+
+        for journal in journal_files:
+            journal.rename(journal.with_suffix(".merged"))
+
+    return result, deleted_result
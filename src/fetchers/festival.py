@@ -1,149 +1,188 @@
 """행사정보조회 (searchFestival2 기반)."""
 
 import asyncio
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
 from src.client import create_client, fetch_all_pages
 from src.config import ENDPOINTS, REQUEST_DELAY
-from src.fetchers.detail_update import fetch_detail_for_poi
-from src.transformers.pois import (
-    EXCLUDE_LCLS3_EN,
-    EXCLUDE_LCLS3_KR,
-    build_category_map,
-    transform_item,
-)
+from src.fetchers.detail_update import _detail_is_current, fetch_detail_for_poi
+from src.models import FestivalItem
+from src.storage.festival_cache import load_festival_cache, save_festival_cache
+from src.transformers.pois import TransformPlan, _format_date, build_category_map
 from src.transformers.pois_detail import merge_detail_to_poi
 
 
+def festival_window(
+    event_start_date: str | None = None, event_end_date: str | None = None
+) -> tuple[str, str]:
+    """행사 조회 기간 (YYYYMMDD)을 반환한다. 기본값: 2일 전 ~ 30일 후"""
+    today = date.today()
+    if event_start_date is None:
+        event_start_date = (today - timedelta(days=2)).strftime("%Y%m%d")
+    if event_end_date is None:
+        event_end_date = (today + timedelta(days=30)).strftime("%Y%m%d")
+    return event_start_date, event_end_date
+
+
+def _apply_event_dates(poi: dict, item: FestivalItem) -> dict:
+    """상세(intro)에 행사 기간이 없으면 searchFestival2 항목의 기간으로 보완한다."""
+    if not poi.get("eventStartDate"):
+        start, end = _format_date(item.eventstartdate), _format_date(item.eventenddate)
+        if start and end:
+            poi["eventStartDate"] = start
+            poi["eventEndDate"] = end
+    return poi
+
+
 async def fetch_festival(
     event_start_date: str | None = None,
     event_end_date: str | None = None,
-) -> tuple[dict[str, list[dict]], list[dict]]:
+    full_refresh: bool = False,
+) -> dict[str, list[dict]]:
     """행사/축제 정보를 수신하고 변환 + 상세 병합을 수행한다.
 
+    원본 modifiedtime이 그대로인 행사는 output/festival_cache.json의 병합 결과를
+    재사용하여 상세 API를 호출하지 않는다 (DETAIL_FULL_REFRESH_DAYS 경과 시 재수신).
+
     Args:
         event_start_date: 행사 시작일 (YYYYMMDD). 기본값: 2일 전
         event_end_date: 행사 종료일 (YYYYMMDD). 기본값: 30일 후
+        full_refresh: 행사 상세 캐시를 무시하고 전체 상세 재수신
 
     Returns:
-        (festival_result, summaries)
-        - festival_result: {"kr": [완성된 POI 목록], "en": [...]}
-        - summaries: [{"contentId", "name", "region", "action", "lang", "syncDate"}]
+        {"kr": [완성된 POI 목록], "en": [...]}
+        - 목록 수신에 실패한 언어는 키가 없다 (MongoDB 반영 시 기존 EV 문서 유지)
+        - 감사 요약은 MongoDB 반영 시 실제 변경분만 생성한다 (replace_event_pois_in_mongodb)
     """
     # 날짜 기본값 계산
-    today = date.today()
-    if event_start_date is None:
-        event_start_date = (today - timedelta(days=2)).strftime("%Y%m%d")
-    if event_end_date is None:
-        event_end_date = (today + timedelta(days=30)).strftime("%Y%m%d")
+    event_start_date, event_end_date = festival_window(event_start_date, event_end_date)
 
     category_map = build_category_map()
-    sync_date = datetime.now().isoformat(timespec="seconds")
+    cache = load_festival_cache()
 
-    festival_result: dict[str, list[dict]] = {"kr": [], "en": []}
-    summaries: list[dict] = []
+    festival_result: dict[str, list[dict]] = {}
 
     print("=" * 50)
     print(f"행사정보조회 (eventStartDate={event_start_date}, eventEndDate={event_end_date})")
     print("=" * 50)
 
-    async with create_client() as client:
-        for lang in ("kr", "en"):
-            lang_key = "ko" if lang == "kr" else "en"
-            endpoint = ENDPOINTS["search_festival"][lang]
-
-            # 1. searchFestival2 전체 페이지 수신 (최대 5회 재시도)
-            print(f"\n[{lang}] searchFestival2 수신 중...")
-            max_retries = 5
-            items = None
-            for attempt in range(1, max_retries + 1):
-                try:
-                    print(f"[{lang}] API 호출 시도 {attempt}/{max_retries}...")
-                    items = await fetch_all_pages(
-                        client, endpoint, {
-                            "eventStartDate": event_start_date,
-                            "eventEndDate": event_end_date,
-                        }
+    try:
+        async with create_client() as client:
+            for lang in ("kr", "en"):
+                plan = TransformPlan(lang, category_map)
+                endpoint = ENDPOINTS["search_festival"][lang]
+
+                # 1. searchFestival2 전체 페이지 수신 (최대 5회 재시도)
+                print(f"\n[{lang}] searchFestival2 수신 중...")
+                max_retries = 5
+                items = None
+                for attempt in range(1, max_retries + 1):
+                    try:
+                        print(f"[{lang}] API 호출 시도 {attempt}/{max_retries}...")
+                        items = await fetch_all_pages(
+                            client, endpoint, {
+                                "eventStartDate": event_start_date,
+                                "eventEndDate": event_end_date,
+                            },
+                            model=FestivalItem,
+                        )
+                        break
+                    except Exception as e:
+                        print(f"[{lang}] API 호출 실패 (시도 {attempt}/{max_retries}): {e}")
+                        if attempt < max_retries:
+                            print(f"[{lang}] 5초 후 재시도...")
+                            await asyncio.sleep(5)
+
+                if items is None:
+                    print(f"[{lang}] {max_retries}회 시도 모두 실패, 스킵합니다.")
+                    continue
+
+                festival_result[lang] = []
+                if not items:
+                    print(f"[{lang}] 행사 정보 없음")
+                    continue
+
+                print(f"[{lang}] 수신 완료: {len(items)}건")
+
+                # 2. 제외 카테고리 필터링
+                filtered_items = [item for item in items if not plan.is_excluded(item)]
+                excluded_count = len(items) - len(filtered_items)
+                if excluded_count > 0:
+                    from collections import Counter
+                    excluded_dist = Counter(
+                        item.lclsSystm3
+                        for item in items
+                        if plan.is_excluded(item)
+                    )
+                    top_codes = ", ".join(f"{c}({n}건)" for c, n in excluded_dist.most_common(5))
+                    print(f"[{lang}] 제외 카테고리 필터링: {excluded_count}건 제외 (주요: {top_codes})")
+
+                if not filtered_items:
+                    print(f"[{lang}] 필터링 후 행사 대상 없음")
+                    continue
+
+                # 3. 변환 + 상세 수신 (캐시 적중 시 생략)
+                festival_pois: list[dict] = []
+                lang_cache = cache.setdefault(lang, {})
+                cache_hits = 0
+                for idx, item in enumerate(filtered_items, 1):
+                    content_id = item.contentid
+                    title = item.title
+                    print(f"  [{lang}] ({idx}/{len(filtered_items)}) contentId={content_id} — {title}")
+
+                    # TransformPlan으로 POI 변환
+                    poi = plan.transform(item)
+
+                    # 원본 modifiedtime이 같은 캐시 항목이 있으면 상세 호출 생략
+                    entry = lang_cache.get(content_id)
+                    if entry and _detail_is_current(poi, entry["poi"], full_refresh):
+                        entry["eventEndDate"] = item.eventenddate
+                        festival_pois.append(_apply_event_dates(entry["poi"], item))
+                        cache_hits += 1
+                        continue
+
+                    # 상세 API 호출
+                    await asyncio.sleep(REQUEST_DELAY)
+                    common, intro_items, info_items, image_items, pet_item, had_exception = (
+                        await fetch_detail_for_poi(client, lang, poi, save_raw_data=False)
                     )
-                    break
-                except Exception as e:
-                    print(f"[{lang}] API 호출 실패 (시도 {attempt}/{max_retries}): {e}")
-                    if attempt < max_retries:
-                        print(f"[{lang}] 5초 후 재시도...")
-                        await asyncio.sleep(5)
-
-            if items is None:
-                print(f"[{lang}] {max_retries}회 시도 모두 실패, 스킵합니다.")
-                continue
-
-            if not items:
-                print(f"[{lang}] 행사 정보 없음")
-                continue
-
-            print(f"[{lang}] 수신 완료: {len(items)}건")
-
-            # 2. 제외 카테고리 필터링
-            exclude_codes = EXCLUDE_LCLS3_KR if lang == "kr" else EXCLUDE_LCLS3_EN
-            filtered_items = [
-                item for item in items
-                if item.get("lclsSystm3", "") not in exclude_codes
-            ]
-            excluded_count = len(items) - len(filtered_items)
-            if excluded_count > 0:
-                from collections import Counter
-                excluded_dist = Counter(
-                    item.get("lclsSystm3", "")
-                    for item in items
-                    if item.get("lclsSystm3", "") in exclude_codes
-                )
-                top_codes = ", ".join(f"{c}({n}건)" for c, n in excluded_dist.most_common(5))
-                print(f"[{lang}] 제외 카테고리 필터링: {excluded_count}건 제외 (주요: {top_codes})")
-
-            if not filtered_items:
-                print(f"[{lang}] 필터링 후 행사 대상 없음")
-                continue
-
-            # 3. 변환 + 상세 수신
-            festival_pois: list[dict] = []
-            for idx, item in enumerate(filtered_items, 1):
-                content_id = item.get("contentid", "")
-                title = item.get("title", "")
-                print(f"  [{lang}] ({idx}/{len(filtered_items)}) contentId={content_id} — {title}")
-
-                # transform_item으로 POI 변환
-                poi = transform_item(item, lang_key, category_map)
-
-                # 상세 API 호출
-                await asyncio.sleep(REQUEST_DELAY)
-                common, intro_items, info_items, image_items, pet_item, had_exception = (
-                    await fetch_detail_for_poi(client, lang, poi, save_raw_data=False)
-                )
-
-                # 상세 병합
-                updated_poi = merge_detail_to_poi(
-                    poi, common, intro_items, info_items, image_items, pet_item
-                )
-                # kr에서 pet API 호출 후 플래그 미설정 시 보정
-                if lang == "kr" and "detailPetUpdated" not in updated_poi:
-                    updated_poi["detailPetUpdated"] = True
 
-                festival_pois.append(updated_poi)
+                    # 상세 병합
+                    updated_poi = merge_detail_to_poi(
+                        poi, common, intro_items, info_items, image_items, pet_item
+                    )
+                    # kr에서 pet API 호출 후 플래그 미설정 시 보정
+                    if lang == "kr" and "detailPetUpdated" not in updated_poi:
+                        updated_poi["detailPetUpdated"] = True
+                    _apply_event_dates(updated_poi, item)
+
+                    festival_pois.append(updated_poi)
+
+                    # 상세 API 일부 실패 결과는 캐시하지 않음 (다음 실행에서 재수신)
+                    if had_exception:
+                        lang_cache.pop(content_id, None)
+                    else:
+                        lang_cache[content_id] = {
+                            "modifiedtime": updated_poi.get("detailModifiedTime", ""),
+                            "eventEndDate": item.eventenddate,
+                            "poi": updated_poi,
+                        }
 
-                # 요약 기록 생성
-                summaries.append({
-                    "contentId": content_id,
-                    "name": title,
-                    "region": poi.get("region", ""),
-                    "action": "festival_updated",
-                    "lang": lang,
-                    "syncDate": sync_date,
-                })
+                festival_result[lang] = festival_pois
+                print(
+                    f"[{lang}] 행사정보 완료: {len(festival_pois)}건 "
+                    f"(캐시 재사용 {cache_hits}건, 상세 수신 {len(festival_pois) - cache_hits}건)"
+                )
 
-            festival_result[lang] = festival_pois
-            print(f"[{lang}] 행사정보 완료: {len(festival_pois)}건")
+    finally:
+        # 할당량 소진 등으로 중단되어도 수신한 상세는 다음 실행에서 재사용
+        save_festival_cache(cache)
 
     print("=" * 50)
-    print(f"행사정보조회 완료 — kr={len(festival_result['kr'])}건, en={len(festival_result['en'])}건")
+    print(
+        f"행사정보조회 완료 — kr={len(festival_result.get('kr', []))}건, "
+        f"en={len(festival_result.get('en', []))}건"
+    )
     print("=" * 50)
 
-    return festival_result, summaries
+    return festival_result
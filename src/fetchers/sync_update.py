@@ -1,26 +1,45 @@
-"""관광정보 증분 동기화 (areaBasedSyncList2 기반)."""
+"""관광정보 증분 동기화 (areaBasedSyncList2 기반).
+
+언어별로 아래 3단계를 bounded queue로 연결하여 동시에 실행한다.
+
+    [목록 수신] areaBasedSyncList2 페이지 → item_queue
+    [변환/상세] showflag 분류 + 제외 필터 + 변경 감지 + 상세 API → write_queue (POI + 요약, 삭제 + 요약)
+    [저장]     SYNC_WRITE_BATCH_SIZE 단위 MongoDB upsert/삭제/요약 저장 + on_batch (asyncio.to_thread)
+
+MongoDB 쓰기 지연이 API 수신 시간과 겹치고, 메모리 사용량은 하루 변경량이 아닌 큐 길이로 제한된다.
+POI 문서와 동기화 요약은 배치로 반영한 뒤 버리며, 끝까지 남는 것은 삭제 contentId 목록뿐이다.
+
+워터마크(src/storage/watermark.py)가 주어지면 언어별로 워터마크 날짜부터 요청하고,
+이미 반영된 항목(워터마크 이전 수정시각, 또는 같은 시각에 반영된 contentId)은 건너뛴다.
+"""
 
 import asyncio
 import json
+import os
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-
-
-from src.client import create_client, fetch_all_pages
-from src.config import ENDPOINTS, REQUEST_DELAY
-from src.fetchers.detail_update import fetch_detail_for_poi
-from src.transformers.pois import (
-    EXCLUDE_LCLS3_EN,
-    EXCLUDE_LCLS3_KR,
-    build_category_map,
-    transform_item,
+from typing import NamedTuple
+
+from src.client import QuotaExhaustedError, create_client, iter_pages
+from src.config import (
+    ENDPOINTS,
+    REQUEST_DELAY,
+    SYNC_FLUSH_INTERVAL,
+    SYNC_QUEUE_SIZE,
+    SYNC_WRITE_BATCH_SIZE,
 )
-from src.transformers.pois_detail import merge_detail_to_poi
+from src.fetchers.detail_update import _detail_is_current, _load_details, fetch_detail_for_poi
+from src.models import AreaBasedSyncItem
+from src.transformers.pois import TransformPlan, build_category_map
+from src.transformers.pois_detail import DetailMerge, merge_details_async
 
 OUTPUT_DIR = Path(__file__).resolve().parent.parent.parent / "output"
 
 
-def _classify_by_showflag(items: list[dict]) -> tuple[list[dict], list[dict]]:
+def _classify_by_showflag(
+    items: list[AreaBasedSyncItem],
+) -> tuple[list[AreaBasedSyncItem], list[AreaBasedSyncItem]]:
     """showflag 값으로 업데이트/삭제 대상을 분류한다.
 
     Returns:
@@ -32,8 +51,7 @@ def _classify_by_showflag(items: list[dict]) -> tuple[list[dict], list[dict]]:
     delete_items = []
 
     for item in items:
-        showflag = str(item.get("showflag", "1"))
-        if showflag == "0":
+        if item.showflag == "0":
             delete_items.append(item)
         else:
             update_items.append(item)
@@ -64,24 +82,214 @@ def _remove_from_output(lang: str, delete_ids: set[str]) -> int:
     return removed
 
 
-async def fetch_sync_update(modifiedtime: str) -> tuple[dict, dict, list]:
-    """수정된 관광정보를 수신하고 변환/상세 업데이트를 수행한다.
+def _load_detail_versions(
+    lang: str,
+    ids: list[str],
+    writer=None,
+    local_details: dict[str, dict] | None = None,
+) -> dict[str, dict]:
+    """POI별 상세 수신 기준 정보(detailModifiedTime, detailUpdatedAt)를 로드한다.
+
+    MongoDB(writer 연결 또는 MONGODB_URI) 우선, 아니면 output/pois_details_{lang}.json 기준.
+    조회에 실패하면 로컬 파일로 대체한다 (게이트 미적용 = 상세 재수신).
+
+    Args:
+        local_details: 로컬 파일 기준 조회 시 재사용할 {id: 상세 문서} (None이면 파일 로드)
+    """
+    if writer is not None or os.environ.get("MONGODB_URI"):
+        from src.storage.mongodb import load_detail_versions
+
+        try:
+            if writer is not None:
+                return writer.detail_versions(lang, ids)
+            return load_detail_versions(lang, ids)
+        except Exception as e:
+            print(f"[{lang}] [경고] MongoDB 상세 수신 이력 조회 실패, 로컬 파일 사용: {e}")
+
+    if local_details is None:
+        local_details = {d["id"]: d for d in _load_details(lang)}
+    return {i: local_details[i] for i in ids if i in local_details}
+
+
+# 큐 종료 표시
+_DONE = object()
+
+
+class SyncBatch(NamedTuple):
+    """[저장] 단계가 한 번에 반영한 변경분 (on_batch 콜백 인자)."""
+
+    upserts: list[dict]  # 상세 병합된 POI
+    deleted_ids: list[str]  # showflag=0 contentId
+    summaries: list[dict]  # updated/deleted 요약 (수신 순서)
+
+
+def _already_applied(item: AreaBasedSyncItem, watermark: dict | None) -> bool:
+    """워터마크 기준으로 이미 MongoDB에 반영된 항목인지 판정한다."""
+    if not watermark:
+        return False
+    mt = item.modifiedtime
+    mark_mt = watermark.get("modifiedtime", "")
+    if not mt:
+        return False
+    if mt < mark_mt:
+        return True
+    return mt == mark_mt and item.contentid in watermark.get("ids", ())
+
+
+async def _produce_sync_pages(
+    client, lang: str, modifiedtime: str, item_queue: asyncio.Queue
+) -> int:
+    """[목록 수신] areaBasedSyncList2 페이지를 받아 항목 단위(AreaBasedSyncItem)로 item_queue에 넣는다.
+
+    페이지 수신 실패 시 마지막으로 받은 다음 페이지부터 최대 5회 재시도한다.
+
+    Returns:
+        수신 항목 수 (재시도 모두 실패 시 -1)
+    """
+    endpoint = ENDPOINTS["area_based_sync"][lang]
+    max_retries = 5
+    next_page = 1
+    received = 0
+
+    async def produce() -> int:
+        nonlocal next_page, received
+        for attempt in range(1, max_retries + 1):
+            try:
+                print(f"[{lang}] API 호출 시도 {attempt}/{max_retries} (page={next_page})...")
+                async for page_no, items in iter_pages(
+                    client, endpoint, {"modifiedtime": modifiedtime},
+                    start_page=next_page, model=AreaBasedSyncItem,
+                ):
+                    for item in items:
+                        await item_queue.put(item)
+                    received += len(items)
+                    next_page = page_no + 1
+                return received
+            except QuotaExhaustedError:
+                raise
+            except Exception as e:
+                print(f"[{lang}] API 호출 실패 (시도 {attempt}/{max_retries}): {e}")
+                if attempt < max_retries:
+                    print(f"[{lang}] {5}초 후 재시도...")
+                    await asyncio.sleep(5)
+        print(f"[{lang}] {max_retries}회 시도 모두 실패, 수신분({received}건)까지만 처리합니다.")
+        return -1
+
+    # 취소(CancelledError) 시에는 소비자가 없으므로 종료 표시를 넣지 않는다
+    try:
+        result = await produce()
+    except QuotaExhaustedError:
+        await item_queue.put(_DONE)
+        raise
+    await item_queue.put(_DONE)
+    return result
+
+
+async def _put_checked(queue: asyncio.Queue, entry, consumer: asyncio.Task) -> None:
+    """queue에 넣는다 — 소비 태스크가 먼저 (예외로) 끝나면 기다리지 않고 그 예외를 다시 발생시킨다."""
+    put = asyncio.ensure_future(queue.put(entry))
+    await asyncio.wait((put, consumer), return_when=asyncio.FIRST_COMPLETED)
+    if consumer.done():
+        put.cancel()
+        consumer.result()
+
+
+async def _write_sync_batches(
+    lang: str,
+    write_queue: asyncio.Queue,
+    writer,
+    on_batch: Callable[[str, SyncBatch], None] | None = None,
+) -> tuple[int, list[str]]:
+    """[저장] write_queue의 (POI, 요약) 항목을 배치로 모아 반영한다.
+
+    POI가 None인 항목은 삭제(요약의 contentId)이다.
+    배치마다 MongoDB upsert → 삭제 → 동기화 요약 저장 후 on_batch(lang, SyncBatch)를 호출한다.
+    SYNC_WRITE_BATCH_SIZE가 차거나 SYNC_FLUSH_INTERVAL초 동안 새 항목이 없으면 저장한다.
+    writer가 None이면(MongoDB 미설정) MongoDB 반영 없이 집계와 on_batch만 수행한다.
+
+    Returns:
+        (저장(집계)한 POI 수, 삭제 contentId 목록)
+    """
+    upserts: list[dict] = []
+    deletes: list[str] = []
+    summaries: list[dict] = []
+    written = 0
+    deleted_ids: list[str] = []
+
+    async def flush() -> None:
+        nonlocal upserts, deletes, summaries, written
+        if not summaries:
+            return
+        if writer is not None:
+            if upserts:
+                count = await asyncio.to_thread(writer.upsert, lang, upserts)
+                print(f"    [MongoDB] pois_{lang}: {len(upserts)}건 upsert ({count}건 반영)")
+            if deletes:
+                count = await asyncio.to_thread(writer.delete, lang, deletes)
+                print(f"    [MongoDB] pois_{lang}: {len(deletes)}건 삭제 ({count}건 반영)")
+            count = await asyncio.to_thread(writer.save_summaries, summaries)
+            print(f"    [MongoDB] updated_content: 동기화 요약 {count}건 저장")
+        if on_batch is not None:
+            await asyncio.to_thread(on_batch, lang, SyncBatch(upserts, deletes, summaries))
+        written += len(upserts)
+        deleted_ids.extend(deletes)
+        upserts, deletes, summaries = [], [], []
+
+    while True:
+        try:
+            entry = await asyncio.wait_for(write_queue.get(), timeout=SYNC_FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            await flush()
+            continue
+        if entry is _DONE:
+            await flush()
+            return written, deleted_ids
+        poi, summary = entry
+        if poi is None:
+            deletes.append(summary["contentId"])
+        else:
+            upserts.append(poi)
+        summaries.append(summary)
+        if len(summaries) >= SYNC_WRITE_BATCH_SIZE:
+            await flush()
+
+
+async def fetch_sync_update(
+    modifiedtime: str,
+    full_refresh: bool = False,
+    writer=None,
+    watermarks: dict[str, dict] | None = None,
+    on_batch: Callable[[str, SyncBatch], None] | None = None,
+) -> tuple[dict, dict, dict]:
+    """수정된 관광정보를 수신하고 변환/상세 업데이트 후 MongoDB에 스트리밍 저장한다.
+
+    원본 modifiedtime이 마지막 상세 수신 시점과 같은 POI는 이미 반영된 것으로 보고
+    상세 API 호출과 upsert를 생략한다 (full_refresh이면 게이트 무시).
 
     Args:
-        modifiedtime: YYYYMMDD 형식 문자열
+        modifiedtime: YYYYMMDD 형식 문자열 (워터마크가 없는 언어에 사용)
+        full_refresh: True이면 modifiedtime 변경 감지 게이트를 무시
+        writer: PoiUpsertWriter (None이면 MongoDB 저장 없이 수신/변환만 수행)
+        watermarks: 언어별 워터마크 — 있으면 워터마크 날짜부터 요청하고 이미 반영된 항목 제외
+        on_batch: [저장] 단계가 배치를 반영할 때마다 (lang, SyncBatch)로 호출 (스레드에서 실행)
+            — 요약: [{"contentId", "name", "region", "action", "lang", "syncDate"}]
+            (updated는 category, appCategory, coordinates 포함 — 타일/클러스터 증분 갱신용)
 
     Returns:
-        (upserted_result, deleted_result, summaries)
-        - upserted_result: {"kr": [완성된 POI 목록], "en": [...]}
+        (upserted_counts, deleted_result, next_watermarks)
+        - upserted_counts: {"kr": 업데이트 건수, "en": ...}
         - deleted_result: {"kr": [삭제 ID 목록], "en": [...]}
-        - summaries: [{"contentId", "name", "region", "action", "lang", "syncDate"}]
+        - next_watermarks: 끝까지 처리된 언어의 다음 워터마크 (MongoDB 반영 후 저장할 값)
     """
+    from collections import Counter
+
     category_map = build_category_map()
     sync_date = datetime.now().isoformat(timespec="seconds")
 
-    upserted_result: dict[str, list[dict]] = {"kr": [], "en": []}
+    upserted_counts: dict[str, int] = {"kr": 0, "en": 0}
     deleted_result: dict[str, list[str]] = {"kr": [], "en": []}
-    summaries: list[dict] = []
+    next_watermarks: dict[str, dict] = {}
+    watermarks = watermarks or {}
 
     print("=" * 50)
     print(f"관광정보 동기화 (modifiedtime={modifiedtime})")
@@ -89,127 +297,185 @@ async def fetch_sync_update(modifiedtime: str) -> tuple[dict, dict, list]:
 
     async with create_client() as client:
         for lang in ("kr", "en"):
-            lang_key = "ko" if lang == "kr" else "en"
-            endpoint = ENDPOINTS["area_based_sync"][lang]
-
-            # 1. areaBasedSyncList2 전체 페이지 수신 (최대 5회 재시도)
-            print(f"\n[{lang}] areaBasedSyncList2 수신 중 (modifiedtime={modifiedtime})...")
-            max_retries = 5
-            items = None
-            for attempt in range(1, max_retries + 1):
-                try:
-                    print(f"[{lang}] API 호출 시도 {attempt}/{max_retries}...")
-                    items = await fetch_all_pages(
-                        client, endpoint, {"modifiedtime": modifiedtime}
+            plan = TransformPlan(lang, category_map)
+            watermark = watermarks.get(lang)
+            lang_modifiedtime = watermark["modifiedtime"][:8] if watermark else modifiedtime
+            mark_label = f", 워터마크={watermark['modifiedtime']}" if watermark else ""
+            print(f"\n[{lang}] areaBasedSyncList2 수신 중 (modifiedtime={lang_modifiedtime}{mark_label})...")
+
+            item_queue: asyncio.Queue = asyncio.Queue(maxsize=SYNC_QUEUE_SIZE)
+            write_queue: asyncio.Queue = asyncio.Queue(maxsize=SYNC_QUEUE_SIZE)
+            producer = asyncio.create_task(
+                _produce_sync_pages(client, lang, lang_modifiedtime, item_queue)
+            )
+            consumer = asyncio.create_task(
+                _write_sync_batches(lang, write_queue, writer, on_batch)
+            )
+
+            excluded_dist: Counter = Counter()
+            unchanged_count = 0
+            applied_count = 0
+            processed = 0
+            stopped = False
+            # 다음 워터마크 후보: 수신한 항목 중 최대 수정시각과 그 시각의 contentId
+            max_mt = watermark["modifiedtime"] if watermark else ""
+            max_ids: set[str] = set(watermark.get("ids", [])) if watermark else set()
+            # 상세 API 호출 중 예외가 난 항목: 워터마크를 그 수정시각 이하로 묶어 다음 실행에서 재수신
+            failed_mt = ""
+            failed_ids: set[str] = set()
+            local_details: dict[str, dict] | None = None
+            if writer is None and not os.environ.get("MONGODB_URI"):
+                local_details = {d["id"]: d for d in _load_details(lang)}
+
+            try:
+                while True:
+                    # 큐에 쌓인 항목을 모아 변경 감지 기준 정보를 한 번에 조회
+                    item = await item_queue.get()
+                    if item is _DONE:
+                        break
+                    chunk = [item]
+                    while len(chunk) < SYNC_WRITE_BATCH_SIZE and not item_queue.empty():
+                        nxt = item_queue.get_nowait()
+                        if nxt is _DONE:
+                            item_queue.put_nowait(_DONE)
+                            break
+                        chunk.append(nxt)
+
+                    for it in chunk:
+                        mt = it.modifiedtime
+                        if mt > max_mt:
+                            max_mt, max_ids = mt, {it.contentid}
+                        elif mt and mt == max_mt:
+                            max_ids.add(it.contentid)
+
+                    # 워터마크 기준 이미 반영된 항목 제외
+                    fresh = [it for it in chunk if not _already_applied(it, watermark)]
+                    applied_count += len(chunk) - len(fresh)
+                    if not fresh:
+                        continue
+
+                    # showflag 분류 + 제외 카테고리 필터링
+                    update_items, chunk_deletes = _classify_by_showflag(fresh)
+                    for it in chunk_deletes:
+                        await _put_checked(write_queue, (None, {
+                            "contentId": it.contentid,
+                            "name": it.title,
+                            "region": "",
+                            "action": "deleted",
+                            "lang": lang,
+                            "syncDate": sync_date,
+                        }), consumer)
+                    filtered_items = []
+                    for it in update_items:
+                        if plan.is_excluded(it):
+                            excluded_dist[it.lclsSystm3] += 1
+                        else:
+                            filtered_items.append(it)
+                    if not filtered_items:
+                        continue
+
+                    # TransformPlan으로 POI 변환 + 변경 감지 게이트
+                    detail_versions = await asyncio.to_thread(
+                        _load_detail_versions,
+                        lang,
+                        [it.contentid for it in filtered_items],
+                        writer,
+                        local_details,
                     )
-                    break
-                except Exception as e:
-                    print(f"[{lang}] API 호출 실패 (시도 {attempt}/{max_retries}): {e}")
-                    if attempt < max_retries:
-                        print(f"[{lang}] {5}초 후 재시도...")
-                        await asyncio.sleep(5)
-
-            if items is None:
-                print(f"[{lang}] {max_retries}회 시도 모두 실패, 스킵합니다.")
-                continue
-
-            if not items:
+                    for it in filtered_items:
+                        poi = plan.transform(it)
+                        if _detail_is_current(poi, detail_versions.get(poi["id"]), full_refresh):
+                            unchanged_count += 1
+                            continue
+
+                        processed += 1
+                        content_id = it.contentid
+                        title = it.title
+                        print(f"  [{lang}] ({processed}) contentId={content_id} — {title}")
+
+                        # 상세 API 호출
+                        await asyncio.sleep(REQUEST_DELAY)
+                        common, intro_items, info_items, image_items, pet_item, had_exception = (
+                            await fetch_detail_for_poi(client, lang, poi, save_raw_data=False)
+                        )
+
+                        # 상세 병합 (이벤트 루프 밖 스레드 — 수신/저장 태스크를 막지 않는다)
+                        (updated_poi,) = await merge_details_async(
+                            [DetailMerge(poi, common, intro_items, info_items, image_items, pet_item)]
+                        )
+                        # kr에서 pet API 호출 후 플래그 미설정 시 보정
+                        if lang == "kr" and "detailPetUpdated" not in updated_poi:
+                            updated_poi["detailPetUpdated"] = True
+                        if had_exception:
+                            # 일부 상세 API 실패 — 수신분은 저장하되 최신으로 표시하지 않는다
+                            # (빈 값으로 덮어써 기존 detailModifiedTime도 무효화 → 변경 감지 게이트 통과)
+                            updated_poi["detailModifiedTime"] = ""
+                            failed_ids.add(content_id)
+                            if it.modifiedtime and (not failed_mt or it.modifiedtime < failed_mt):
+                                failed_mt = it.modifiedtime
+
+                        # 업데이트 요약과 함께 [저장] 단계로 전달
+                        # (분류/좌표는 상세 병합 결과 기준 — detailCommon2가 mapx/mapy를 보정할 수 있음)
+                        await _put_checked(write_queue, (updated_poi, {
+                            "contentId": content_id,
+                            "name": title,
+                            "region": updated_poi.get("region", ""),
+                            "category": updated_poi.get("category", ""),
+                            "appCategory": updated_poi.get("appCategory", ""),
+                            "coordinates": updated_poi.get("coordinates"),
+                            "action": "updated",
+                            "lang": lang,
+                            "syncDate": sync_date,
+                        }), consumer)
+            except QuotaExhaustedError as e:
+                # 할당량 소진 — 지금까지의 결과만 저장하고 다음 언어로 진행
+                print(f"[{lang}] 중단: {e}")
+                stopped = True
+            finally:
+                if not producer.done():
+                    producer.cancel()
+                if not consumer.done():
+                    await _put_checked(write_queue, _DONE, consumer)
+                # [저장] 단계의 예외(MongoDB/on_batch 실패)는 여기서 다시 발생 — 워터마크 미전진
+                written, delete_ids = await consumer
+                (received,) = await asyncio.gather(producer, return_exceptions=True)
+
+            if isinstance(received, QuotaExhaustedError):
+                print(f"[{lang}] 목록 수신 중단: {received}")
+            elif received == 0:
                 print(f"[{lang}] 수정된 항목 없음")
                 continue
 
-            print(f"[{lang}] 수신 완료: {len(items)}건")
-
-            # 2. showflag 분류
-            update_items, delete_items = _classify_by_showflag(items)
-            print(f"[{lang}] 업데이트: {len(update_items)}건, 삭제: {len(delete_items)}건")
-
-            # 3-a. 삭제 대상 처리
-            if delete_items:
-                delete_ids = [item.get("contentid", "") for item in delete_items]
+            # 목록 전체를 끝까지 처리한 경우에만 워터마크 전진 (중단 시 다음 실행에서 재처리)
+            if not stopped and isinstance(received, int) and received > 0 and max_mt:
+                if failed_mt:
+                    # 실패 항목의 수정시각까지만 전진 (그 시각의 실패 항목은 ids에서 제외)
+                    ids = max_ids - failed_ids if failed_mt == max_mt else set()
+                    next_watermarks[lang] = {"modifiedtime": failed_mt, "ids": sorted(ids)}
+                    print(f"[{lang}] 상세 수신 실패 {len(failed_ids)}건 — 워터마크를 {failed_mt}까지만 전진")
+                else:
+                    next_watermarks[lang] = {"modifiedtime": max_mt, "ids": sorted(max_ids)}
+
+            # 삭제 대상을 output 파일에서 제거 (MongoDB 삭제는 [저장] 단계에서 배치마다 반영)
+            if delete_ids:
                 deleted_result[lang] = delete_ids
-
-                # output 파일에서 제거
                 _remove_from_output(lang, set(delete_ids))
 
-                # 삭제 요약 기록
-                for item in delete_items:
-                    summaries.append({
-                        "contentId": item.get("contentid", ""),
-                        "name": item.get("title", ""),
-                        "region": "",
-                        "action": "deleted",
-                        "lang": lang,
-                        "syncDate": sync_date,
-                    })
-
-            # 3-b. 업데이트 대상 처리
-            if not update_items:
-                continue
-
-            # 제외 카테고리 필터링
-            exclude_codes = EXCLUDE_LCLS3_KR if lang == "kr" else EXCLUDE_LCLS3_EN
-            filtered_items = [
-                item for item in update_items
-                if item.get("lclsSystm3", "") not in exclude_codes
-            ]
-            excluded_count = len(update_items) - len(filtered_items)
-            if excluded_count > 0:
+            if excluded_dist:
                 # 제외된 카테고리 분포를 요약하여 출력
-                from collections import Counter
-                excluded_dist = Counter(
-                    item.get("lclsSystm3", "")
-                    for item in update_items
-                    if item.get("lclsSystm3", "") in exclude_codes
-                )
                 top_codes = ", ".join(f"{c}({n}건)" for c, n in excluded_dist.most_common(5))
-                print(f"[{lang}] 제외 카테고리 필터링: {excluded_count}건 제외 (주요: {top_codes})")
-
-            if not filtered_items:
-                print(f"[{lang}] 필터링 후 업데이트 대상 없음 (수신 {len(update_items)}건 전부 제외 카테고리)")
-                continue
+                print(f"[{lang}] 제외 카테고리 필터링: {sum(excluded_dist.values())}건 제외 (주요: {top_codes})")
+            if applied_count > 0:
+                print(f"[{lang}] 워터마크: 이미 반영된 {applied_count}건 제외")
+            if unchanged_count > 0:
+                print(f"[{lang}] 변경 감지: modifiedtime 동일 {unchanged_count}건 상세 수신 생략")
 
-            # 변환 + 상세 수신
-            updated_pois: list[dict] = []
-            for idx, item in enumerate(filtered_items, 1):
-                content_id = item.get("contentid", "")
-                title = item.get("title", "")
-                print(f"  [{lang}] ({idx}/{len(filtered_items)}) contentId={content_id} — {title}")
-
-                # transform_item으로 POI 변환
-                poi = transform_item(item, lang_key, category_map)
-
-                # 상세 API 호출
-                await asyncio.sleep(REQUEST_DELAY)
-                common, intro_items, info_items, image_items, pet_item, had_exception = (
-                    await fetch_detail_for_poi(client, lang, poi, save_raw_data=False)
-                )
-
-                # 상세 병합
-                updated_poi = merge_detail_to_poi(
-                    poi, common, intro_items, info_items, image_items, pet_item
-                )
-                # kr에서 pet API 호출 후 플래그 미설정 시 보정
-                if lang == "kr" and "detailPetUpdated" not in updated_poi:
-                    updated_poi["detailPetUpdated"] = True
-
-                updated_pois.append(updated_poi)
-
-                # 업데이트 요약 기록
-                summaries.append({
-                    "contentId": content_id,
-                    "name": title,
-                    "region": poi.get("region", ""),
-                    "action": "updated",
-                    "lang": lang,
-                    "syncDate": sync_date,
-                })
-
-            upserted_result[lang] = updated_pois
-            print(f"[{lang}] 업데이트 완료: {len(updated_pois)}건")
+            upserted_counts[lang] = written
+            print(f"[{lang}] 업데이트: {written}건, 삭제: {len(delete_ids)}건")
 
     print("=" * 50)
-    print(f"동기화 완료 — 업데이트: kr={len(upserted_result['kr'])}건, en={len(upserted_result['en'])}건 | "
+    print(f"동기화 완료 — 업데이트: kr={upserted_counts['kr']}건, en={upserted_counts['en']}건 | "
           f"삭제: kr={len(deleted_result['kr'])}건, en={len(deleted_result['en'])}건")
     print("=" * 50)
 
-    return upserted_result, deleted_result, summaries
+    return upserted_counts, deleted_result, next_watermarks
@@ -0,0 +1,259 @@
+"""로컬 테스트용 한국관광공사 API mock 서버.
+
+실제 API 할당량을 쓰지 않고 멀티 워커/키 교체/동기화 흐름을 검증하기 위한 서버로,
+areaBasedList2 / areaBasedSyncList2 / searchFestival2 / detail*2 엔드포인트를
+결정적(deterministic) 합성 데이터로 응답한다.
+
+실행:
+    uv run python -m src.mock_server --port 8765
+    DATA_GO_KR_API_BASE_URL=http://127.0.0.1:8765/B551011 uv run python main.py --step 3 --workers 3
+
+- contentId가 "99"로 끝나는 POI는 모든 상세 API가 빈 응답 (삭제 후보 시뮬레이션)
+- --quota N: serviceKey × 엔드포인트당 N건 이후 할당량 초과(returnReasonCode 22) XML 응답
+- GET /_stats: 엔드포인트별 contentId 호출 횟수 (워커 간 중복 호출 검증용)
+"""
+
+import argparse
+import json
+import threading
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# (lclsSystm1, lclsSystm2, lclsSystm3) 합성 데이터용 분류 코드
+_LCLS_CODES = [
+    ("HS", "HS01", "HS010100"),
+    ("VE", "VE01", "VE010100"),
+    ("NA", "NA01", "NA010100"),
+    ("FD", "FD01", "FD010200"),
+    ("AC", "AC01", "AC010100"),
+    ("LS", "LS01", "LS010100"),
+]
+_REGION_COORDS = {
+    "11": (37.56, 126.97),
+    "26": (35.17, 129.07),
+    "27": (35.87, 128.60),
+    "28": (37.45, 126.70),
+    "29": (35.16, 126.85),
+    "30": (36.35, 127.38),
+    "31": (35.53, 129.31),
+    "36110": (36.48, 127.28),
+    "41": (37.27, 127.01),
+    "43": (36.63, 127.49),
+    "44": (36.65, 126.67),
+    "46": (34.81, 126.46),
+    "47": (36.57, 128.72),
+    "48": (35.23, 128.68),
+    "50": (33.49, 126.53),
+    "51": (37.88, 127.73),
+    "52": (35.82, 127.15),
+}
+_QUOTA_EXCEEDED_XML = (
+    "<OpenAPI_ServiceResponse><cmmMsgHeader>"
+    "<errMsg>SERVICE ERROR</errMsg>"
+    "<returnAuthMsg>LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR</returnAuthMsg>"
+    "<returnReasonCode>22</returnReasonCode>"
+    "</cmmMsgHeader></OpenAPI_ServiceResponse>"
+)
+
+
+def _list_item(lang: str, content_type_id: str, region_code: str, n: int, modified: str) -> dict:
+    """목록 API 합성 항목을 생성한다."""
+    base = 1_000_000 if lang == "kr" else 2_000_000
+    region_idx = list(_REGION_COORDS).index(region_code) if region_code in _REGION_COORDS else 0
+    content_id = str(base + int(content_type_id) * 10_000 + region_idx * 100 + n)
+    lat, lng = _REGION_COORDS.get(region_code, (37.0, 127.0))
+    l1, l2, l3 = _LCLS_CODES[n % len(_LCLS_CODES)]
+    return {
+        "contentid": content_id,
+        "contenttypeid": content_type_id,
+        "title": f"mock-{lang}-{content_id}",
+        "addr1": f"mock address {region_code}",
+        "addr2": "",
+        "mapx": f"{lng + n * 0.001:.6f}",
+        "mapy": f"{lat + n * 0.001:.6f}",
+        "lDongRegnCd": region_code,
+        "lclsSystm1": l1,
+        "lclsSystm2": l2,
+        "lclsSystm3": l3,
+        "firstimage": "",
+        "firstimage2": "",
+        "tel": "",
+        "modifiedtime": modified,
+    }
+
+
+class MockApiState:
+    """요청 집계 및 할당량 상태."""
+
+    def __init__(self, items_per_combo: int, quota: int | None, delay: float) -> None:
+        self.items_per_combo = items_per_combo
+        self.quota = quota
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.calls: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.key_usage: dict[tuple[str, str], int] = defaultdict(int)
+
+
+def _make_handler(state: MockApiState) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+        def _send(self, status: int, body: str, content_type: str) -> None:
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _send_items(self, items: list[dict], params: dict, paginate: bool = False) -> None:
+            total = len(items)
+            if paginate:
+                rows = int(params.get("numOfRows", 10))
+                page = int(params.get("pageNo", 1))
+                items = items[(page - 1) * rows : page * rows]
+            body = {
+                "response": {
+                    "header": {"resultCode": "0000", "resultMsg": "OK"},
+                    "body": {
+                        "items": {"item": items} if items else "",
+                        "numOfRows": len(items),
+                        "pageNo": int(params.get("pageNo", 1)),
+                        "totalCount": total,
+                    },
+                }
+            }
+            self._send(200, json.dumps(body, ensure_ascii=False), "application/json;charset=UTF-8")
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+            if url.path == "/_stats":
+                with state.lock:
+                    stats = {ep: dict(ids) for ep, ids in state.calls.items()}
+                self._send(200, json.dumps(stats), "application/json")
+                return
+
+            parts = url.path.rstrip("/").split("/")
+            if len(parts) < 2:
+                self._send(404, "not found", "text/plain")
+                return
+            service, operation = parts[-2], parts[-1]
+            lang = "kr" if service == "KorService2" else "en"
+            endpoint = f"{service}/{operation}"
+            content_id = params.get("contentId", "")
+
+            with state.lock:
+                state.calls[endpoint][content_id or "-"] += 1
+                key = params.get("serviceKey", "")
+                state.key_usage[(key, endpoint)] += 1
+                over_quota = state.quota is not None and state.key_usage[(key, endpoint)] > state.quota
+
+            if state.delay:
+                time.sleep(state.delay)
+            if over_quota:
+                self._send(200, _QUOTA_EXCEEDED_XML, "text/xml;charset=UTF-8")
+                return
+
+            if operation.startswith("detail"):
+                self._send_items(self._detail_items(operation, lang, content_id, params), params)
+            elif operation in ("areaBasedList2", "areaBasedSyncList2"):
+                self._send_items(self._area_items(operation, lang, params), params, paginate=True)
+            elif operation == "searchFestival2":
+                self._send_items(self._festival_items(lang), params, paginate=True)
+            else:
+                self._send_items([], params)
+
+        def _detail_items(self, operation: str, lang: str, content_id: str, params: dict) -> list[dict]:
+            if not content_id or content_id.endswith("99"):
+                return []
+            content_type_id = params.get("contentTypeId", "12")
+            if operation == "detailCommon2":
+                return [{
+                    "contentid": content_id,
+                    "contenttypeid": content_type_id,
+                    "title": f"mock-{lang}-{content_id}",
+                    "overview": f"mock overview {content_id}",
+                    "homepage": f"<a href=\"https://example.com/{content_id}\">https://example.com/{content_id}</a>",
+                    "tel": "02-000-0000",
+                    "mlevel": "6",
+                    "mapx": "",
+                    "mapy": "",
+                }]
+            if operation == "detailIntro2":
+                return [{"contentid": content_id, "contenttypeid": content_type_id, "usetime": "09:00~18:00", "parking": ""}]
+            if operation == "detailInfo2":
+                return [{"contentid": content_id, "serialnum": "1", "infoname": "입장료", "infotext": "무료"}]
+            if operation == "detailImage2":
+                return [{
+                    "contentid": content_id,
+                    "originimgurl": f"http://example.com/{content_id}/1.jpg",
+                    "smallimageurl": f"http://example.com/{content_id}/1_s.jpg",
+                }]
+            if operation == "detailPetTour2":
+                return [{"contentid": content_id, "acmpyTypeCd": "일부구역 동반가능"}]
+            return []
+
+        def _area_items(self, operation: str, lang: str, params: dict) -> list[dict]:
+            modified = date.today().strftime("%Y%m%d") + "090000"
+            if operation == "areaBasedSyncList2":
+                items = [
+                    _list_item(lang, "12", region_code, n, modified)
+                    for region_code in list(_REGION_COORDS)[:3]
+                    for n in range(state.items_per_combo)
+                ]
+                for item in items:
+                    item["showflag"] = "0" if item["contentid"].endswith("99") else "1"
+                return items
+            content_type_id = params.get("contentTypeId", "12")
+            region_code = params.get("lDongRegnCd", "11")
+            return [
+                _list_item(lang, content_type_id, region_code, n, modified)
+                for n in range(state.items_per_combo)
+            ]
+
+        def _festival_items(self, lang: str) -> list[dict]:
+            today = date.today()
+            items = []
+            for n, region_code in enumerate(list(_REGION_COORDS)[:5]):
+                item = _list_item(lang, "15", region_code, n, today.strftime("%Y%m%d") + "090000")
+                item.update({
+                    "lclsSystm1": "EV",
+                    "lclsSystm2": "EV01",
+                    "lclsSystm3": "EV010100",
+                    "eventstartdate": (today - timedelta(days=n)).strftime("%Y%m%d"),
+                    "eventenddate": (today + timedelta(days=n + 3)).strftime("%Y%m%d"),
+                })
+                items.append(item)
+            return items
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="한국관광공사 API mock 서버 (로컬 테스트용)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--items", type=int, default=5, help="목록 API 조합당 항목 수 (기본: 5)")
+    parser.add_argument("--quota", type=int, default=None, help="serviceKey × 엔드포인트당 허용 호출 수")
+    parser.add_argument("--delay", type=float, default=0.0, help="응답 지연 (초)")
+    args = parser.parse_args()
+
+    state = MockApiState(args.items, args.quota, args.delay)
+    server = ThreadingHTTPServer((args.host, args.port), _make_handler(state))
+    print(f"[Mock] http://{args.host}:{args.port}/B551011 대기 중 (Ctrl+C 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
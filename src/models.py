@@ -0,0 +1,248 @@
+"""공공 API 항목 / POI 출력 문서 타입 모델.
+
+API 응답 항목을 NamedTuple로 정의한다 (필드 이름 = API 키 이름).
+dict 항목에서 필드마다 .get()을 부르는 대신 operator.itemgetter 한 번(C 구현)으로 값을 꺼내
+튜플로 만들고, 이후 처리는 속성으로 읽는다.
+
+- 목록: AreaBasedItem (areaBasedList2), AreaBasedSyncItem (areaBasedSyncList2), FestivalItem (searchFestival2)
+- 상세: DetailCommonItem (detailCommon2), DetailImageItem (detailImage2)
+  (detailIntro2/detailInfo2/detailPetTour2는 콘텐츠 타입마다 필드가 달라 dict 그대로 사용)
+- POI 출력 문서: PoiDocument (TypedDict) — pois_{lang}.json과 MongoDB에 그대로 쓰는 dict의 스키마
+  (타입 표기용이며 실행 시 검증/인코딩하지 않는다)
+
+검증: contentid(첫 필드)가 비어 있으면 ModelError, 숫자 값은 문자열로, null은 빈 문자열로 바꾸고
+그 밖의 타입(dict/list 등)은 ModelError. 없는 필드는 빈 문자열이다.
+모델에 없는 API 필드(areacode, cat1 등)는 버리므로 원본 보존이 필요한 파일(raw/, area_based_{lang}.json)은
+dict 그대로 저장한다.
+응답 본문은 client가 resp.json()으로 파싱한 뒤 response_items() + decode_items()로 항목별로 검증한다.
+
+사용 예:
+    items, total = response_items(resp.json())
+    items = decode_items(AreaBasedItem, items)
+    common = decode_item(DetailCommonItem, raw_item)
+    common.overview
+"""
+
+from operator import itemgetter
+from typing import NamedTuple, TypedDict
+
+
+class ModelError(ValueError):
+    """API 항목이 모델 스키마에 맞지 않을 때 발생한다."""
+
+
+# ── 목록 API ──
+
+
+class AreaBasedItem(NamedTuple):
+    """areaBasedList2 항목 (POI 변환에 쓰는 필드)."""
+
+    contentid: str
+    contenttypeid: str = ""
+    title: str = ""
+    addr1: str = ""
+    addr2: str = ""
+    mapx: str = ""
+    mapy: str = ""
+    lDongRegnCd: str = ""
+    lclsSystm1: str = ""
+    lclsSystm2: str = ""
+    lclsSystm3: str = ""
+    firstimage: str = ""
+    firstimage2: str = ""
+    tel: str = ""
+    modifiedtime: str = ""
+
+
+class AreaBasedSyncItem(NamedTuple):
+    """areaBasedSyncList2 항목 (AreaBasedItem 필드 + showflag)."""
+
+    contentid: str
+    contenttypeid: str = ""
+    title: str = ""
+    addr1: str = ""
+    addr2: str = ""
+    mapx: str = ""
+    mapy: str = ""
+    lDongRegnCd: str = ""
+    lclsSystm1: str = ""
+    lclsSystm2: str = ""
+    lclsSystm3: str = ""
+    firstimage: str = ""
+    firstimage2: str = ""
+    tel: str = ""
+    modifiedtime: str = ""
+    showflag: str = ""
+
+
+class FestivalItem(NamedTuple):
+    """searchFestival2 항목 (AreaBasedItem 필드 + 행사 기간)."""
+
+    contentid: str
+    contenttypeid: str = ""
+    title: str = ""
+    addr1: str = ""
+    addr2: str = ""
+    mapx: str = ""
+    mapy: str = ""
+    lDongRegnCd: str = ""
+    lclsSystm1: str = ""
+    lclsSystm2: str = ""
+    lclsSystm3: str = ""
+    firstimage: str = ""
+    firstimage2: str = ""
+    tel: str = ""
+    modifiedtime: str = ""
+    eventstartdate: str = ""
+    eventenddate: str = ""
+
+
+# ── 상세 API ──
+
+
+class DetailCommonItem(NamedTuple):
+    """detailCommon2 항목 (상세 병합에 쓰는 필드)."""
+
+    contentid: str
+    contenttypeid: str = ""
+    title: str = ""
+    overview: str = ""
+    homepage: str = ""
+    tel: str = ""
+    mlevel: str = ""
+    mapx: str = ""
+    mapy: str = ""
+
+
+class DetailImageItem(NamedTuple):
+    """detailImage2 항목."""
+
+    contentid: str
+    originimgurl: str = ""
+    smallimageurl: str = ""
+
+
+# ── POI 출력 문서 ──
+
+
+class Coordinates(TypedDict):
+    lat: float
+    lng: float
+
+
+class GeoPoint(TypedDict):
+    type: str  # "Point"
+    coordinates: list[float]  # [lng, lat]
+
+
+class PoiSource(TypedDict):
+    contentTypeId: str
+    area: str
+    lcls: list[str]
+    modifiedtime: str
+
+
+class PoiDocument(TypedDict):
+    """pois_{lang}.json 항목 (키 순서 = 출력 키 순서).
+
+    dict 그대로 출력 파일(JsonArrayWriter)과 MongoDB(BSON)에 쓰므로 변환 비용이 없다.
+    """
+
+    id: str
+    slug: str
+    category: str
+    appCategory: str
+    thumbnail: str
+    coordinates: Coordinates
+    location: GeoPoint
+    name: str
+    address: str
+    description: str
+    region: str
+    images: list[str]
+    contact: str
+    website: str
+    tags: list[str]
+    updatedAt: str
+    source: PoiSource
+
+
+API_MODELS = (AreaBasedItem, AreaBasedSyncItem, FestivalItem, DetailCommonItem, DetailImageItem)
+
+# 모델별 필드 추출기 (모든 필드가 있는 항목은 C 구현 한 번으로 튜플을 만든다)
+for _model in API_MODELS:
+    _model._getter = itemgetter(*_model._fields)
+
+
+# ── 디코드 ──
+
+
+def _coerce(model, values) -> list[str]:
+    """숫자 → 문자열, None → 빈 문자열 (그 밖의 타입은 ModelError)."""
+    coerced = []
+    for field, value in zip(model._fields, values):
+        if value is None:
+            value = ""
+        elif type(value) is int or type(value) is float:
+            value = str(value)
+        elif type(value) is not str:
+            raise ModelError(f"{model.__name__}.{field}: 문자열이 아닌 값 ({type(value).__name__})")
+        coerced.append(value)
+    return coerced
+
+
+def decode_item(model, item: dict):
+    """API 응답 항목(dict)을 모델로 검증/변환한다.
+
+    Raises:
+        ModelError: dict가 아니거나, contentid가 없거나, 필드 타입이 맞지 않는 경우
+    """
+    if type(item) is not dict:
+        raise ModelError(f"{model.__name__}: 항목이 객체가 아님 ({type(item).__name__})")
+    try:
+        values = model._getter(item)
+    except KeyError:
+        values = tuple([item.get(field, "") for field in model._fields])
+    try:
+        # 모두 문자열인지 C 구현 한 번으로 확인 (문자열이 아닌 값이 있으면 TypeError)
+        "".join(values)
+    except TypeError:
+        values = _coerce(model, values)
+    if not values[0]:
+        raise ModelError(f"{model.__name__}: {model._fields[0]} 없음")
+    return tuple.__new__(model, values)
+
+
+def try_decode(model, item: dict):
+    """decode_item()과 같지만 검증에 실패하면 경고를 출력하고 None을 반환한다."""
+    try:
+        return decode_item(model, item)
+    except ModelError as e:
+        print(f"    [경고] 항목 검증 실패, 건너뜀: {e}")
+        return None
+
+
+def decode_items(model, items: list[dict]) -> list:
+    """항목 목록을 모델 목록으로 바꾼다 (검증에 실패한 항목은 경고 후 제외)."""
+    decoded = []
+    for item in items:
+        try:
+            decoded.append(decode_item(model, item))
+        except ModelError as e:
+            print(f"    [경고] 항목 검증 실패, 건너뜀: {e}")
+    return decoded
+
+
+def response_items(data: dict) -> tuple[list[dict], int]:
+    """API 응답 JSON에서 items 리스트와 totalCount를 추출한다."""
+    body = data.get("response", {}).get("body", {})
+    total_count = body.get("totalCount", 0)
+
+    items_wrapper = body.get("items", "")
+    if not items_wrapper or items_wrapper == "":
+        return [], total_count
+
+    item = items_wrapper.get("item", [])
+    if isinstance(item, dict):
+        item = [item]
+    return item, total_count
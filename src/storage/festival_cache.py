@@ -0,0 +1,63 @@
+"""Step 5 행사 상세 재사용 캐시 (lang + contentId + modifiedtime 기준).
+
+캐시 구조 (output/festival_cache.json):
+{
+    "kr": {
+        "2733967": {
+            "modifiedtime": "20261018153012",  # 상세 수신 기준 원본 수정시각
+            "eventEndDate": "20261031",         # 행사 종료일 (지나면 제거)
+            "poi": {...}                        # 상세 병합까지 끝난 POI
+        }
+    },
+    "en": {...}
+}
+
+원본 modifiedtime이 같은 행사는 상세 API를 호출하지 않고 캐시된 POI를 사용한다.
+GitHub Actions에서는 actions/cache로 실행 간에 유지한다 (festival-daily.yml).
+"""
+
+import json
+from datetime import date
+from pathlib import Path
+
+FESTIVAL_CACHE_PATH = Path(__file__).resolve().parent.parent.parent / "output" / "festival_cache.json"
+
+
+def load_festival_cache() -> dict[str, dict[str, dict]]:
+    """행사 상세 캐시를 로드한다 (파일이 없거나 손상되었으면 빈 캐시)."""
+    if not FESTIVAL_CACHE_PATH.exists():
+        return {}
+    try:
+        return json.loads(FESTIVAL_CACHE_PATH.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        print(f"[행사 캐시] [경고] 캐시 파일 손상, 무시합니다: {e}")
+        return {}
+
+
+def evict_ended(cache: dict[str, dict[str, dict]], today: date | None = None) -> int:
+    """행사 종료일이 지난 항목을 제거하고 제거 건수를 반환한다.
+
+    종료일이 없는 항목도 만료 시점을 알 수 없으므로 제거한다.
+    """
+    cutoff = (today or date.today()).strftime("%Y%m%d")
+    evicted = 0
+    for entries in cache.values():
+        for content_id in [
+            cid for cid, entry in entries.items()
+            if (entry.get("eventEndDate") or "") < cutoff
+        ]:
+            del entries[content_id]
+            evicted += 1
+    return evicted
+
+
+def save_festival_cache(cache: dict[str, dict[str, dict]]) -> Path:
+    """종료된 행사를 제거한 뒤 캐시를 저장한다 (임시 파일 기록 후 교체 — 중단 시 기존 캐시 유지)."""
+    evicted = evict_ended(cache)
+    if evicted:
+        print(f"[행사 캐시] 종료된 행사 {evicted}건 제거")
+    FESTIVAL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = FESTIVAL_CACHE_PATH.with_name(FESTIVAL_CACHE_PATH.name + ".tmp")
+    tmp_path.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp_path.replace(FESTIVAL_CACHE_PATH)
+    return FESTIVAL_CACHE_PATH
@@ -0,0 +1,263 @@
+"""Step 3 멀티 워커용 샤드 lease 저장소 (SQLite / MongoDB).
+
+샤드 문서 구조:
+{
+    "runId": "20261019",
+    "lang": "kr",
+    "shard": "h07" | "seoul",
+    "priority": 4.5,      # 샤드 내 최고 우선순위 점수 (높은 샤드부터 배정)
+    "owner": "w1",         # 현재 lease 보유 워커 (None이면 미배정)
+    "expiresAt": 1760000000.0,
+    "ids": ["126508", ...],  # 샤드 생성 시점의 처리 대상 contentId (처리 순서, 이후 변경 없음)
+    "progress": 120,       # ids 기준 완료 건수 (이어받기용)
+    "done": False
+}
+
+lease가 만료된 샤드(워커 비정상 종료)는 다른 워커가 progress부터 이어받는다.
+progress는 샤드 생성 시 고정한 ids의 위치이므로, 이어받는 워커가 다시 계산한 미처리 목록이
+(journal 병합 등으로) 짧아져도 같은 POI부터 재개한다.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import AutoReconnect
+
+from src.config import DETAIL_LEASE_BACKEND
+from src.storage.mongodb import BATCH_DELAY, MAX_RETRIES, _get_client
+
+LEASE_DB_PATH = Path(__file__).resolve().parent.parent.parent / "output" / "leases.sqlite"
+
+
+class SqliteLeaseStore:
+    """로컬 SQLite 파일 기반 lease 저장소 (같은 호스트의 여러 프로세스용)."""
+
+    def __init__(self, path: Path = LEASE_DB_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS detail_leases (
+                run_id TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                shard TEXT NOT NULL,
+                priority REAL NOT NULL DEFAULT 0,
+                owner TEXT,
+                expires_at REAL NOT NULL DEFAULT 0,
+                ids TEXT,
+                progress INTEGER NOT NULL DEFAULT 0,
+                done INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (run_id, lang, shard)
+            )
+            """
+        )
+        # ids 컬럼이 없던 기존 lease 파일 호환
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(detail_leases)")}
+        if "ids" not in columns:
+            self._conn.execute("ALTER TABLE detail_leases ADD COLUMN ids TEXT")
+
+    def ensure_shards(self, run_id: str, lang: str, shards: dict[str, tuple[float, list[str]]]) -> None:
+        """샤드 행을 생성한다 (이미 있으면 우선순위/ids 유지).
+
+        Args:
+            shards: {shard: (priority, [contentId, ...])} — ids는 처리 순서
+        """
+        self._conn.executemany(
+            "INSERT INTO detail_leases (run_id, lang, shard, priority, ids) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (run_id, lang, shard) DO UPDATE SET ids = excluded.ids WHERE ids IS NULL",
+            [
+                (run_id, lang, shard, priority, json.dumps(ids))
+                for shard, (priority, ids) in shards.items()
+            ],
+        )
+
+    def claim(self, run_id: str, lang: str, owner: str, ttl: float) -> tuple[str, int, list[str]] | None:
+        """미완료 + 미배정(또는 lease 만료) 샤드 중 우선순위가 가장 높은 샤드를 점유한다.
+
+        Returns:
+            (shard, progress, ids) 또는 남은 샤드가 없으면 None
+        """
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._conn.execute(
+                """
+                SELECT shard, progress, ids FROM detail_leases
+                WHERE run_id = ? AND lang = ? AND done = 0
+                  AND (owner IS NULL OR expires_at < ?)
+                ORDER BY priority DESC, shard
+                LIMIT 1
+                """,
+                (run_id, lang, now),
+            ).fetchone()
+            if row is None:
+                self._conn.execute("COMMIT")
+                return None
+            self._conn.execute(
+                "UPDATE detail_leases SET owner = ?, expires_at = ? "
+                "WHERE run_id = ? AND lang = ? AND shard = ?",
+                (owner, now + ttl, run_id, lang, row[0]),
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return row[0], row[1], json.loads(row[2] or "[]")
+
+    def renew(self, run_id: str, lang: str, shard: str, owner: str, ttl: float, progress: int) -> bool:
+        """lease를 연장하고 진행 건수를 기록한다. 다른 워커에게 넘어갔으면 False."""
+        cur = self._conn.execute(
+            "UPDATE detail_leases SET expires_at = ?, progress = ? "
+            "WHERE run_id = ? AND lang = ? AND shard = ? AND owner = ? AND done = 0",
+            (time.time() + ttl, progress, run_id, lang, shard, owner),
+        )
+        return cur.rowcount == 1
+
+    def complete(self, run_id: str, lang: str, shard: str, owner: str, progress: int) -> None:
+        """샤드 처리 완료를 기록한다."""
+        self._conn.execute(
+            "UPDATE detail_leases SET done = 1, progress = ?, owner = NULL "
+            "WHERE run_id = ? AND lang = ? AND shard = ? AND owner = ?",
+            (progress, run_id, lang, shard, owner),
+        )
+
+    def release(self, run_id: str, lang: str, shard: str, owner: str, progress: int) -> None:
+        """미완료 샤드의 lease를 반납한다 (예산 소진 등)."""
+        self._conn.execute(
+            "UPDATE detail_leases SET owner = NULL, expires_at = 0, progress = ? "
+            "WHERE run_id = ? AND lang = ? AND shard = ? AND owner = ?",
+            (progress, run_id, lang, shard, owner),
+        )
+
+    def status(self, run_id: str, lang: str) -> dict[str, int]:
+        """샤드 상태 집계 {"total", "done", "leased"}."""
+        now = time.time()
+        total, done, leased = self._conn.execute(
+            """
+            SELECT COUNT(*),
+                   COALESCE(SUM(done), 0),
+                   COALESCE(SUM(CASE WHEN done = 0 AND owner IS NOT NULL AND expires_at >= ? THEN 1 ELSE 0 END), 0)
+            FROM detail_leases WHERE run_id = ? AND lang = ?
+            """,
+            (now, run_id, lang),
+        ).fetchone()
+        return {"total": total, "done": done, "leased": leased}
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class MongoLeaseStore:
+    """MongoDB detail_leases 컬렉션 기반 lease 저장소 (여러 호스트용)."""
+
+    def __init__(self, db_name: str = "korea_tourism") -> None:
+        self._client = _get_client()
+        self._col = self._client[db_name]["detail_leases"]
+
+    def _retry(self, fn):
+        """AutoReconnect 시 지수 백오프로 재시도한다."""
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                return fn()
+            except AutoReconnect:
+                if attempt == MAX_RETRIES:
+                    raise
+                wait = BATCH_DELAY * attempt * 2
+                print(f"    연결 끊김, {wait:.0f}초 후 재시도 ({attempt}/{MAX_RETRIES})...")
+                time.sleep(wait)
+
+    def ensure_shards(self, run_id: str, lang: str, shards: dict[str, tuple[float, list[str]]]) -> None:
+        if not shards:
+            return
+        ops = []
+        for shard, (priority, ids) in shards.items():
+            ops.append(UpdateOne(
+                {"_id": f"{run_id}:{lang}:{shard}"},
+                {"$setOnInsert": {
+                    "runId": run_id,
+                    "lang": lang,
+                    "shard": shard,
+                    "priority": priority,
+                    "owner": None,
+                    "expiresAt": 0.0,
+                    "ids": ids,
+                    "progress": 0,
+                    "done": False,
+                }},
+                upsert=True,
+            ))
+            # ids 필드가 없던 기존 샤드 문서 호환
+            ops.append(UpdateOne(
+                {"_id": f"{run_id}:{lang}:{shard}", "ids": {"$exists": False}},
+                {"$set": {"ids": ids}},
+            ))
+        self._retry(lambda: self._col.bulk_write(ops, ordered=True))
+
+    def claim(self, run_id: str, lang: str, owner: str, ttl: float) -> tuple[str, int, list[str]] | None:
+        now = time.time()
+        doc = self._retry(lambda: self._col.find_one_and_update(
+            {
+                "runId": run_id,
+                "lang": lang,
+                "done": False,
+                "$or": [{"owner": None}, {"expiresAt": {"$lt": now}}],
+            },
+            {"$set": {"owner": owner, "expiresAt": now + ttl}},
+            sort=[("priority", -1), ("shard", 1)],
+            return_document=ReturnDocument.AFTER,
+        ))
+        if doc is None:
+            return None
+        return doc["shard"], doc.get("progress", 0), doc.get("ids", [])
+
+    def renew(self, run_id: str, lang: str, shard: str, owner: str, ttl: float, progress: int) -> bool:
+        result = self._retry(lambda: self._col.update_one(
+            {"_id": f"{run_id}:{lang}:{shard}", "owner": owner, "done": False},
+            {"$set": {"expiresAt": time.time() + ttl, "progress": progress}},
+        ))
+        return result.matched_count == 1
+
+    def complete(self, run_id: str, lang: str, shard: str, owner: str, progress: int) -> None:
+        self._retry(lambda: self._col.update_one(
+            {"_id": f"{run_id}:{lang}:{shard}", "owner": owner},
+            {"$set": {"done": True, "progress": progress, "owner": None}},
+        ))
+
+    def release(self, run_id: str, lang: str, shard: str, owner: str, progress: int) -> None:
+        self._retry(lambda: self._col.update_one(
+            {"_id": f"{run_id}:{lang}:{shard}", "owner": owner},
+            {"$set": {"owner": None, "expiresAt": 0.0, "progress": progress}},
+        ))
+
+    def status(self, run_id: str, lang: str) -> dict[str, int]:
+        now = time.time()
+        base = {"runId": run_id, "lang": lang}
+        return {
+            "total": self._col.count_documents(base),
+            "done": self._col.count_documents({**base, "done": True}),
+            "leased": self._col.count_documents(
+                {**base, "done": False, "owner": {"$ne": None}, "expiresAt": {"$gte": now}}
+            ),
+        }
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def create_lease_store(backend: str = DETAIL_LEASE_BACKEND) -> SqliteLeaseStore | MongoLeaseStore:
+    """설정에 맞는 lease 저장소를 생성한다.
+
+    auto: MONGODB_URI가 설정되어 있으면 MongoDB, 아니면 로컬 SQLite
+    """
+    if backend == "auto":
+        backend = "mongo" if os.environ.get("MONGODB_URI") else "sqlite"
+    if backend == "mongo":
+        return MongoLeaseStore()
+    if backend == "sqlite":
+        return SqliteLeaseStore()
+    raise ValueError(f"알 수 없는 DETAIL_LEASE_BACKEND: {backend}")
@@ -1,9 +1,12 @@
 """변환된 POI/GeoJSON 데이터를 MongoDB에 upsert 저장한다."""
 
+import hashlib
+import json
 import os
 import time
+from itertools import islice
 
-from pymongo import MongoClient, UpdateOne
+from pymongo import MongoClient, ReplaceOne, UpdateOne
 from pymongo.errors import AutoReconnect
 
 BATCH_SIZE = 300
@@ -19,35 +22,103 @@ def _get_client() -> MongoClient:
     return MongoClient(uri)
 
 
-def _bulk_write_batched(collection, ops: list, batch_size: int = BATCH_SIZE) -> int:
+def _bulk_write_with_retry(collection, batch: list) -> int:
+    """단일 배치를 bulk_write하고 upsert + 수정 건수를 반환한다 (AutoReconnect 시 재시도)."""
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            result = collection.bulk_write(batch)
+            return result.upserted_count + result.modified_count
+        except AutoReconnect:
+            if attempt == MAX_RETRIES:
+                raise
+            wait = BATCH_DELAY * attempt * 2
+            print(f"    연결 끊김, {wait:.0f}초 후 재시도 ({attempt}/{MAX_RETRIES})...")
+            time.sleep(wait)
+    return 0
+
+
+def _bulk_write_batched(
+    collection, ops, batch_size: int = BATCH_SIZE, count: int | None = None
+) -> int:
     """ops를 batch_size 단위로 나눠서 bulk_write하고 총 upsert 건수를 반환한다.
 
     Atlas Free Tier 제약을 고려하여 배치 간 딜레이와 재시도 로직을 포함한다.
+    ops가 제너레이터이면 count(전체 건수)를 함께 넘긴다 — 배치 단위로만 연산 객체를 만든다.
     """
+    if count is None:
+        ops = list(ops)
+        count = len(ops)
+    ops = iter(ops)
     total = 0
-    total_batches = (len(ops) + batch_size - 1) // batch_size
+    total_batches = (count + batch_size - 1) // batch_size
+
+    for batch_num in range(1, total_batches + 1):
+        batch = list(islice(ops, batch_size))
+        if not batch:
+            break
+        total += _bulk_write_with_retry(collection, batch)
+
+        print(f"    배치 {batch_num}/{total_batches} 완료 ({len(batch)}건)")
+
+        if batch_num < total_batches:
+            time.sleep(BATCH_DELAY)
+
+    return total
 
-    for batch_num, i in enumerate(range(0, len(ops), batch_size), 1):
-        batch = ops[i : i + batch_size]
 
+class PoiUpsertWriter:
+    """POI를 id 기준으로 upsert하는 스트리밍 writer (Step 4 파이프라인용).
+
+    MongoClient 하나를 유지하며 upsert() 호출마다 bulk_write 1회를 수행한다.
+    같은 배치의 삭제(delete())와 동기화 요약(save_summaries())도 같은 연결로 반영한다.
+    호출 간격은 API 수신 속도가 결정하므로 _bulk_write_batched()와 달리 배치 간 대기가 없다.
+    """
+
+    def __init__(self, db_name: str = "korea_tourism") -> None:
+        self._client = _get_client()
+        self._db = self._client[db_name]
+
+    def upsert(self, lang: str, docs: list[dict]) -> int:
+        """pois_{lang} 컬렉션에 문서를 upsert하고 upsert + 수정 건수를 반환한다."""
+        if not docs:
+            return 0
+        ops = [UpdateOne({"id": doc["id"]}, {"$set": doc}, upsert=True) for doc in docs]
+        return _bulk_write_with_retry(self._db[f"pois_{lang}"], ops)
+
+    def delete(self, lang: str, ids: list[str]) -> int:
+        """pois_{lang} 컬렉션에서 id 목록의 문서를 삭제하고 삭제 건수를 반환한다."""
+        if not ids:
+            return 0
+        return self._retry(
+            lambda: self._db[f"pois_{lang}"].delete_many({"id": {"$in": ids}}).deleted_count
+        )
+
+    def save_summaries(self, summaries: list[dict]) -> int:
+        """updated_content 컬렉션에 동기화 요약을 추가한다 (save_sync_summary_to_mongodb()와 같은 문서)."""
+        if not summaries:
+            return 0
+        return self._retry(
+            lambda: len(self._db["updated_content"].insert_many(summaries).inserted_ids)
+        )
+
+    def _retry(self, fn):
+        """AutoReconnect 시 지수 백오프로 재시도한다."""
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                result = collection.bulk_write(batch)
-                total += result.upserted_count + result.modified_count
-                break
-            except AutoReconnect as e:
+                return fn()
+            except AutoReconnect:
                 if attempt == MAX_RETRIES:
                     raise
                 wait = BATCH_DELAY * attempt * 2
                 print(f"    연결 끊김, {wait:.0f}초 후 재시도 ({attempt}/{MAX_RETRIES})...")
                 time.sleep(wait)
 
-        print(f"    배치 {batch_num}/{total_batches} 완료 ({len(batch)}건)")
-
-        if batch_num < total_batches:
-            time.sleep(BATCH_DELAY)
+    def detail_versions(self, lang: str, ids: list[str]) -> dict[str, dict]:
+        """load_detail_versions()와 동일 (writer의 연결 재사용)."""
+        return _find_detail_versions(self._db, lang, ids) if ids else {}
 
-    return total
+    def close(self) -> None:
+        self._client.close()
 
 
 def update_pois_details_to_mongodb(
@@ -59,7 +130,7 @@ def update_pois_details_to_mongodb(
     upsert=False — 기존 문서만 업데이트, 신규 생성 안함.
 
     Args:
-        data: {"kr": [POI 목록], "en": [POI 목록]}
+        data: {"kr": [POI 목록 또는 PoiTable], "en": [...]}
         db_name: MongoDB 데이터베이스 이름
 
     Returns:
@@ -70,9 +141,26 @@ def update_pois_details_to_mongodb(
         "description", "mlevel", "coordinates", "location",
         "contact", "website", "intro", "info", "detailUpdatedAt",
         "thumbnail", "appCategory", "images", "detailImageUpdated",
-        "pet", "detailPetUpdated",
+        "pet", "detailPetUpdated", "detailModifiedTime",
     )
 
+    def targets(pois):
+        # detailUpdatedAt이 있고 갱신할 필드가 있는 항목 (dict 또는 PoiTable 행 뷰)
+        for doc in pois:
+            if doc.get("detailUpdatedAt") and any(k in doc for k in update_fields):
+                yield doc
+
+    def build_ops(pois):
+        for doc in targets(pois):
+            yield UpdateOne(
+                {"id": doc["id"]},
+                {
+                    "$set": {k: doc[k] for k in update_fields if k in doc},
+                    "$unset": {"details": ""},
+                },
+                upsert=False,
+            )
+
     client = _get_client()
     db = client[db_name]
     stats: dict[str, int] = {}
@@ -83,34 +171,14 @@ def update_pois_details_to_mongodb(
                 continue
 
             pois = data[lang]
-            # detailUpdatedAt이 있는 항목만 업데이트 대상
-            updated_pois = [p for p in pois if p.get("detailUpdatedAt")]
-            if not updated_pois:
+            # detailUpdatedAt이 있는 항목만 업데이트 대상 (연산 객체는 배치 단위로 생성)
+            target_count = sum(1 for _ in targets(pois))
+            if not target_count:
                 continue
 
             col_name = f"pois_{lang}"
-            ops = []
-            for doc in updated_pois:
-                set_fields = {
-                    k: doc[k] for k in update_fields if k in doc
-                }
-                if set_fields:
-                    ops.append(
-                        UpdateOne(
-                            {"id": doc["id"]},
-                            {
-                                "$set": set_fields,
-                                "$unset": {"details": ""},
-                            },
-                            upsert=False,
-                        )
-                    )
-
-            if not ops:
-                continue
-
-            print(f"  [MongoDB] {col_name}: {len(ops)}건 상세 업데이트 시작...")
-            count = _bulk_write_batched(db[col_name], ops)
+            print(f"  [MongoDB] {col_name}: {target_count}건 상세 업데이트 시작...")
+            count = _bulk_write_batched(db[col_name], build_ops(pois), count=target_count)
             stats[col_name] = count
             print(f"  [MongoDB] {col_name}: {count}건 업데이트 완료")
     finally:
@@ -119,6 +187,43 @@ def update_pois_details_to_mongodb(
     return stats
 
 
+def load_detail_versions(
+    lang: str, ids: list[str], db_name: str = "korea_tourism"
+) -> dict[str, dict]:
+    """POI의 상세 수신 기준 정보를 조회한다 (변경 감지 게이트용).
+
+    Args:
+        lang: 언어 코드 (kr/en)
+        ids: 조회할 contentId 목록
+        db_name: MongoDB 데이터베이스 이름
+
+    Returns:
+        {id: {"detailModifiedTime": ..., "detailUpdatedAt": ...}} — 상세 수신 이력이 있는 문서만
+    """
+    if not ids:
+        return {}
+
+    client = _get_client()
+    try:
+        return _find_detail_versions(client[db_name], lang, ids)
+    finally:
+        client.close()
+
+
+def _find_detail_versions(db, lang: str, ids: list[str]) -> dict[str, dict]:
+    """load_detail_versions()의 조회 본체 (BATCH_SIZE 단위 $in 조회)."""
+    col = db[f"pois_{lang}"]
+    versions: dict[str, dict] = {}
+    for i in range(0, len(ids), BATCH_SIZE):
+        cursor = col.find(
+            {"id": {"$in": ids[i : i + BATCH_SIZE]}, "detailModifiedTime": {"$exists": True}},
+            {"_id": 0, "id": 1, "detailModifiedTime": 1, "detailUpdatedAt": 1},
+        )
+        for doc in cursor:
+            versions[doc["id"]] = doc
+    return versions
+
+
 def save_regions_to_mongodb(
     docs: list[dict], db_name: str = "korea_tourism"
 ) -> int:
@@ -155,7 +260,7 @@ def save_pois_to_mongodb(data: dict[str, dict], db_name: str = "korea_tourism")
         - pois_en: data["en"]["pois"] → id 기준 upsert
 
     Args:
-        data: {"kr": {"pois": [...]}, "en": {"pois": [...]}}
+        data: {"kr": {"pois": [...] 또는 PoiTable}, "en": {...}}
         db_name: MongoDB 데이터베이스 이름
 
     Returns:
@@ -174,12 +279,11 @@ def save_pois_to_mongodb(data: dict[str, dict], db_name: str = "korea_tourism")
             pois = data[lang]["pois"]
             if pois:
                 col_name = f"pois_{lang}"
-                ops = [
-                    UpdateOne({"id": doc["id"]}, {"$set": doc}, upsert=True)
-                    for doc in pois
-                ]
-                print(f"  [MongoDB] {col_name}: {len(ops)}건 저장 시작...")
-                count = _bulk_write_batched(db[col_name], ops)
+                # PoiTable은 배치마다 행을 dict로 바꾼다 (전체 dict 목록을 만들지 않음)
+                docs = pois.iter_dicts() if hasattr(pois, "iter_dicts") else pois
+                ops = (UpdateOne({"id": doc["id"]}, {"$set": doc}, upsert=True) for doc in docs)
+                print(f"  [MongoDB] {col_name}: {len(pois)}건 저장 시작...")
+                count = _bulk_write_batched(db[col_name], ops, count=len(pois))
                 stats[col_name] = count
                 print(f"  [MongoDB] {col_name}: {count}건 upsert 완료")
     finally:
@@ -198,7 +302,10 @@ def save_sync_summary_to_mongodb(
         "contentId": "12345",
         "name": "POI 이름",
         "region": "seoul",
-        "action": "updated" | "deleted",
+        "category": "역사관광",                      # updated / festival_* 만
+        "appCategory": "culture",                  # updated / festival_* 만
+        "coordinates": {"lat": 37.58, "lng": 126.98},  # updated / festival_* 만
+        "action": "updated" | "deleted" | "festival_created" | "festival_updated" | "festival_deleted",
         "lang": "kr" | "en",
         "syncDate": "2026-03-14T10:00:00"
     }
@@ -286,57 +393,177 @@ def delete_old_sync_summaries(db_name: str = "korea_tourism", days: int = 4) ->
     return 0
 
 
-def delete_event_pois_from_mongodb(
-    db_name: str = "korea_tourism",
-) -> tuple[dict[str, int], list[dict]]:
-    """EV(행사) 타입 POI를 MongoDB에서 전량 삭제한다.
+# 콘텐츠 해시 계산에서 제외할 필드 (내용 변경 없이 매 실행마다 바뀌는 값)
+_HASH_EXCLUDE_FIELDS = ("_id", "contentHash", "detailUpdatedAt")
+
+
+def _content_hash(doc: dict) -> str:
+    """문서 내용의 sha1 해시 (키 순서 무관)."""
+    body = {k: v for k, v in doc.items() if k not in _HASH_EXCLUDE_FIELDS}
+    raw = json.dumps(body, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def replace_event_pois_in_mongodb(
+    festival_data: dict[str, list[dict]], db_name: str = "korea_tourism"
+) -> tuple[dict[str, dict[str, int]], list[dict]]:
+    """수신한 행사 POI와 저장된 EV(행사) 문서의 차이만 MongoDB에 반영한다.
 
     source.lcls 배열의 첫 번째 요소가 "EV"인 문서를 대상으로 한다.
+    - 신규/내용 변경(contentHash 불일치) 문서만 id 기준 replace (upsert)
+    - 수신 목록에서 사라진 EV 문서만 삭제
+    - 변경 없는 문서는 쓰기/감사 기록 없음
+
+    festival_data에 없는 언어(수신 실패)와 빈 목록은 건드리지 않는다.
 
     Args:
+        festival_data: {"kr": [완성된 행사 POI 목록], "en": [...]}
         db_name: MongoDB 데이터베이스 이름
 
     Returns:
         (stats, summaries)
-        - stats: 컬렉션별 삭제 건수 {"pois_kr": N, "pois_en": N}
-        - summaries: 삭제된 POI 감사 기록 리스트
+        - stats: {"pois_kr": {"created": N, "updated": N, "deleted": N, "unchanged": N}, ...}
+        - summaries: 실제 변경된 POI 감사 기록 (festival_created / festival_updated / festival_deleted)
     """
     from datetime import datetime
 
     client = _get_client()
     db = client[db_name]
-    stats: dict[str, int] = {}
+    stats: dict[str, dict[str, int]] = {}
     summaries: list[dict] = []
     sync_date = datetime.now().isoformat(timespec="seconds")
 
-    query = {"source.lcls.0": "EV"}
+    def _summary(doc: dict, action: str, lang: str) -> dict:
+        return {
+            "contentId": doc.get("id", ""),
+            "name": doc.get("name", ""),
+            "region": doc.get("region", ""),
+            "category": doc.get("category", ""),
+            "appCategory": doc.get("appCategory", ""),
+            "coordinates": doc.get("coordinates"),
+            "action": action,
+            "lang": lang,
+            "syncDate": sync_date,
+        }
 
     try:
         for lang in ("kr", "en"):
+            pois = festival_data.get(lang)
+            if not pois:
+                continue
+
             col_name = f"pois_{lang}"
             collection = db[col_name]
+            # 지역 + 행사 기간 조회용 인덱스 (행사 기간이 있는 문서만 포함)
+            collection.create_index(
+                [("region", 1), ("eventStartDate", 1), ("eventEndDate", 1)],
+                name="region_event_dates",
+                partialFilterExpression={"eventStartDate": {"$exists": True}},
+            )
+            stored = {
+                doc["id"]: doc
+                for doc in collection.find(
+                    {"source.lcls.0": "EV"},
+                    {"_id": 0, "id": 1, "name": 1, "region": 1, "contentHash": 1},
+                )
+            }
 
-            # 삭제 전 감사 기록용 조회
-            docs = list(collection.find(query, {"id": 1, "name": 1, "region": 1, "_id": 0}))
-            for doc in docs:
-                summaries.append({
-                    "contentId": doc.get("id", ""),
-                    "name": doc.get("name", ""),
-                    "region": doc.get("region", ""),
-                    "action": "festival_deleted",
-                    "lang": lang,
-                    "syncDate": sync_date,
-                })
-
-            if not docs:
-                print(f"  [MongoDB] {col_name}: 삭제 대상 EV 문서 없음")
-                continue
+            ops = []
+            col_stats = {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+            for poi in pois:
+                content_hash = _content_hash(poi)
+                previous = stored.get(poi["id"])
+                if previous is not None and previous.get("contentHash") == content_hash:
+                    col_stats["unchanged"] += 1
+                    continue
+                action = "festival_created" if previous is None else "festival_updated"
+                col_stats[action.split("_")[1]] += 1
+                ops.append(
+                    ReplaceOne({"id": poi["id"]}, {**poi, "contentHash": content_hash}, upsert=True)
+                )
+                summaries.append(_summary(poi, action, lang))
+
+            fetched_ids = {poi["id"] for poi in pois}
+            vanished = [doc for doc_id, doc in stored.items() if doc_id not in fetched_ids]
+
+            if ops:
+                print(f"  [MongoDB] {col_name}: 행사 {len(ops)}건 저장 시작...")
+                _bulk_write_batched(collection, ops)
+
+            if vanished:
+                vanished_ids = [doc["id"] for doc in vanished]
+                for attempt in range(1, MAX_RETRIES + 1):
+                    try:
+                        result = collection.delete_many(
+                            {"id": {"$in": vanished_ids}, "source.lcls.0": "EV"}
+                        )
+                        col_stats["deleted"] = result.deleted_count
+                        break
+                    except AutoReconnect:
+                        if attempt == MAX_RETRIES:
+                            raise
+                        wait = BATCH_DELAY * attempt * 2
+                        print(f"    연결 끊김, {wait:.0f}초 후 재시도 ({attempt}/{MAX_RETRIES})...")
+                        time.sleep(wait)
+                summaries.extend(_summary(doc, "festival_deleted", lang) for doc in vanished)
+
+            stats[col_name] = col_stats
+            print(
+                f"  [MongoDB] {col_name}: 신규 {col_stats['created']}건, 변경 {col_stats['updated']}건, "
+                f"삭제 {col_stats['deleted']}건, 변경 없음 {col_stats['unchanged']}건"
+            )
+    finally:
+        client.close()
+
+    return stats, summaries
+
+
+def save_festival_calendar_to_mongodb(
+    calendars: dict[str, dict[str, dict[str, list[str]]]], db_name: str = "korea_tourism"
+) -> dict[str, int]:
+    """지역별/일자별 행사 캘린더를 festival_calendar 컬렉션에 저장한다.
+
+    문서 구조:
+    {
+        "_id": "kr:busan:2026-10-19",
+        "lang": "kr",
+        "region": "busan",
+        "date": "2026-10-19",
+        "ids": ["2733967", ...]
+    }
+
+    언어별로 전달된 캘린더가 전체 상태이므로, 캘린더에 없는 해당 언어 문서는 삭제한다.
+
+    Args:
+        calendars: {"kr": build_festival_calendar() 결과, "en": ...}
+        db_name: MongoDB 데이터베이스 이름
+
+    Returns:
+        언어별 저장 문서 수 {"kr": N, "en": N}
+    """
+    client = _get_client()
+    db = client[db_name]
+    stats: dict[str, int] = {}
 
+    try:
+        collection = db["festival_calendar"]
+        collection.create_index([("lang", 1), ("region", 1), ("date", 1)], name="lang_region_date")
+
+        for lang, calendar in calendars.items():
+            docs = [
+                {"_id": f"{lang}:{region}:{day}", "lang": lang, "region": region, "date": day, "ids": ids}
+                for region, days in calendar.items()
+                for day, ids in days.items()
+            ]
+            if docs:
+                ops = [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs]
+                print(f"  [MongoDB] festival_calendar: {lang} {len(ops)}건 저장 시작...")
+                _bulk_write_batched(collection, ops)
+
+            keep_ids = [doc["_id"] for doc in docs]
             for attempt in range(1, MAX_RETRIES + 1):
                 try:
-                    result = collection.delete_many(query)
-                    stats[col_name] = result.deleted_count
-                    print(f"  [MongoDB] {col_name}: EV 문서 {result.deleted_count}건 삭제 완료")
+                    result = collection.delete_many({"lang": lang, "_id": {"$nin": keep_ids}})
                     break
                 except AutoReconnect:
                     if attempt == MAX_RETRIES:
@@ -344,10 +571,129 @@ def delete_event_pois_from_mongodb(
                     wait = BATCH_DELAY * attempt * 2
                     print(f"    연결 끊김, {wait:.0f}초 후 재시도 ({attempt}/{MAX_RETRIES})...")
                     time.sleep(wait)
+            stats[lang] = len(docs)
+            print(
+                f"  [MongoDB] festival_calendar: {lang} {len(docs)}건 저장, "
+                f"지난 일자 {result.deleted_count}건 삭제"
+            )
     finally:
         client.close()
 
-    return stats, summaries
+    return stats
+
+
+def save_poi_clusters_to_mongodb(
+    changes: dict[str, dict], db_name: str = "korea_tourism"
+) -> dict[str, dict[str, int]]:
+    """줌별 POI 클러스터를 poi_clusters 컬렉션에 반영한다.
+
+    문서 구조는 src/transformers/poi_clusters.py 참고 (_id: "lang:zoom:cx:cy").
+
+    - 전체 생성(full): 모든 문서를 교체 저장한 뒤 buildId가 다른 해당 언어 문서를 삭제
+    - 증분 갱신: 바뀐 칸 문서만 교체 저장하고 비게 된 칸 문서를 삭제
+
+    Args:
+        changes: {"kr": build_clusters() 또는 update_clusters() 결과, "en": ...}
+        db_name: MongoDB 데이터베이스 이름
+
+    Returns:
+        언어별 {"upserted": N, "deleted": N}
+    """
+    client = _get_client()
+    db = client[db_name]
+    stats: dict[str, dict[str, int]] = {}
+
+    try:
+        collection = db["poi_clusters"]
+        collection.create_index(
+            [("lang", 1), ("zoom", 1), ("location", "2dsphere")], name="lang_zoom_location"
+        )
+
+        for lang, change in changes.items():
+            docs = change["upserts"]
+            if docs:
+                ops = [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs]
+                print(f"  [MongoDB] poi_clusters: {lang} {len(ops)}건 저장 시작...")
+                _bulk_write_batched(collection, ops)
+
+            if change["full"]:
+                query = {"lang": lang, "buildId": {"$ne": change["buildId"]}}
+            else:
+                query = {"_id": {"$in": change["deleted"]}}
+            deleted = 0
+            if change["full"] or change["deleted"]:
+                for attempt in range(1, MAX_RETRIES + 1):
+                    try:
+                        deleted = collection.delete_many(query).deleted_count
+                        break
+                    except AutoReconnect:
+                        if attempt == MAX_RETRIES:
+                            raise
+                        wait = BATCH_DELAY * attempt * 2
+                        print(f"    연결 끊김, {wait:.0f}초 후 재시도 ({attempt}/{MAX_RETRIES})...")
+                        time.sleep(wait)
+            stats[lang] = {"upserted": len(docs), "deleted": deleted}
+            print(f"  [MongoDB] poi_clusters: {lang} {len(docs)}건 저장, {deleted}건 삭제")
+    finally:
+        client.close()
+
+    return stats
+
+
+def save_poi_links_to_mongodb(change: dict, db_name: str = "korea_tourism") -> dict[str, int]:
+    """국문↔영문 POI 연결을 poi_links 컬렉션에 반영한다.
+
+    문서 구조:
+    {
+        "_id": "126508",      # kr contentId
+        "kr": "126508",
+        "en": "264337",
+        "score": 0.93,
+        "distanceM": 4.2
+    }
+
+    Args:
+        change: update_poi_links() 결과 — full이면 upserts에 없는 문서를 모두 삭제,
+                아니면 deleted에 있는 문서만 삭제
+        db_name: MongoDB 데이터베이스 이름
+
+    Returns:
+        {"upserted": N, "deleted": N}
+    """
+    client = _get_client()
+    db = client[db_name]
+
+    try:
+        collection = db["poi_links"]
+        collection.create_index("en", name="en")
+
+        docs = [{"_id": link["kr"], **link} for link in change["upserts"]]
+        if docs:
+            ops = [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs]
+            print(f"  [MongoDB] poi_links: {len(ops)}건 저장 시작...")
+            _bulk_write_batched(collection, ops)
+
+        if change["full"]:
+            query = {"_id": {"$nin": [doc["_id"] for doc in docs]}}
+        else:
+            query = {"_id": {"$in": change["deleted"]}}
+        deleted = 0
+        if change["full"] or change["deleted"]:
+            for attempt in range(1, MAX_RETRIES + 1):
+                try:
+                    deleted = collection.delete_many(query).deleted_count
+                    break
+                except AutoReconnect:
+                    if attempt == MAX_RETRIES:
+                        raise
+                    wait = BATCH_DELAY * attempt * 2
+                    print(f"    연결 끊김, {wait:.0f}초 후 재시도 ({attempt}/{MAX_RETRIES})...")
+                    time.sleep(wait)
+        print(f"  [MongoDB] poi_links: {len(docs)}건 저장, {deleted}건 삭제")
+    finally:
+        client.close()
+
+    return {"upserted": len(docs), "deleted": deleted}
 
 
 def delete_pois_from_mongodb(
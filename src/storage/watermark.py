@@ -0,0 +1,115 @@
+"""Step 4 동기화 워터마크 (언어별 마지막 반영 modifiedtime) 저장소.
+
+워터마크 구조:
+{
+    "modifiedtime": "20261018153012",  # MongoDB에 반영 완료된 원본 수정시각 중 최댓값 (YYYYMMDDHHMMSS)
+    "ids": ["2733967", ...],           # 위 시각에 반영된 contentId (같은 시각 항목 재처리 방지)
+    "updatedAt": "2026-10-19T05:00:00"
+}
+
+로컬 output/sync_watermark.json과 MongoDB sync_state 컬렉션(_id: "watermark:{lang}")에 함께 저장한다.
+로드 시 둘 중 더 최신 값을 사용하므로 로컬 파일이 없는 환경(GitHub Actions)에서도 이어서 동기화된다.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from pymongo.errors import AutoReconnect
+
+from src.storage.mongodb import BATCH_DELAY, MAX_RETRIES, _get_client
+
+WATERMARK_PATH = Path(__file__).resolve().parent.parent.parent / "output" / "sync_watermark.json"
+
+
+def _newer(a: dict | None, b: dict | None) -> dict | None:
+    """두 워터마크 중 modifiedtime이 더 큰 쪽을 반환한다 (같으면 ids 합집합)."""
+    if not a:
+        return b
+    if not b:
+        return a
+    a_mt, b_mt = a.get("modifiedtime", ""), b.get("modifiedtime", "")
+    if a_mt == b_mt:
+        return {**b, "ids": sorted(set(a.get("ids", [])) | set(b.get("ids", [])))}
+    return b if b_mt > a_mt else a
+
+
+def _load_local() -> dict[str, dict]:
+    if not WATERMARK_PATH.exists():
+        return {}
+    return json.loads(WATERMARK_PATH.read_text(encoding="utf-8"))
+
+
+def _load_from_mongodb(db_name: str = "korea_tourism") -> dict[str, dict]:
+    client = _get_client()
+    try:
+        marks: dict[str, dict] = {}
+        for doc in client[db_name]["sync_state"].find({"_id": {"$regex": "^watermark:"}}):
+            lang = doc.pop("_id").split(":", 1)[1]
+            marks[lang] = doc
+        return marks
+    finally:
+        client.close()
+
+
+def load_watermarks() -> dict[str, dict]:
+    """언어별 워터마크를 로드한다 (로컬 파일과 MongoDB 중 최신 값).
+
+    Returns:
+        {"kr": 워터마크, "en": 워터마크} — 저장된 적이 없는 언어는 제외
+    """
+    local = _load_local()
+    remote: dict[str, dict] = {}
+    if os.environ.get("MONGODB_URI"):
+        try:
+            remote = _load_from_mongodb()
+        except Exception as e:
+            print(f"[워터마크] [경고] MongoDB 조회 실패, 로컬 파일 사용: {e}")
+
+    marks: dict[str, dict] = {}
+    for lang in ("kr", "en"):
+        mark = _newer(local.get(lang), remote.get(lang))
+        if mark:
+            marks[lang] = mark
+    return marks
+
+
+def save_watermarks(marks: dict[str, dict], db_name: str = "korea_tourism") -> Path:
+    """워터마크를 로컬 파일과 MongoDB(MONGODB_URI 설정 시)에 저장한다.
+
+    MongoDB 반영(upsert/삭제)이 끝난 뒤에만 호출해야 한다.
+    기존 워터마크보다 이전 값은 저장하지 않는다 (--modifiedtime 재처리 시 역행 방지).
+    """
+    current = load_watermarks()
+    updated_at = datetime.now().isoformat(timespec="seconds")
+    marks = {
+        lang: {**_newer(current.get(lang), mark), "updatedAt": updated_at}
+        for lang, mark in marks.items()
+    }
+
+    local = _load_local()
+    local.update(marks)
+    WATERMARK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    WATERMARK_PATH.write_text(json.dumps(local, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    if os.environ.get("MONGODB_URI") and marks:
+        client = _get_client()
+        try:
+            col = client[db_name]["sync_state"]
+            for lang, mark in marks.items():
+                for attempt in range(1, MAX_RETRIES + 1):
+                    try:
+                        col.replace_one({"_id": f"watermark:{lang}"}, mark, upsert=True)
+                        break
+                    except AutoReconnect:
+                        if attempt == MAX_RETRIES:
+                            raise
+                        wait = BATCH_DELAY * attempt * 2
+                        print(f"    연결 끊김, {wait:.0f}초 후 재시도 ({attempt}/{MAX_RETRIES})...")
+                        time.sleep(wait)
+        finally:
+            client.close()
+
+    return WATERMARK_PATH
@@ -0,0 +1,270 @@
+"""POI/지역/분류 이름 자동완성 인덱스 (output/autocomplete_{lang}.pickle).
+
+이름을 호환 자모 낱자열 키와 초성 키로 바꿔 정렬 배열에 넣고, 접두어 범위를 이분 탐색으로 찾는다.
+
+- 자모 키: '경복궁' → 'ㄱㅕㅇㅂㅗㄱㄱㅜㅇ' — 입력 중인 '경보', '경ㅂ'도 접두어로 일치
+- 초성 키: '경복궁' → 'ㄱㅂㄱ' — 자음 낱자만 입력하면 초성 키에서 찾는다
+- 여러 단어 이름은 앞쪽 AUTOCOMPLETE_MAX_WORDS개 단어 시작 위치마다 키를 만든다 ('서울 한옥마을' → '한옥마을'로도 일치)
+- 영문/숫자는 소문자(악센트 제거)로 그대로 키에 들어간다
+
+항목은 점수 순으로 번호를 매기므로 접두어 범위의 상위 k개는 가장 작은 번호 k개다.
+범위가 AUTOCOMPLETE_SCAN_LIMIT를 넘는 짧은 접두어는 상위 AUTOCOMPLETE_TOP_K개를 미리 계산해 둔다.
+
+점수:
+- 지역(regions.json): 3.0
+- 분류(categories.json): 대분류 2.0 / 중분류 1.9 / 소분류 1.8
+- POI: 정보 충실도 0~1 (대표 이미지, 설명, 좌표, 연락처, 홈페이지, 이미지 2장 이상)
+
+사용 예:
+    index = AutocompleteIndex.load("kr")
+    index.suggest("ㄱㅂㄱ")                    # [{"type": "poi", "id", "name", "score"}, ...]
+    index.suggest("경복", k=5, types=("poi",))
+"""
+
+import heapq
+import json
+import pickle
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+from src.transformers.hangul import chosung, is_chosung, to_jamo
+from src.transformers.pois import OUTPUT_DIR
+from src.transformers.search_index import _load_source_pois
+
+AUTOCOMPLETE_VERSION = 1
+AUTOCOMPLETE_TOP_K = 20
+AUTOCOMPLETE_SCAN_LIMIT = 256
+AUTOCOMPLETE_MAX_WORDS = 4
+
+TYPES = ("region", "category", "poi")
+
+_WORD_RE = re.compile(r"[0-9a-z가-힣ㄱ-ㅣ]+")
+# 접두어 범위의 끝 (모든 키보다 큰 문자)
+_MAX_CHAR = "\U0010ffff"
+
+_POI_COMPLETENESS = (
+    ("thumbnail", 0.2),
+    ("description", 0.25),
+    ("coordinates", 0.2),
+    ("contact", 0.1),
+    ("website", 0.1),
+    ("images", 0.15),
+)
+
+
+def autocomplete_path(lang: str) -> Path:
+    return OUTPUT_DIR / f"autocomplete_{lang}.pickle"
+
+
+def _words(text: str) -> list[str]:
+    """소문자 + 라틴 악센트 제거 후 단어 목록.
+
+    호환 자모('ㄱ')가 첫가끝 자모로 바뀌지 않도록 NFKD 대신 NFD로 분해하고 NFC로 다시 조합한다.
+    """
+    text = unicodedata.normalize("NFD", text.lower())
+    text = unicodedata.normalize("NFC", "".join(ch for ch in text if not unicodedata.combining(ch)))
+    return _WORD_RE.findall(text)
+
+
+def _keys(name: str) -> tuple[set[str], set[str]]:
+    """이름 → (자모 키, 초성 키)."""
+    words = _words(name)
+    jamo_keys, chosung_keys = set(), set()
+    for start in range(min(len(words), AUTOCOMPLETE_MAX_WORDS)):
+        text = "".join(words[start:])
+        jamo_keys.add(to_jamo(text))
+        initials = chosung(text)
+        if initials != text:
+            chosung_keys.add(initials)
+    return jamo_keys, chosung_keys
+
+
+def poi_score(poi: dict) -> float:
+    """POI 정보 충실도 (0~1)."""
+    coords = poi.get("coordinates") or {}
+    present = {
+        "thumbnail": bool(poi.get("thumbnail")),
+        "description": bool(poi.get("description")),
+        "coordinates": bool(coords.get("lat")) and bool(coords.get("lng")),
+        "contact": bool(poi.get("contact")),
+        "website": bool(poi.get("website")),
+        "images": len(poi.get("images") or []) >= 2,
+    }
+    return round(sum(weight for field, weight in _POI_COMPLETENESS if present[field]), 2)
+
+
+class _Part:
+    """항목 유형 하나의 정렬 키 배열 (자모/초성)."""
+
+    def __init__(self, entries: list[tuple[str, str, float]], modes: dict[str, tuple]) -> None:
+        # entries: 점수 순 (id, name, score), modes: {"jamo"|"chosung": (키 목록, 항목 번호 array, 상위 k 캐시)}
+        self.entries = entries
+        self.modes = modes
+
+    @classmethod
+    def build(cls, items: list[tuple[str, str, float]]) -> "_Part":
+        entries = sorted(items, key=lambda e: (-e[2], len(e[1]), e[1], e[0]))
+        pairs: dict[str, list[tuple[str, int]]] = {"jamo": [], "chosung": []}
+        for number, (_, name, _) in enumerate(entries):
+            jamo_keys, chosung_keys = _keys(name)
+            pairs["jamo"].extend((key, number) for key in jamo_keys)
+            pairs["chosung"].extend((key, number) for key in chosung_keys)
+
+        modes = {}
+        for mode, mode_pairs in pairs.items():
+            mode_pairs.sort()
+            keys = [key for key, _ in mode_pairs]
+            numbers = array("I", (number for _, number in mode_pairs))
+            modes[mode] = (keys, numbers, _top_prefixes(keys, numbers))
+        return cls(entries, modes)
+
+    def lookup(self, mode: str, prefix: str, k: int) -> list[int]:
+        """접두어에 일치하는 항목 번호 (점수 순, 중복 제거) 최대 k개."""
+        keys, numbers, top = self.modes[mode]
+        cached = top.get(prefix)
+        if cached is not None and k <= AUTOCOMPLETE_TOP_K:
+            return list(cached[:k])
+        lo = bisect_left(keys, prefix)
+        hi = bisect_left(keys, prefix + _MAX_CHAR, lo)
+        return heapq.nsmallest(k, set(numbers[lo:hi]))
+
+
+def _top_prefixes(keys: list[str], numbers: array) -> dict[str, tuple[int, ...]]:
+    """범위가 AUTOCOMPLETE_SCAN_LIMIT를 넘는 모든 접두어의 상위 AUTOCOMPLETE_TOP_K개 항목 번호."""
+    top: dict[str, tuple[int, ...]] = {}
+    # (범위 시작, 끝, 공통 접두어 길이)
+    stack = [(0, len(keys), 0)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        i = lo
+        while i < hi and len(keys[i]) <= depth:
+            i += 1
+        while i < hi:
+            prefix = keys[i][: depth + 1]
+            j = bisect_left(keys, prefix[:-1] + chr(ord(prefix[-1]) + 1), i, hi)
+            if j - i > AUTOCOMPLETE_SCAN_LIMIT:
+                top[prefix] = tuple(heapq.nsmallest(AUTOCOMPLETE_TOP_K, set(numbers[i:j])))
+                stack.append((i, j, depth + 1))
+            i = j
+    return top
+
+
+class AutocompleteIndex:
+    """유형별(region/category/poi) 자동완성 인덱스."""
+
+    def __init__(self, lang: str, parts: dict[str, _Part]) -> None:
+        self.lang = lang
+        self.parts = parts
+
+    @classmethod
+    def build(
+        cls, lang: str, pois: list[dict], regions: list[dict], categories: list[dict]
+    ) -> "AutocompleteIndex":
+        """POI 목록, regions.json, categories.json 내용으로 인덱스를 만든다."""
+        name_key = "ko" if lang == "kr" else "en"
+
+        category_items: dict[str, tuple[str, str, float]] = {}
+
+        def walk(nodes: list[dict], depth: int) -> None:
+            for node in nodes:
+                name = node["name"].get(name_key, "")
+                # 같은 이름이 여러 단계에 있으면 상위 분류만 남긴다 ('호텔' 중분류/소분류)
+                if name and name not in category_items:
+                    category_items[name] = (node["code"], name, round(2.0 - 0.1 * depth, 1))
+                walk(node.get("list") or [], depth + 1)
+
+        walk(categories, 0)
+        parts = {
+            "region": _Part.build([
+                (region["code"], region["name"].get(name_key, ""), 3.0)
+                for region in regions
+                if region["name"].get(name_key)
+            ]),
+            "category": _Part.build(list(category_items.values())),
+            "poi": _Part.build([
+                (poi["id"], poi.get("name", ""), poi_score(poi)) for poi in pois if poi.get("name")
+            ]),
+        }
+        return cls(lang, parts)
+
+    def __len__(self) -> int:
+        return sum(len(part.entries) for part in self.parts.values())
+
+    def save(self, path: Path | None = None) -> Path:
+        path = path or autocomplete_path(self.lang)
+        state = {
+            "version": AUTOCOMPLETE_VERSION,
+            "lang": self.lang,
+            "parts": {t: (part.entries, part.modes) for t, part in self.parts.items()},
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp_path.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, lang: str, path: Path | None = None) -> "AutocompleteIndex":
+        """저장된 인덱스를 로드한다 (버전이 다르면 ValueError)."""
+        state = pickle.loads((path or autocomplete_path(lang)).read_bytes())
+        if state.get("version") != AUTOCOMPLETE_VERSION:
+            raise ValueError(f"자동완성 인덱스 버전 불일치: {state.get('version')}")
+        parts = {t: _Part(entries, modes) for t, (entries, modes) in state["parts"].items()}
+        return cls(state["lang"], parts)
+
+    def suggest(self, query: str, k: int = 10, types: tuple[str, ...] = TYPES) -> list[dict]:
+        """입력 중인 검색어의 자동완성 후보를 점수 순으로 k개 반환한다.
+
+        자음 낱자로만 된 검색어('ㄱㅂㄱ')는 초성 키, 그 밖에는 자모 키에서 접두어로 찾는다.
+
+        Returns:
+            [{"type": "region"|"category"|"poi", "id": ..., "name": ..., "score": ...}, ...]
+            (점수 내림차순, 같은 점수는 짧은 이름 순)
+        """
+        text = "".join(_words(query))
+        if not text:
+            return []
+        if is_chosung(text):
+            mode, prefix = "chosung", text
+        else:
+            mode, prefix = "jamo", to_jamo(text)
+
+        found = []
+        for order, type_ in enumerate(TYPES):
+            part = self.parts.get(type_)
+            if part is None or type_ not in types:
+                continue
+            for number in part.lookup(mode, prefix, k):
+                content_id, name, score = part.entries[number]
+                found.append(((-score, len(name), order, number), type_, content_id, name, score))
+        found.sort(key=lambda f: f[0])
+        return [
+            {"type": type_, "id": content_id, "name": name, "score": score}
+            for _, type_, content_id, name, score in found[:k]
+        ]
+
+
+def _load_json(path: Path) -> list[dict]:
+    if not path.exists():
+        print(f"[Transform] {path} 파일 없음, 건너뜀")
+        return []
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def build_autocomplete(lang: str) -> Path | None:
+    """pois_{lang}.json(+ 상세), regions.json, categories.json으로 자동완성 인덱스를 만들어 저장한다.
+
+    세 파일이 모두 없으면 None.
+    """
+    pois = _load_source_pois(lang) or []
+    regions = _load_json(OUTPUT_DIR / "regions.json")
+    categories = _load_json(OUTPUT_DIR / "categories.json")
+    if not pois and not regions and not categories:
+        return None
+    index = AutocompleteIndex.build(lang, pois, regions, categories)
+    path = index.save()
+    counts = ", ".join(f"{t} {len(part.entries)}건" for t, part in index.parts.items())
+    print(f"[Transform] [{lang}] 자동완성 인덱스: {counts}")
+    return path
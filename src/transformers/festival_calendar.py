@@ -0,0 +1,69 @@
+"""행사 POI → 지역별/일자별 행사 캘린더 (festival_calendar_{lang}.json) 변환"""
+
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+OUTPUT_DIR = Path(__file__).resolve().parent.parent.parent / "output"
+
+
+def _parse_date(value: str) -> date | None:
+    """'2026-10-19' 또는 '20261019' → date (형식 오류 시 None)."""
+    try:
+        if len(value) == 8 and value.isdigit():
+            return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def build_festival_calendar(
+    pois: list[dict], window_start: str, window_end: str
+) -> dict[str, dict[str, list[str]]]:
+    """행사 POI를 지역별 → 일자별 contentId 목록으로 펼친다.
+
+    행사 기간(eventStartDate ~ eventEndDate)을 조회 기간과 겹치는 날짜로 잘라서 기록한다.
+    조회 기간 밖의 날짜는 수신하지 않은 행사가 있을 수 있으므로 포함하지 않는다.
+
+    Args:
+        pois: 상세 병합이 끝난 행사 POI 목록
+        window_start: 조회 시작일 (YYYYMMDD)
+        window_end: 조회 종료일 (YYYYMMDD)
+
+    Returns:
+        {region: {"YYYY-MM-DD": [contentId, ...]}} — 지역/일자/contentId 모두 정렬
+    """
+    lo, hi = _parse_date(window_start), _parse_date(window_end)
+    calendar: dict[str, dict[str, set[str]]] = {}
+
+    for poi in pois:
+        region = poi.get("region", "")
+        start = _parse_date(poi.get("eventStartDate", ""))
+        end = _parse_date(poi.get("eventEndDate", ""))
+        if not region or start is None or end is None:
+            continue
+        day, last = max(start, lo or start), min(end, hi or end)
+        while day <= last:
+            calendar.setdefault(region, {}).setdefault(day.isoformat(), set()).add(poi["id"])
+            day += timedelta(days=1)
+
+    return {
+        region: {day: sorted(ids) for day, ids in sorted(days.items())}
+        for region, days in sorted(calendar.items())
+    }
+
+
+def save_festival_calendar(calendars: dict[str, dict]) -> list[Path]:
+    """언어별 캘린더를 output/festival_calendar_{lang}.json으로 저장."""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    saved: list[Path] = []
+
+    for lang, calendar in calendars.items():
+        path = OUTPUT_DIR / f"festival_calendar_{lang}.json"
+        path.write_text(
+            json.dumps(calendar, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        saved.append(path)
+
+    return saved
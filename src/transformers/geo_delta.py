@@ -0,0 +1,37 @@
+"""Step 4/5 동기화 요약 → 좌표 변경분 (벡터 타일/클러스터 증분 갱신용)."""
+
+UPSERT_ACTIONS = ("updated", "festival_created", "festival_updated")
+REMOVE_ACTIONS = ("deleted", "festival_deleted")
+
+
+def geo_delta_from_summaries(summaries: list[dict]) -> dict[str, dict]:
+    """동기화 요약을 언어별 추가/변경 POI와 삭제 id로 정리한다.
+
+    같은 contentId의 요약이 여러 번 나오면 마지막 요약을 따른다.
+    추가/변경 POI는 _to_geojson_feature()에 넣을 수 있는 최소 필드만 가진다.
+
+    Returns:
+        {lang: {"upserts": {id: POI}, "removed": {id, ...}}}
+    """
+    deltas: dict[str, dict] = {}
+    for summary in summaries:
+        action = summary.get("action")
+        if action not in UPSERT_ACTIONS and action not in REMOVE_ACTIONS:
+            continue
+        content_id = summary["contentId"]
+        delta = deltas.setdefault(summary["lang"], {"upserts": {}, "removed": set()})
+        if action in REMOVE_ACTIONS:
+            delta["upserts"].pop(content_id, None)
+            delta["removed"].add(content_id)
+            continue
+        delta["removed"].discard(content_id)
+        delta["upserts"][content_id] = {
+            "id": content_id,
+            "slug": content_id,
+            "category": summary.get("category", ""),
+            "appCategory": summary.get("appCategory", ""),
+            "name": summary.get("name", ""),
+            "region": summary.get("region", ""),
+            "coordinates": summary.get("coordinates") or {"lat": 0.0, "lng": 0.0},
+        }
+    return deltas
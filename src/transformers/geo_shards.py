@@ -0,0 +1,246 @@
+"""pois_geo_{lang}.json → 지역별 GeoJSON/바이너리 샤드 + manifest 변환.
+
+출력 (output/geo/{lang}/):
+    {region}.geojson — 지역별 FeatureCollection (공백 없는 compact JSON)
+    {region}.kgeo    — 같은 Feature의 바이너리 인코딩 (아래 형식)
+    manifest.json    — 샤드별 건수/bbox/파일 크기 (클라이언트가 필요한 지역만 로드)
+
+지역 정보가 없는 POI는 "_none" 샤드에 넣는다.
+좌표가 (0, 0)인 POI(_safe_float 기본값)는 샤드에 포함하되 bbox 계산에서는 제외한다.
+
+.kgeo 형식 (geobuf 방식: 정수 양자화 좌표 + 델타 + varint):
+    magic "KGEO" | version u8 | precision u8 | region str | 카테고리 수 varint | 카테고리 str...
+    | Feature 수 varint | Feature...
+    Feature: Δlng zigzag varint | Δlat zigzag varint | 카테고리 index varint | id str | slug str | name str
+    str: UTF-8 바이트 길이 varint + 바이트, slug가 id와 같으면 빈 문자열로 기록
+좌표는 소수점 7자리(약 1cm)로 양자화하며, 7자리 이하 좌표는 디코딩 시 원래 float와 같다.
+"""
+
+import json
+from pathlib import Path
+
+from src.transformers.pois import OUTPUT_DIR
+
+GEO_DIR = OUTPUT_DIR / "geo"
+
+KGEO_MAGIC = b"KGEO"
+KGEO_VERSION = 1
+KGEO_PRECISION = 7
+
+NO_REGION = "_none"
+
+_SCALE = 10**KGEO_PRECISION
+
+
+def _write_varint(buf: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def _write_str(buf: bytearray, text: str) -> None:
+    raw = text.encode("utf-8")
+    _write_varint(buf, len(raw))
+    buf.extend(raw)
+
+
+def _read_str(data: bytes, pos: int) -> tuple[str, int]:
+    length, pos = _read_varint(data, pos)
+    return data[pos : pos + length].decode("utf-8"), pos + length
+
+
+def encode_geo_shard(region: str, features: list[dict]) -> bytes:
+    """지역 샤드의 Feature 목록 → .kgeo 바이트."""
+    categories = sorted({f["properties"]["category"] for f in features})
+    category_index = {name: i for i, name in enumerate(categories)}
+
+    buf = bytearray(KGEO_MAGIC)
+    buf.append(KGEO_VERSION)
+    buf.append(KGEO_PRECISION)
+    _write_str(buf, region)
+    _write_varint(buf, len(categories))
+    for name in categories:
+        _write_str(buf, name)
+
+    _write_varint(buf, len(features))
+    prev_lng = prev_lat = 0
+    for feature in features:
+        lng, lat = feature["geometry"]["coordinates"]
+        q_lng, q_lat = round(lng * _SCALE), round(lat * _SCALE)
+        _write_varint(buf, _zigzag(q_lng - prev_lng))
+        _write_varint(buf, _zigzag(q_lat - prev_lat))
+        prev_lng, prev_lat = q_lng, q_lat
+
+        props = feature["properties"]
+        _write_varint(buf, category_index[props["category"]])
+        _write_str(buf, props["id"])
+        _write_str(buf, "" if props["slug"] == props["id"] else props["slug"])
+        _write_str(buf, props["name"])
+
+    return bytes(buf)
+
+
+def decode_geo_shard(data: bytes) -> dict:
+    """.kgeo 바이트 → GeoJSON FeatureCollection (pois_geo_{lang}.json과 같은 Feature 구조)."""
+    if data[:4] != KGEO_MAGIC or data[4] != KGEO_VERSION:
+        raise ValueError("지원하지 않는 .kgeo 형식입니다")
+    scale = 10 ** data[5]
+    pos = 6
+    region, pos = _read_str(data, pos)
+    region_value = "" if region == NO_REGION else region
+
+    count, pos = _read_varint(data, pos)
+    categories = []
+    for _ in range(count):
+        name, pos = _read_str(data, pos)
+        categories.append(name)
+
+    count, pos = _read_varint(data, pos)
+    features = []
+    lng = lat = 0
+    for _ in range(count):
+        delta, pos = _read_varint(data, pos)
+        lng += _unzigzag(delta)
+        delta, pos = _read_varint(data, pos)
+        lat += _unzigzag(delta)
+        index, pos = _read_varint(data, pos)
+        content_id, pos = _read_str(data, pos)
+        slug, pos = _read_str(data, pos)
+        name, pos = _read_str(data, pos)
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lng / scale, lat / scale]},
+            "properties": {
+                "id": content_id,
+                "slug": slug or content_id,
+                "category": categories[index],
+                "name": name,
+                "region": region_value,
+            },
+        })
+
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _bbox(features: list[dict]) -> list[float] | None:
+    """[minLng, minLat, maxLng, maxLat] — (0, 0) 좌표는 제외 (모두 (0, 0)이면 None)."""
+    points = [
+        f["geometry"]["coordinates"]
+        for f in features
+        if f["geometry"]["coordinates"] != [0.0, 0.0]
+    ]
+    if not points:
+        return None
+    lngs = [p[0] for p in points]
+    lats = [p[1] for p in points]
+    return [min(lngs), min(lats), max(lngs), max(lats)]
+
+
+def group_by_region(features: list[dict]) -> dict[str, list[dict]]:
+    """Feature를 지역 slug별로 묶는다 (원래 순서 유지, 지역 없음은 "_none")."""
+    shards: dict[str, list[dict]] = {}
+    for feature in features:
+        region = feature["properties"].get("region") or NO_REGION
+        shards.setdefault(region, []).append(feature)
+    return dict(sorted(shards.items()))
+
+
+def save_geo_shards(lang: str) -> Path | None:
+    """pois_geo_{lang}.json을 지역별 샤드로 나눠 output/geo/{lang}/에 저장하고 manifest 경로를 반환한다.
+
+    이전 실행에서 만들어졌지만 이번에 없는 지역의 샤드 파일은 삭제한다.
+    pois_geo_{lang}.json이 없으면 None.
+    """
+    geo_path = OUTPUT_DIR / f"pois_geo_{lang}.json"
+    if not geo_path.exists():
+        print(f"[Transform] {geo_path} 파일 없음, 건너뜀")
+        return None
+
+    features = json.loads(geo_path.read_text(encoding="utf-8"))["features"]
+    shard_dir = GEO_DIR / lang
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    shards: dict[str, dict] = {}
+    written: set[str] = {"manifest.json"}
+    for region, region_features in group_by_region(features).items():
+        geojson_name, binary_name = f"{region}.geojson", f"{region}.kgeo"
+        geojson_bytes = json.dumps(
+            {"type": "FeatureCollection", "features": region_features},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        binary_bytes = encode_geo_shard(region, region_features)
+        (shard_dir / geojson_name).write_bytes(geojson_bytes)
+        (shard_dir / binary_name).write_bytes(binary_bytes)
+        written.update((geojson_name, binary_name))
+
+        shards[region] = {
+            "count": len(region_features),
+            "unlocated": sum(
+                1 for f in region_features if f["geometry"]["coordinates"] == [0.0, 0.0]
+            ),
+            "bbox": _bbox(region_features),
+            "geojson": geojson_name,
+            "geojsonBytes": len(geojson_bytes),
+            "binary": binary_name,
+            "binaryBytes": len(binary_bytes),
+        }
+
+    for path in shard_dir.iterdir():
+        if path.name not in written and path.suffix in (".geojson", ".kgeo"):
+            path.unlink()
+
+    manifest = {
+        "lang": lang,
+        "count": len(features),
+        "bbox": _bbox(features),
+        "binaryFormat": {"name": "kgeo", "version": KGEO_VERSION, "precision": KGEO_PRECISION},
+        "shards": shards,
+    }
+    manifest_path = shard_dir / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return manifest_path
+
+
+def load_geo_manifest(lang: str) -> dict:
+    """output/geo/{lang}/manifest.json을 로드한다."""
+    return json.loads((GEO_DIR / lang / "manifest.json").read_text(encoding="utf-8"))
+
+
+def regions_in_bbox(manifest: dict, bbox: list[float]) -> list[str]:
+    """[minLng, minLat, maxLng, maxLat]와 겹치는 샤드의 지역 slug 목록."""
+    min_lng, min_lat, max_lng, max_lat = bbox
+    return [
+        region
+        for region, shard in manifest["shards"].items()
+        if shard["bbox"] is not None
+        and shard["bbox"][0] <= max_lng
+        and shard["bbox"][2] >= min_lng
+        and shard["bbox"][1] <= max_lat
+        and shard["bbox"][3] >= min_lat
+    ]
+
+
+def load_geo_shard(lang: str, region: str) -> dict:
+    """지역 샤드(.kgeo)를 FeatureCollection으로 로드한다."""
+    return decode_geo_shard((GEO_DIR / lang / f"{region}.kgeo").read_bytes())
@@ -0,0 +1,89 @@
+"""한글 음절 분해 / 자모·초성 키 / 로마자 표기 유틸리티."""
+
+import re
+import unicodedata
+
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+
+# 국어의 로마자 표기법 (음운 변화 미적용, 음절 단위 치환)
+_RR_INITIAL = ["g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s", "ss", "", "j", "jj", "ch", "k", "t", "p", "h"]
+_RR_MEDIAL = [
+    "a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae",
+    "oe", "yo", "u", "wo", "we", "wi", "yu", "eu", "ui", "i",
+]
+_RR_FINAL = [
+    "", "k", "k", "k", "n", "n", "n", "t", "l", "k", "m", "l", "l", "l",
+    "p", "l", "m", "p", "p", "t", "t", "ng", "t", "t", "k", "t", "p", "t",
+]
+
+# 호환 자모 (입력기에서 낱자로 입력되는 문자)
+_JAMO_INITIAL = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JAMO_MEDIAL = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JAMO_FINAL = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+# 겹받침/이중모음은 입력 순서대로 낱자를 나눈다 ('닭' 입력 중 '달' → ㄷㅏㄹ 이 ㄷㅏㄹㄱ의 접두어가 되도록)
+_JAMO_SPLIT = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+_CONSONANTS = frozenset("ㄱㄲㄳㄴㄵㄶㄷㄸㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅃㅄㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
+
+
+def decompose(ch: str) -> tuple[int, int, int] | None:
+    """완성형 한글 음절 → (초성, 중성, 종성) 번호 (한글 음절이 아니면 None)."""
+    code = ord(ch)
+    if not _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+        return None
+    code -= _SYLLABLE_BASE
+    return code // 588, (code % 588) // 28, code % 28
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 호환 자모 낱자열로 푼다 (한글 외 문자는 그대로).
+
+    '경복궁' → 'ㄱㅕㅇㅂㅗㄱㄱㅜㅇ', '닭' → 'ㄷㅏㄹㄱ'
+    """
+    out = []
+    for ch in text:
+        parts = decompose(ch)
+        if parts is not None:
+            ch = _JAMO_INITIAL[parts[0]] + _JAMO_MEDIAL[parts[1]] + _JAMO_FINAL[parts[2]]
+        out.append("".join(_JAMO_SPLIT.get(j, j) for j in ch))
+    return "".join(out)
+
+
+def chosung(text: str) -> str:
+    """한글 음절을 초성으로 바꾼다 (한글 외 문자는 그대로). '경복궁' → 'ㄱㅂㄱ'"""
+    out = []
+    for ch in text:
+        parts = decompose(ch)
+        out.append(ch if parts is None else _JAMO_INITIAL[parts[0]])
+    return "".join(out)
+
+
+def is_chosung(text: str) -> bool:
+    """자음 낱자로만 이루어진 문자열인지 (초성 검색어 판정)."""
+    return bool(text) and all(ch in _CONSONANTS for ch in text)
+
+
+def romanize(text: str) -> str:
+    """한글을 로마자로 옮긴다 (한글 외 문자는 그대로).
+
+    음절 단위 치환만 하므로 '경복궁' → 'gyeongbokgung'처럼 대부분의 고유명사 표기와 일치하고,
+    연음/비음화 등 음운 변화가 반영된 영문 표기와는 일부 다를 수 있다.
+    """
+    out = []
+    for ch in text:
+        parts = decompose(ch)
+        if parts is None:
+            out.append(ch)
+        else:
+            out.append(_RR_INITIAL[parts[0]] + _RR_MEDIAL[parts[1]] + _RR_FINAL[parts[2]])
+    return "".join(out)
+
+
+def latin_key(text: str) -> str:
+    """비교용 키: 한글은 로마자로 옮기고 악센트 제거 후 영문 소문자/숫자만 남긴다."""
+    text = unicodedata.normalize("NFKD", romanize(text)).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]", "", text.lower())
@@ -0,0 +1,232 @@
+"""POI 줌별 클러스터 사전 계산 (output/clusters/{lang}/z{zoom}.json + poi_clusters 컬렉션).
+
+Web Mercator 화면 좌표를 줌마다 CLUSTER_CELL_PX 크기의 격자로 나눠, 같은 칸의 POI를 하나의 클러스터로 묶는다.
+줌 z의 칸은 줌 z+1의 2×2 칸을 합친 것이므로 클러스터가 줌 간에 계층을 이룬다 (supercluster의 격자 버전).
+
+클러스터 문서:
+{
+    "_id": "kr:10:3490:1588",            # lang:zoom:cx:cy
+    "lang": "kr",
+    "zoom": 10,
+    "cell": [3490, 1588],
+    "count": 12,
+    "location": {"type": "Point", "coordinates": [lng, lat]},  # 소속 POI 좌표 평균
+    "appCategories": {"culture": 5, "restaurant": 7},
+    "poiId": "2733967",                 # count == 1일 때만
+    "buildId": "20261019T050000"        # 전체 생성 시각 (증분 갱신 문서도 같은 값)
+}
+
+칸별 건수/좌표 합(정수 양자화)/appCategory 건수를 유지하므로 Step 4/5 변경분은
+이전 칸에서 빼고 새 칸에 더하는 것만으로 전체 재계산과 같은 결과가 된다.
+좌표가 0.0인 POI는 클러스터에 넣지 않는다.
+"""
+
+import json
+import math
+import pickle
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from src.config import CLUSTER_CELL_PX, CLUSTER_MAX_ZOOM, CLUSTER_MIN_ZOOM
+from src.transformers.pois import OUTPUT_DIR
+from src.transformers.vector_tiles import _mercator
+
+CLUSTERS_DIR = OUTPUT_DIR / "clusters"
+CLUSTER_STATE_VERSION = 1
+
+# 좌표 합을 정수로 유지하기 위한 양자화 (소수점 7자리)
+_SCALE = 10**7
+# 256px 타일 한 변의 격자 수 = 2 ** _GRID_BITS
+_GRID_BITS = int(math.log2(256 // CLUSTER_CELL_PX))
+
+
+def _cell_keys(lng: float, lat: float, min_zoom: int, max_zoom: int) -> list[tuple[int, int, int]]:
+    """좌표가 속한 줌별 격자 칸 (zoom, cx, cy)."""
+    mx, my = _mercator(lng, lat)
+    n = 1 << (max_zoom + _GRID_BITS)
+    cx, cy = min(int(mx * n), n - 1), min(int(my * n), n - 1)
+    return [(z, cx >> (max_zoom - z), cy >> (max_zoom - z)) for z in range(min_zoom, max_zoom + 1)]
+
+
+class ClusterState:
+    """줌별 격자 칸 집계 (POI 추가/제거가 O(줌 수))."""
+
+    def __init__(self, lang: str, min_zoom: int, max_zoom: int, build_id: str) -> None:
+        self.lang = lang
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.build_id = build_id
+        # id → (양자화 lng, 양자화 lat, appCategory)
+        self.points: dict[str, tuple[int, int, str]] = {}
+        # (zoom, cx, cy) → [id 집합, lng 합, lat 합, appCategory 건수]
+        self.cells: dict[tuple[int, int, int], list] = {}
+
+    def _keys(self, point: tuple[int, int, str]) -> list[tuple[int, int, int]]:
+        return _cell_keys(point[0] / _SCALE, point[1] / _SCALE, self.min_zoom, self.max_zoom)
+
+    def add(self, poi: dict) -> list[tuple[int, int, int]]:
+        """POI를 추가하고 영향받은 칸을 반환한다 (좌표가 0.0이면 추가하지 않음)."""
+        coords = poi.get("coordinates") or {}
+        lat, lng = coords.get("lat", 0.0), coords.get("lng", 0.0)
+        if not lat or not lng:
+            return []
+        point = (round(lng * _SCALE), round(lat * _SCALE), poi.get("appCategory", ""))
+        self.points[poi["id"]] = point
+        keys = self._keys(point)
+        for key in keys:
+            cell = self.cells.get(key)
+            if cell is None:
+                cell = self.cells[key] = [set(), 0, 0, Counter()]
+            cell[0].add(poi["id"])
+            cell[1] += point[0]
+            cell[2] += point[1]
+            cell[3][point[2]] += 1
+        return keys
+
+    def remove(self, content_id: str) -> list[tuple[int, int, int]]:
+        """POI를 제거하고 영향받은 칸을 반환한다."""
+        point = self.points.pop(content_id, None)
+        if point is None:
+            return []
+        keys = self._keys(point)
+        for key in keys:
+            cell = self.cells[key]
+            cell[0].discard(content_id)
+            if not cell[0]:
+                del self.cells[key]
+                continue
+            cell[1] -= point[0]
+            cell[2] -= point[1]
+            cell[3][point[2]] -= 1
+            if not cell[3][point[2]]:
+                del cell[3][point[2]]
+        return keys
+
+    def doc_id(self, key: tuple[int, int, int]) -> str:
+        return f"{self.lang}:{key[0]}:{key[1]}:{key[2]}"
+
+    def doc(self, key: tuple[int, int, int]) -> dict:
+        ids, sum_lng, sum_lat, categories = self.cells[key]
+        count = len(ids)
+        doc = {
+            "_id": self.doc_id(key),
+            "lang": self.lang,
+            "zoom": key[0],
+            "cell": [key[1], key[2]],
+            "count": count,
+            "location": {
+                "type": "Point",
+                "coordinates": [
+                    round(sum_lng / count / _SCALE, 7),
+                    round(sum_lat / count / _SCALE, 7),
+                ],
+            },
+            "appCategories": dict(sorted(categories.items())),
+            "buildId": self.build_id,
+        }
+        if count == 1:
+            doc["poiId"] = next(iter(ids))
+        return doc
+
+
+def _state_path(lang: str) -> Path:
+    return CLUSTERS_DIR / lang / "state.pickle"
+
+
+def load_cluster_state(lang: str) -> ClusterState | None:
+    path = _state_path(lang)
+    if not path.exists():
+        return None
+    data = pickle.loads(path.read_bytes())
+    if data.get("version") != CLUSTER_STATE_VERSION:
+        return None
+    return data["state"]
+
+
+def _save(state: ClusterState, zooms: set[int]) -> None:
+    """상태와 지정한 줌의 z{zoom}.json을 저장한다."""
+    lang_dir = CLUSTERS_DIR / state.lang
+    lang_dir.mkdir(parents=True, exist_ok=True)
+    by_zoom: dict[int, list[dict]] = {z: [] for z in zooms}
+    for key in sorted(state.cells):
+        if key[0] in by_zoom:
+            by_zoom[key[0]].append(state.doc(key))
+    for zoom, docs in by_zoom.items():
+        (lang_dir / f"z{zoom}.json").write_text(
+            json.dumps(docs, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+        )
+
+    path = _state_path(state.lang)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(
+        pickle.dumps({"version": CLUSTER_STATE_VERSION, "state": state}, protocol=pickle.HIGHEST_PROTOCOL)
+    )
+    tmp_path.replace(path)
+
+
+def build_clusters(
+    lang: str, min_zoom: int = CLUSTER_MIN_ZOOM, max_zoom: int = CLUSTER_MAX_ZOOM
+) -> dict | None:
+    """pois_{lang}.json으로 전체 클러스터를 만든다.
+
+    Returns:
+        {"full": True, "buildId": ..., "upserts": [문서], "deleted": []}
+        (save_poi_clusters_to_mongodb()에 전달, pois_{lang}.json이 없으면 None)
+    """
+    pois_path = OUTPUT_DIR / f"pois_{lang}.json"
+    if not pois_path.exists():
+        print(f"[Transform] {pois_path} 파일 없음, 건너뜀")
+        return None
+
+    build_id = datetime.now().strftime("%Y%m%dT%H%M%S")
+    state = ClusterState(lang, min_zoom, max_zoom, build_id)
+    for poi in json.loads(pois_path.read_text(encoding="utf-8")):
+        state.add(poi)
+
+    for stale in (CLUSTERS_DIR / lang).glob("z*.json"):
+        stale.unlink()
+    _save(state, set(range(min_zoom, max_zoom + 1)))
+    return full_cluster_changes(state)
+
+
+def full_cluster_changes(state: ClusterState) -> dict:
+    """상태 전체를 MongoDB 전체 교체용 변경분으로 만든다."""
+    return {
+        "full": True,
+        "buildId": state.build_id,
+        "upserts": [state.doc(key) for key in sorted(state.cells)],
+        "deleted": [],
+    }
+
+
+def update_clusters(lang: str, upserts: dict[str, dict], removed: set[str]) -> dict | None:
+    """변경된 POI의 이전/새 칸만 다시 계산한다.
+
+    Args:
+        lang: "kr" 또는 "en"
+        upserts: {id: POI} — 추가/변경 POI (geo_delta_from_summaries() 결과)
+        removed: 삭제된 POI id
+
+    Returns:
+        {"full": False, "buildId": ..., "upserts": [바뀐 칸 문서], "deleted": [비게 된 칸 _id]}
+        (build_clusters()로 만든 상태가 없으면 None)
+    """
+    state = load_cluster_state(lang)
+    if state is None:
+        return None
+
+    touched: set[tuple[int, int, int]] = set()
+    for content_id in removed:
+        touched.update(state.remove(content_id))
+    for content_id, poi in upserts.items():
+        touched.update(state.remove(content_id))
+        touched.update(state.add(poi))
+
+    _save(state, {key[0] for key in touched})
+    return {
+        "full": False,
+        "buildId": state.build_id,
+        "upserts": [state.doc(key) for key in sorted(touched) if key in state.cells],
+        "deleted": [state.doc_id(key) for key in sorted(touched) if key not in state.cells],
+    }
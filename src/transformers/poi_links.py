@@ -0,0 +1,214 @@
+"""pois_kr ↔ pois_en 연결 테이블 (output/poi_links.json).
+
+국문(KorService2)과 영문(EngService2)은 같은 장소에도 서로 다른 contentId를 쓰므로
+좌표/지역/분류/이름으로 같은 장소를 찾아 1:1로 연결한다.
+
+- 블로킹: 0.005° 격자(약 500m)의 주변 3×3 칸 + 같은 지역(region) + 같은 대분류(source.lcls[0])
+- 점수: 거리(LINK_MAX_DISTANCE_M 이내 선형 감소) 0.5 + 이름 0.35 + 분류 0.15
+  이름은 국문명을 로마자로 옮긴 키의 2-gram이 영문명 키에 포함된 비율 ('경복궁' ↔ 'Gyeongbokgung Palace')
+- 배정: 점수가 높은 후보 쌍부터 양쪽 모두 미연결인 경우에만 연결 (탐욕 1:1)
+
+증분 갱신: 연결에 쓰는 필드(좌표/지역/분류/이름)의 해시를 언어별로 기록해 두고,
+바뀐/새/삭제된 POI와 그 POI의 기존 연결 상대만 다시 후보를 찾는다.
+"""
+
+import hashlib
+import json
+import math
+
+from src.transformers.hangul import latin_key
+from src.transformers.pois import OUTPUT_DIR
+
+LINKS_PATH = OUTPUT_DIR / "poi_links.json"
+LINKS_STATE_PATH = OUTPUT_DIR / "poi_links_state.json"
+LINKS_STATE_VERSION = 1
+
+LINK_CELL_DEG = 0.005
+LINK_MAX_DISTANCE_M = 300.0
+LINK_MIN_SCORE = 0.6
+LINK_MIN_NAME_SCORE = 0.25
+
+_DEG_M = 111_195.0
+
+
+def _record(poi: dict) -> dict | None:
+    """연결에 쓰는 필드만 추린다 (좌표가 0.0이면 None)."""
+    coords = poi.get("coordinates") or {}
+    lat, lng = coords.get("lat", 0.0), coords.get("lng", 0.0)
+    if not lat or not lng:
+        return None
+    lcls = (poi.get("source") or {}).get("lcls") or []
+    return {
+        "lat": lat,
+        "lng": lng,
+        "region": poi.get("region", ""),
+        "lcls": list(lcls),
+        "key": latin_key(poi.get("name", "")),
+    }
+
+
+def _fingerprint(record: dict) -> str:
+    return hashlib.sha1(json.dumps(record, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _bigrams(text: str) -> set[str]:
+    return {text[i : i + 2] for i in range(len(text) - 1)} or ({text} if text else set())
+
+
+def name_score(kr_key: str, en_key: str) -> float:
+    """국문명 로마자 키의 2-gram 중 영문명 키에 있는 비율 (0~1)."""
+    kr_grams = _bigrams(kr_key)
+    if not kr_grams:
+        return 0.0
+    return len(kr_grams & _bigrams(en_key)) / len(kr_grams)
+
+
+def _distance_m(a: dict, b: dict) -> float:
+    """근거리 평면 근사 거리 (m)."""
+    dy = (a["lat"] - b["lat"]) * _DEG_M
+    dx = (a["lng"] - b["lng"]) * _DEG_M * math.cos(math.radians((a["lat"] + b["lat"]) / 2))
+    return math.hypot(dx, dy)
+
+
+def _score(kr: dict, en: dict) -> tuple[float, float] | None:
+    """(점수, 거리 m) — 블로킹/거리/이름 기준을 통과하지 못하면 None."""
+    if kr["region"] and en["region"] and kr["region"] != en["region"]:
+        return None
+    if kr["lcls"] and en["lcls"] and kr["lcls"][0] != en["lcls"][0]:
+        return None
+    distance = _distance_m(kr, en)
+    if distance > LINK_MAX_DISTANCE_M:
+        return None
+    names = name_score(kr["key"], en["key"])
+    if names < LINK_MIN_NAME_SCORE:
+        return None
+    if kr["lcls"] == en["lcls"]:
+        category = 1.0
+    elif kr["lcls"][:2] == en["lcls"][:2]:
+        category = 0.5
+    else:
+        category = 0.0
+    score = 0.5 * (1 - distance / LINK_MAX_DISTANCE_M) + 0.35 * names + 0.15 * category
+    return score, distance
+
+
+def _cell(record: dict) -> tuple[int, int]:
+    return math.floor(record["lng"] / LINK_CELL_DEG), math.floor(record["lat"] / LINK_CELL_DEG)
+
+
+def _grid(records: dict[str, dict], ids) -> dict[tuple[int, int], list[str]]:
+    grid: dict[tuple[int, int], list[str]] = {}
+    for content_id in ids:
+        grid.setdefault(_cell(records[content_id]), []).append(content_id)
+    return grid
+
+
+def _neighbors(grid: dict[tuple[int, int], list[str]], record: dict):
+    cx, cy = _cell(record)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            yield from grid.get((cx + dx, cy + dy), ())
+
+
+def _load_records(lang: str) -> dict[str, dict] | None:
+    path = OUTPUT_DIR / f"pois_{lang}.json"
+    if not path.exists():
+        return None
+    records = {}
+    for poi in json.loads(path.read_text(encoding="utf-8")):
+        record = _record(poi)
+        if record is not None:
+            records[poi["id"]] = record
+    return records
+
+
+def update_poi_links() -> dict | None:
+    """pois_kr/pois_en의 변경분만 다시 연결하여 output/poi_links.json을 갱신한다.
+
+    이전 상태가 없거나 연결 규칙 버전이 다르면 전체를 다시 연결한다.
+
+    Returns:
+        {
+            "full": bool, "links": N, "dirty": {"kr": N, "en": N},
+            "upserts": [연결], "deleted": [kr id],  # save_poi_links_to_mongodb()용 변경분
+        }
+        (pois_kr.json 또는 pois_en.json이 없으면 None)
+    """
+    kr, en = _load_records("kr"), _load_records("en")
+    if kr is None or en is None:
+        print("[Transform] pois_kr.json / pois_en.json 중 없는 파일이 있어 연결 건너뜀")
+        return None
+
+    state = {}
+    if LINKS_STATE_PATH.exists():
+        state = json.loads(LINKS_STATE_PATH.read_text(encoding="utf-8"))
+    full = state.get("version") != LINKS_STATE_VERSION
+    old_fps = {} if full else state["fingerprints"]
+    old_links: dict[str, dict] = {} if full else {link["kr"]: link for link in state["links"]}
+
+    fps = {
+        "kr": {cid: _fingerprint(r) for cid, r in kr.items()},
+        "en": {cid: _fingerprint(r) for cid, r in en.items()},
+    }
+    dirty = {
+        lang: {cid for cid, fp in fps[lang].items() if old_fps.get(lang, {}).get(cid) != fp}
+        for lang in ("kr", "en")
+    }
+    gone = {lang: set(old_fps.get(lang, {})) - set(fps[lang]) for lang in ("kr", "en")}
+
+    # 바뀐/삭제된 POI가 포함된 연결을 풀고, 풀린 상대도 다시 후보를 찾는다
+    links: dict[str, dict] = {}
+    for kr_id, link in old_links.items():
+        en_id = link["en"]
+        if kr_id in dirty["kr"] or kr_id in gone["kr"] or en_id in dirty["en"] or en_id in gone["en"]:
+            if kr_id in kr:
+                dirty["kr"].add(kr_id)
+            if en_id in en:
+                dirty["en"].add(en_id)
+        else:
+            links[kr_id] = link
+
+    linked_en = {link["en"] for link in links.values()}
+    free_kr = [cid for cid in kr if cid not in links]
+    free_en = [cid for cid in en if cid not in linked_en]
+    kr_grid, en_grid = _grid(kr, free_kr), _grid(en, free_en)
+
+    candidates: dict[tuple[str, str], tuple[float, float]] = {}
+    for kr_id in dirty["kr"]:
+        if kr_id in links:
+            continue
+        for en_id in _neighbors(en_grid, kr[kr_id]):
+            scored = _score(kr[kr_id], en[en_id])
+            if scored is not None:
+                candidates[(kr_id, en_id)] = scored
+    for en_id in dirty["en"]:
+        if en_id in linked_en:
+            continue
+        for kr_id in _neighbors(kr_grid, en[en_id]):
+            if (kr_id, en_id) not in candidates:
+                scored = _score(kr[kr_id], en[en_id])
+                if scored is not None:
+                    candidates[(kr_id, en_id)] = scored
+
+    for (kr_id, en_id), (score, distance) in sorted(
+        candidates.items(), key=lambda c: (-c[1][0], c[0])
+    ):
+        if kr_id in links or en_id in linked_en:
+            continue
+        links[kr_id] = {"kr": kr_id, "en": en_id, "score": round(score, 4), "distanceM": round(distance, 1)}
+        linked_en.add(en_id)
+
+    ordered = [links[cid] for cid in sorted(links)]
+    LINKS_PATH.write_text(json.dumps(ordered, ensure_ascii=False, indent=2), encoding="utf-8")
+    LINKS_STATE_PATH.write_text(
+        json.dumps({"version": LINKS_STATE_VERSION, "fingerprints": fps, "links": ordered}),
+        encoding="utf-8",
+    )
+
+    return {
+        "full": full,
+        "links": len(ordered),
+        "dirty": {lang: len(ids) for lang, ids in dirty.items()},
+        "upserts": [link for link in ordered if old_links.get(link["kr"]) != link],
+        "deleted": sorted(set(old_links) - set(links)),
+    }
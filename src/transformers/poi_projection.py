@@ -0,0 +1,315 @@
+"""필드 투영 POI 테이블 (pois_{lang}.json / pois_details_{lang}.json 지연 로드).
+
+Step 3 스케줄러와 진행 상황 집계는 id/지역/완료 플래그 같은 몇 개 필드만 쓰지만, 파일 전체를
+json.loads하면 설명/intro/info까지 모두 Python 객체로 만든다. LazyPoiTable은
+
+- 요청한 필드(fields)와 행의 키 목록만 보관하고 ("source.modifiedtime"처럼 점 표기 필드는
+  MongoDB projection과 같이 하위 키만 담은 dict로 투영)
+- 나머지는 파일을 mmap한 채 항목의 원문 위치(byte offset)만 기억했다가 to_dict() 시 그 항목만 파싱한다.
+
+투영 결과는 옆 파일 {이름}.proj.pickle(원본 크기/수정 시각, 필드, 테이블 상태)에 저장하므로
+원본이 바뀌지 않았으면 다음 로드는 pickle만 읽는다. 원본이 바뀌었거나 투영 파일이 없으면
+한 번 전체 파싱해서 다시 만든다 (기존 로드 비용).
+
+save()는 바뀌지 않은 항목은 원문 바이트를 그대로 복사하고 바뀐 항목만 직렬화하며,
+투영 파일도 함께 갱신한다 (결과는 json.dumps(indent=2)와 바이트 단위로 같음).
+
+사용 예:
+    details = LazyPoiTable.open(OUTPUT_DIR / "pois_details_kr.json", ("id", "detailUpdatedAt"), unique=True)
+    done = sum(1 for row in details if row.get("detailUpdatedAt"))
+    full = details.get("126508").to_dict()   # 이 항목만 파싱
+    details.upsert(updated_poi)
+    details.save()
+"""
+
+import json
+import mmap
+import pickle
+from array import array
+from pathlib import Path
+
+from src.transformers.poi_table import PoiRow, PoiTable
+from src.utils import encode_json_item
+
+PROJECTION_VERSION = 1
+
+# json.dumps(indent=2) 최상위 배열 항목의 시작/끝 (문자열 안에는 줄바꿈이 그대로 올 수 없다)
+_ITEM_START = b"\n  {"
+_ITEM_END = b"\n  }"
+# 투영 파일에 저장하지 않는 속성
+_UNPICKLED = ("_mm", "path", "fields", "_nested", "_strings", "unique")
+
+
+def projection_path(path: Path) -> Path:
+    return path.with_name(path.stem + ".proj.pickle")
+
+
+def _nested_fields(fields) -> dict[str, tuple[str, ...]]:
+    """점 표기 필드 → {상위 키: (하위 키, ...)}."""
+    nested: dict[str, tuple[str, ...]] = {}
+    for field in sorted(fields):
+        if "." in field:
+            top, sub = field.split(".", 1)
+            nested[top] = (*nested.get(top, ()), sub)
+    return nested
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _item_spans(buf: bytes, count: int) -> list[tuple[int, int]] | None:
+    """최상위 배열 항목 count개의 원문 위치 [(시작, 끝)] (indent=2 형식이 아니면 None)."""
+    spans = []
+    find = buf.find
+    pos = 0
+    while True:
+        start = find(_ITEM_START, pos)
+        if start < 0:
+            break
+        end = find(_ITEM_END, start)
+        if end < 0:
+            return None
+        spans.append((start + 3, end + 4))
+        pos = end + 4
+    return spans if len(spans) == count else None
+
+
+class LazyPoiRow(PoiRow):
+    """LazyPoiTable 행 뷰 — 투영 필드는 바로 읽고, to_dict()는 원문 항목 전체를 파싱한다."""
+
+    __slots__ = ()
+
+    def get(self, key: str, default=None):
+        projected = self._table._projected[self._number]
+        if projected is not None and key in projected:
+            return projected[key]
+        return super().get(key, default)
+
+    def to_dict(self) -> dict:
+        return self._table._full(self._number)
+
+
+class LazyPoiTable(PoiTable):
+    """fields만 메모리에 두고 나머지 필드는 원문에서 지연 로드하는 PoiTable.
+
+    원문을 가리키는 행은 투영 필드 dict와 원문 위치만 가지며, upsert/append로 기록한 행은
+    save() 전까지 문서 전체를 PoiTable 열에 보관한다.
+    """
+
+    _row_class = LazyPoiRow
+
+    def __init__(self, fields=("id",)) -> None:
+        super().__init__()
+        self.fields = frozenset(fields) | {"id"}
+        self._nested = _nested_fields(self.fields)
+        self._strings: dict[str, str] = {}
+        self.path: Path | None = None
+        self.unique = False
+        self._mm: mmap.mmap | None = None
+        self._starts = array("Q")
+        self._ends = array("Q")
+        # 1이면 원문 항목을 가리키는 투영 행, 0이면 전체 문서를 가진 행
+        self._lazy = bytearray()
+        # 투영 행의 필드 값 (전체 문서를 가진 행은 None)
+        self._projected: list[dict | None] = []
+
+    @classmethod
+    def open(cls, path: Path, fields, unique: bool = False) -> "LazyPoiTable":
+        """JSON 배열 파일을 투영 테이블로 연다 (파일이 없으면 빈 테이블).
+
+        unique는 PoiTable.from_dicts()와 같다 (True이면 같은 id는 처음 위치에 마지막 항목).
+        """
+        table = cls(fields)
+        table.path = path
+        table.unique = unique
+        if not path.exists():
+            return table
+        if not table._load_projection():
+            table._build_projection()
+        table._map()
+        return table
+
+    # ── 투영 파일 ──
+
+    def _load_projection(self) -> bool:
+        proj_path = projection_path(self.path)
+        if not proj_path.exists():
+            return False
+        try:
+            state = pickle.loads(proj_path.read_bytes())
+        except (pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return False
+        if (
+            state.get("version") != PROJECTION_VERSION
+            or state["stamp"] != _stamp(self.path)
+            or not self.fields <= state["fields"]
+            or state["unique"] != self.unique
+        ):
+            return False
+        self.__dict__.update(state["table"])
+        self.fields = state["fields"]
+        self._nested = _nested_fields(self.fields)
+        return True
+
+    def _state(self) -> dict:
+        return {k: v for k, v in self.__dict__.items() if k not in _UNPICKLED}
+
+    def _save_projection(self) -> None:
+        state = {
+            "version": PROJECTION_VERSION,
+            "stamp": _stamp(self.path),
+            "fields": self.fields,
+            "unique": self.unique,
+            "table": self._state(),
+        }
+        proj_path = projection_path(self.path)
+        tmp_path = proj_path.with_name(proj_path.name + ".tmp")
+        tmp_path.write_bytes(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp_path.replace(proj_path)
+
+    def _build_projection(self) -> None:
+        """원본 전체를 한 번 파싱하여 투영 행과 원문 위치를 만들고 투영 파일을 저장한다."""
+        buf = self.path.read_bytes()
+        docs = json.loads(buf)
+        spans = _item_spans(buf, len(docs))
+        del buf
+        for i, doc in enumerate(docs):
+            if spans is None:
+                # indent=2 형식이 아니면 원문 위치를 쓸 수 없으므로 전체 문서를 보관
+                (self.upsert if self.unique else self.append)(doc)
+                continue
+            number = self._index.get(doc["id"]) if self.unique else None
+            if number is None:
+                number = self._append_empty()
+                self._index[doc["id"]] = number
+            self._point(number, self._project(doc), tuple(doc), spans[i])
+        if spans is not None:
+            self._save_projection()
+
+    def _project(self, doc: dict) -> dict:
+        """투영 필드만 추린다 (같은 문자열 값은 객체 하나로 공유 — 투영 파일 크기/로드 시간 절감)."""
+        strings = self._strings
+        projected = {}
+        for key, value in doc.items():
+            if key in self.fields:
+                projected[key] = strings.setdefault(value, value) if type(value) is str else value
+            elif key in self._nested and type(value) is dict:
+                projected[key] = {
+                    sub: strings.setdefault(value[sub], value[sub]) if type(value[sub]) is str else value[sub]
+                    for sub in self._nested[key]
+                    if sub in value
+                }
+        return projected
+
+    def _point(
+        self, number: int, projected: dict, keys: tuple[str, ...], span: tuple[int, int]
+    ) -> None:
+        """행을 원문 항목(span)을 가리키는 투영 행으로 바꾼다 (열에 남은 문서별 값은 비운다)."""
+        if not self._lazy[number]:
+            for values in self._strs.values():
+                values[number] = None
+            self._images[number] = None
+            self._source_modifiedtime[number] = None
+        code = self._layouts.add(keys)
+        if code == len(self._layout_sets):
+            self._layout_sets.append(frozenset(keys))
+        self._layout[number] = code
+        self._extra[number] = None
+        self._projected[number] = projected
+        self._starts[number], self._ends[number] = span
+        self._lazy[number] = 1
+
+    def _map(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if any(self._lazy):
+            with self.path.open("rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # ── PoiTable 확장 ──
+
+    def _append_empty(self) -> int:
+        self._starts.append(0)
+        self._ends.append(0)
+        self._lazy.append(0)
+        self._projected.append(None)
+        return super()._append_empty()
+
+    def _write(self, number: int, doc: dict, keys: tuple[str, ...] | None = None) -> None:
+        super()._write(number, doc, keys)
+        self._lazy[number] = 0
+        self._projected[number] = None
+
+    def discard(self, content_id: str) -> bool:
+        number = self._index.get(content_id)
+        if not super().discard(content_id):
+            return False
+        self._projected[number] = None
+        return True
+
+    def _raw(self, number: int) -> bytes:
+        return self._mm[self._starts[number] : self._ends[number]]
+
+    def _full(self, number: int) -> dict:
+        if self._lazy[number]:
+            return json.loads(self._raw(number))
+        return PoiRow.to_dict(PoiRow(self, number))
+
+    def _value(self, number: int, key: str):
+        if not self._lazy[number]:
+            return super()._value(number, key)
+        projected = self._projected[number]
+        if key in projected:
+            return projected[key]
+        if key not in self._layout_sets[self._layout[number]]:
+            raise KeyError(key)
+        return self._full(number)[key]
+
+    # ── 저장 ──
+
+    def save(self, path: Path | None = None) -> Path:
+        """JSON 배열 파일과 투영 파일을 저장하고, 이후 저장한 파일을 원문으로 사용한다.
+
+        바뀌지 않은 항목은 원문 바이트를 복사하므로 전체를 다시 직렬화하지 않는다.
+        """
+        path = path or self.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        spans: list[tuple[int, dict, int, int]] = []
+        try:
+            with tmp_path.open("wb") as f:
+                pos = 0
+                for row in self:
+                    number = row._number
+                    if self._lazy[number]:
+                        item = self._raw(number)
+                        projected = self._projected[number]
+                    else:
+                        doc = PoiRow.to_dict(row)
+                        item = encode_json_item(doc, 0).encode("utf-8")
+                        projected = self._project(doc)
+                    pad = b"[\n  " if pos == 0 else b",\n  "
+                    f.write(pad + item)
+                    start = pos + len(pad)
+                    pos = start + len(item)
+                    spans.append((number, projected, start, pos))
+                f.write(b"[]" if pos == 0 else b"\n]")
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # 전체 문서를 가진 행(upsert/append)은 투영만 남기고, 모든 행이 새 파일의 원문을 가리키게 한다
+        for number, projected, start, end in spans:
+            self._point(number, projected, self._layouts.values[self._layout[number]], (start, end))
+
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        tmp_path.replace(path)
+        self.path = path
+        self._save_projection()
+        self._map()
+        return path
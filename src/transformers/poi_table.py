@@ -0,0 +1,311 @@
+"""열 기반 POI 테이블 (메모리 절약형 POI 목록).
+
+POI dict 목록은 문서마다 dict/list 객체와 반복 문자열(region slug, 분류명, 태그, 날짜)을 따로 가진다.
+PoiTable은 POI를 필드별 열로 나눠 보관한다.
+
+- 반복 값 열 (사전 인코딩: 값 목록 + array("I") 번호): category, appCategory, region, updatedAt,
+  detailUpdatedAt, detailModifiedTime, tags, source.contentTypeId/area/lcls
+- 좌표 열: array("d") lat/lng — location(GeoJSON Point)은 coordinates와 같으면 저장하지 않고 복원
+- 문서별 문자열 열: id, name, address, description, thumbnail, contact, website, source.modifiedtime, images
+- 그 밖의 필드(상세 intro/info 등)와 위 형식에 맞지 않는 값은 행별 extra dict에 원본 그대로 보관
+
+행의 키 순서(layout)도 사전 인코딩하므로 to_dict()는 원본과 키 순서까지 같은 dict를 만든다
+(출력 파일이 바이트 단위로 같다). 처리 경로는 PoiRow(__slots__ 행 뷰)로 필드를 읽고,
+출력/병합/MongoDB 저장 직전에만 to_dict()로 dict를 만든다.
+
+사용 예:
+    table = PoiTable.load(OUTPUT_DIR / "pois_kr.json")
+    for row in table:
+        if row.get("region") == "seoul":
+            ...
+    table.get("126508").to_dict()
+"""
+
+import json
+from array import array
+from pathlib import Path
+
+# 사전 인코딩 문자열 열 (POI 필드명)
+_DICT_FIELDS = ("category", "appCategory", "region", "updatedAt", "detailUpdatedAt", "detailModifiedTime")
+# 문서별 문자열 열
+_STR_FIELDS = ("id", "name", "address", "description", "thumbnail", "contact", "website")
+_SOURCE_KEYS = ("contentTypeId", "area", "lcls", "modifiedtime")
+
+# layout에서 열로 복원하는 필드 (extra에 없을 때)
+_COLUMN_FIELDS = frozenset(
+    (*_DICT_FIELDS, *_STR_FIELDS, "slug", "tags", "images", "coordinates", "location", "source")
+)
+
+
+class _Dictionary:
+    """값 → 번호 사전 (같은 값은 객체 하나만 보관)."""
+
+    def __init__(self) -> None:
+        self.values: list = []
+        self._index: dict = {}
+
+    def add(self, value) -> int:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = self._index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _is_str_list(value) -> bool:
+    return type(value) is list and all(type(v) is str for v in value)
+
+
+def _coords_of(value) -> tuple[float, float] | None:
+    """{"lat": float, "lng": float} → (lat, lng) (형식이 다르면 None)."""
+    if type(value) is not dict or list(value) != ["lat", "lng"]:
+        return None
+    lat, lng = value["lat"], value["lng"]
+    if type(lat) is not float or type(lng) is not float:
+        return None
+    return lat, lng
+
+
+def _source_fits(value) -> bool:
+    return (
+        type(value) is dict
+        and tuple(value) == _SOURCE_KEYS
+        and type(value["contentTypeId"]) is str
+        and type(value["area"]) is str
+        and _is_str_list(value["lcls"])
+        and type(value["modifiedtime"]) is str
+    )
+
+
+class PoiRow:
+    """PoiTable 한 행의 읽기 전용 dict 호환 뷰 ([], get, in, keys, dict(row))."""
+
+    __slots__ = ("_table", "_number")
+
+    def __init__(self, table: "PoiTable", number: int) -> None:
+        self._table = table
+        self._number = number
+
+    def __getitem__(self, key: str):
+        return self._table._value(self._number, key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self._table._value(self._number, key)
+        except KeyError:
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._table._layout_sets[self._table._layout[self._number]]
+
+    def keys(self) -> tuple[str, ...]:
+        return self._table._layouts.values[self._table._layout[self._number]]
+
+    def to_dict(self) -> dict:
+        """원본과 키 순서까지 같은 새 dict (중첩 dict/list도 새 객체, extra 값은 공유)."""
+        return {key: self._table._value(self._number, key) for key in self.keys()}
+
+    def __repr__(self) -> str:
+        return f"PoiRow({self.get('id')!r})"
+
+
+class PoiTable:
+    """열 기반 POI 목록 (삽입 순서 유지, id로 조회/교체/삭제)."""
+
+    _row_class = PoiRow
+
+    def __init__(self) -> None:
+        self._layouts = _Dictionary()
+        self._layout_sets: list[frozenset[str]] = []
+        self._layout = array("I")
+        self._extra: list[dict | None] = []
+        self._alive = bytearray()
+        self._count = 0
+        self._index: dict[str, int] = {}
+        self._dicts = {field: (_Dictionary(), array("I")) for field in _DICT_FIELDS}
+        self._strs: dict[str, list] = {field: [] for field in _STR_FIELDS}
+        self._tags = (_Dictionary(), array("I"))
+        self._images: list[tuple[str, ...] | None] = []
+        self._lat = array("d")
+        self._lng = array("d")
+        self._source_dicts = {key: (_Dictionary(), array("I")) for key in ("contentTypeId", "area", "lcls")}
+        self._source_modifiedtime: list[str | None] = []
+
+    @classmethod
+    def from_dicts(cls, docs, unique: bool = False) -> "PoiTable":
+        """dict 목록으로 테이블을 만든다.
+
+        unique=False이면 목록 그대로(같은 id 중복 포함), True이면 {id: doc} dict와 같이
+        같은 id는 처음 위치에 마지막 문서만 남긴다.
+        """
+        table = cls()
+        add = table.upsert if unique else table.append
+        for doc in docs:
+            add(doc)
+        return table
+
+    @classmethod
+    def load(cls, path: Path, unique: bool = False) -> "PoiTable":
+        """JSON 배열 파일을 읽어 테이블로 만든다 (파일이 없으면 빈 테이블)."""
+        if not path.exists():
+            return cls()
+        return cls.from_dicts(json.loads(path.read_text(encoding="utf-8")), unique)
+
+    # ── 행 기록 ──
+
+    def _append_empty(self) -> int:
+        number = len(self._layout)
+        self._layout.append(0)
+        self._extra.append(None)
+        self._alive.append(1)
+        self._count += 1
+        for _, codes in (*self._dicts.values(), self._tags, *self._source_dicts.values()):
+            codes.append(0)
+        for values in self._strs.values():
+            values.append(None)
+        self._images.append(None)
+        self._lat.append(0.0)
+        self._lng.append(0.0)
+        self._source_modifiedtime.append(None)
+        return number
+
+    def _write(self, number: int, doc: dict, keys: tuple[str, ...] | None = None) -> None:
+        """doc의 필드를 열에 기록한다 (keys를 주면 행의 키 순서로 doc 대신 사용)."""
+        extra: dict = {}
+        coords = _coords_of(doc.get("coordinates"))
+        for key, value in doc.items():
+            if key in self._dicts and type(value) is str:
+                dictionary, codes = self._dicts[key]
+                codes[number] = dictionary.add(value)
+            elif key in self._strs and type(value) is str:
+                self._strs[key][number] = value
+            elif key == "slug" and value == doc.get("id") and type(value) is str:
+                pass
+            elif key == "tags" and _is_str_list(value):
+                self._tags[1][number] = self._tags[0].add(tuple(value))
+            elif key == "images" and _is_str_list(value):
+                self._images[number] = tuple(value)
+            elif key == "coordinates" and coords is not None:
+                self._lat[number], self._lng[number] = coords
+            elif (
+                key == "location"
+                and coords is not None
+                and type(value) is dict
+                and list(value) == ["type", "coordinates"]
+                and value["type"] == "Point"
+                and value["coordinates"] == [coords[1], coords[0]]
+                and all(type(c) is float for c in value["coordinates"])
+            ):
+                pass
+            elif key == "source" and _source_fits(value):
+                for source_key, (dictionary, codes) in self._source_dicts.items():
+                    source_value = value[source_key]
+                    codes[number] = dictionary.add(tuple(source_value) if source_key == "lcls" else source_value)
+                self._source_modifiedtime[number] = value["modifiedtime"]
+            else:
+                extra[key] = value
+
+        layout = tuple(doc) if keys is None else keys
+        code = self._layouts.add(layout)
+        if code == len(self._layout_sets):
+            self._layout_sets.append(frozenset(layout))
+        self._layout[number] = code
+        self._extra[number] = extra or None
+
+    def append(self, doc: dict) -> None:
+        """끝에 행을 추가한다 (같은 id가 있어도 추가하며, id 조회는 마지막 행을 가리킨다)."""
+        number = self._append_empty()
+        self._index[doc["id"]] = number
+        self._write(number, doc)
+
+    def upsert(self, doc: dict) -> None:
+        """같은 id의 행이 있으면 그 자리에서 교체하고, 없으면 끝에 추가한다."""
+        number = self._index.get(doc["id"])
+        if number is None:
+            number = self._append_empty()
+            self._index[doc["id"]] = number
+        self._write(number, doc)
+
+    def discard(self, content_id: str) -> bool:
+        """id의 행을 삭제한다 (없으면 False, append로 중복된 id는 마지막 행만 삭제)."""
+        number = self._index.pop(content_id, None)
+        if number is None:
+            return False
+        self._alive[number] = 0
+        self._count -= 1
+        self._extra[number] = None
+        return True
+
+    def remove_ids(self, content_ids) -> int:
+        """id가 content_ids에 있는 행을 모두 삭제하고 삭제 건수를 반환한다 (append로 중복된 행 포함)."""
+        targets = set(content_ids)
+        removed = 0
+        for number in range(len(self._alive)):
+            if self._alive[number] and self._value(number, "id") in targets:
+                self._alive[number] = 0
+                self._extra[number] = None
+                removed += 1
+        for content_id in targets:
+            self._index.pop(content_id, None)
+        self._count -= removed
+        return removed
+
+    # ── 행 읽기 ──
+
+    def _value(self, number: int, key: str):
+        extra = self._extra[number]
+        if extra is not None and key in extra:
+            return extra[key]
+        if key not in self._layout_sets[self._layout[number]] or key not in _COLUMN_FIELDS:
+            raise KeyError(key)
+        if key in self._dicts:
+            dictionary, codes = self._dicts[key]
+            return dictionary.values[codes[number]]
+        if key in self._strs:
+            return self._strs[key][number]
+        if key == "slug":
+            return self._strs["id"][number]
+        if key == "tags":
+            return list(self._tags[0].values[self._tags[1][number]])
+        if key == "images":
+            return list(self._images[number])
+        if key == "coordinates":
+            return {"lat": self._lat[number], "lng": self._lng[number]}
+        if key == "location":
+            return {"type": "Point", "coordinates": [self._lng[number], self._lat[number]]}
+        # source
+        values = {k: d.values[codes[number]] for k, (d, codes) in self._source_dicts.items()}
+        return {
+            "contentTypeId": values["contentTypeId"],
+            "area": values["area"],
+            "lcls": list(values["lcls"]),
+            "modifiedtime": self._source_modifiedtime[number],
+        }
+
+    def get(self, content_id: str) -> PoiRow | None:
+        number = self._index.get(content_id)
+        return None if number is None else self._row_class(self, number)
+
+    def __contains__(self, content_id: str) -> bool:
+        return content_id in self._index
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        """삽입 순서대로 행 뷰를 낸다 (삭제된 행 제외)."""
+        alive = self._alive
+        for number in range(len(alive)):
+            if alive[number]:
+                yield self._row_class(self, number)
+
+    def iter_dicts(self):
+        """출력 경계용: 행마다 새 dict를 낸다."""
+        for row in self:
+            yield row.to_dict()
+
+    def to_dicts(self) -> list[dict]:
+        return list(self.iter_dicts())
@@ -1,30 +1,18 @@
 """관광정보 → pois_{lang}.json + pois_geo_{lang}.json 변환"""
 
 import json
+import math
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-OUTPUT_DIR = Path(__file__).resolve().parent.parent.parent / "output"
+from src.config import TRANSFORM_CHUNK_SIZE
+from src.models import AreaBasedItem, PoiDocument, decode_item, try_decode
+from src.transformers.poi_table import PoiTable
+from src.transformers.reference import load_reference_bundle
+from src.transformers.regions import REGION_CODE_MAP
+from src.utils import JsonArrayWriter, encode_json_item
 
-# lDongRegnCd → app slug 매핑
-REGION_CODE_MAP = {
-    "11": "seoul",
-    "26": "busan",
-    "27": "daegu",
-    "28": "incheon",
-    "29": "gwangju",
-    "30": "daejeon",
-    "31": "ulsan",
-    "36110": "sejong",
-    "41": "gyeonggi",
-    "43": "chungbuk",
-    "44": "chungnam",
-    "46": "jeonnam",
-    "47": "gyeongbuk",
-    "48": "gyeongnam",
-    "50": "jeju",
-    "51": "gangwon",
-    "52": "jeonbuk",
-}
+OUTPUT_DIR = Path(__file__).resolve().parent.parent.parent / "output"
 
 # 원본 카테고리명 → 앱 카테고리 코드 매핑
 CATEGORY_APP_MAP_KR: dict[str, str] = {
@@ -61,19 +49,8 @@ EXCLUDE_LCLS3_EN: list[str] = ["SH040300", "FD010100", "AC030300", "AC030400", "
 
 
 def build_category_map() -> dict[str, dict[str, str]]:
-    """categories.json을 읽어 {code: {"ko": name, "en": name}} 딕셔너리 생성."""
-    cat_path = OUTPUT_DIR / "categories.json"
-    categories = json.loads(cat_path.read_text(encoding="utf-8"))
-
-    cat_map: dict[str, dict[str, str]] = {}
-    for top in categories:
-        cat_map[top["code"]] = top["name"]
-        for child in top.get("list", []):
-            cat_map[child["code"]] = child["name"]
-            for grandchild in child.get("list", []):
-                cat_map[grandchild["code"]] = grandchild["name"]
-
-    return cat_map
+    """{code: {"ko": name, "en": name}} 딕셔너리 (참조 데이터 번들에서 로드, 읽기 전용으로 사용)."""
+    return load_reference_bundle()["category_map"]
 
 
 def _safe_float(val: str) -> float:
@@ -100,48 +77,24 @@ def _format_date(raw: str) -> str:
     return f"{raw[:4]}-{raw[4:6]}-{raw[6:8]}"
 
 
-def transform_item(item: dict, lang: str, category_map: dict) -> dict:
-    """단일 항목을 POI 포맷으로 변환한다.
+def _classify(
+    lcls: tuple[str, str, str], lang: str, category_map: dict
+) -> tuple[str, str, tuple[str, ...], tuple[str, ...]]:
+    """(lclsSystm1, lclsSystm2, lclsSystm3) → (category, appCategory, tags, source.lcls).
 
     Args:
-        item: area_based 원본 항목
+        lcls: 분류체계 코드 3개 (없는 단계는 빈 문자열)
         lang: "ko" 또는 "en"
         category_map: {code: {"ko": name, "en": name}}
     """
-    content_id = item.get("contentid", "")
-
     # category: lclsSystm1 코드 → 언어별 name
-    cat_code = item.get("lclsSystm1", "")
+    cat_code = lcls[0]
     category = category_map.get(cat_code, {}).get(lang, cat_code)
 
-    # coordinates
-    lat_str = item.get("mapy", "")
-    lng_str = item.get("mapx", "")
-    coordinates = {
-        "lat": _safe_float(lat_str),
-        "lng": _safe_float(lng_str),
-    }
-
-    # address: addr1 + addr2
-    addr1 = item.get("addr1", "").strip()
-    addr2 = item.get("addr2", "").strip()
-    address = " ".join(filter(None, [addr1, addr2]))
-
-    # region: lDongRegnCd → slug
-    region = REGION_CODE_MAP.get(item.get("lDongRegnCd", ""), "")
-
-    # images: 빈값 필터링 + HTTPS 정규화
-    images = [
-        _normalize_url(img)
-        for img in [item.get("firstimage", ""), item.get("firstimage2", "")]
-        if img
-    ]
-
     # tags: lclsSystm1, lclsSystm2, lclsSystm3 코드의 언어별 name (중복 제거)
     tags = []
     seen: set[str] = set()
-    for key in ("lclsSystm1", "lclsSystm2", "lclsSystm3"):
-        code = item.get(key, "")
+    for code in lcls:
         if code:
             name = category_map.get(code, {}).get(lang, "")
             if name and name not in seen:
@@ -152,12 +105,49 @@ def transform_item(item: dict, lang: str, category_map: dict) -> dict:
     app_map = CATEGORY_APP_MAP_KR if lang == "ko" else CATEGORY_APP_MAP_EN
     app_category = app_map.get(category, "attraction")
 
-    # source: 원본 데이터 추적용
-    source = {
-        "contentTypeId":item.get("contenttypeid", ""),
-        "area": item.get("lDongRegnCd", ""),
-        "lcls": [v for v in [item.get("lclsSystm1", ""), item.get("lclsSystm2", ""), item.get("lclsSystm3", "")] if v],
-    }
+    return category, app_category, tuple(tags), tuple(code for code in lcls if code)
+
+
+# AreaBasedItem 필드 수 — AreaBasedSyncItem/FestivalItem도 앞쪽 필드가 같은 순서이므로 같은 방식으로 읽는다
+_AREA_FIELD_COUNT = len(AreaBasedItem._fields)
+_LCLS_SLICE = slice(AreaBasedItem._fields.index("lclsSystm1"), AreaBasedItem._fields.index("lclsSystm3") + 1)
+
+
+def _lcls_of(item: AreaBasedItem) -> tuple[str, str, str]:
+    return item[_LCLS_SLICE]
+
+
+def _as_item(item: AreaBasedItem | dict) -> AreaBasedItem:
+    """dict 원본 항목은 AreaBasedItem으로 검증/변환한다 (목록 모델은 그대로)."""
+    return decode_item(AreaBasedItem, item) if type(item) is dict else item
+
+
+def _build_poi(
+    item: AreaBasedItem, classified: tuple[str, str, tuple[str, ...], tuple[str, ...]]
+) -> PoiDocument:
+    """목록 항목 모델 + 분류 결과로 POI 문서를 만든다 (tags/lcls는 항목마다 새 리스트).
+
+    AreaBasedSyncItem/FestivalItem도 앞쪽 필드가 AreaBasedItem과 같으므로 그대로 받는다.
+    """
+    category, app_category, tags, lcls = classified
+    (
+        content_id, content_type_id, title, addr1, addr2, mapx, mapy, area,
+        _, _, _, firstimage, firstimage2, tel, modifiedtime,
+    ) = item[:_AREA_FIELD_COUNT]
+
+    # coordinates
+    lat = _safe_float(mapy)
+    lng = _safe_float(mapx)
+
+    # address: addr1 + addr2
+    address = " ".join(filter(None, [addr1.strip(), addr2.strip()]))
+
+    # images: 빈값 필터링 + HTTPS 정규화
+    images = []
+    if firstimage:
+        images.append(_normalize_url(firstimage))
+    if firstimage2:
+        images.append(_normalize_url(firstimage2))
 
     return {
         "id": content_id,
@@ -165,24 +155,84 @@ def transform_item(item: dict, lang: str, category_map: dict) -> dict:
         "category": category,
         "appCategory": app_category,
         "thumbnail": images[0] if images else "",
-        "coordinates": coordinates,
+        "coordinates": {"lat": lat, "lng": lng},
         "location": {
             "type": "Point",
-            "coordinates": [coordinates["lng"], coordinates["lat"]],
+            "coordinates": [lng, lat],
         },
-        "name": item.get("title", ""),
+        "name": title,
         "address": address,
         "description": "",
-        "region": region,
+        # region: lDongRegnCd → slug
+        "region": REGION_CODE_MAP.get(area, ""),
         "images": images,
-        "contact": item.get("tel", ""),
+        "contact": tel,
         "website": "",
-        "tags": tags,
-        "updatedAt": _format_date(item.get("modifiedtime", "")),
-        "source": source,
+        "tags": list(tags),
+        "updatedAt": _format_date(modifiedtime),
+        # source: 원본 데이터 추적용
+        "source": {
+            "contentTypeId": content_type_id,
+            "area": area,
+            "lcls": list(lcls),
+            "modifiedtime": modifiedtime,
+        },
     }
 
 
+def transform_item(item: AreaBasedItem | dict, lang: str, category_map: dict) -> dict:
+    """단일 항목을 POI 포맷으로 변환한다.
+
+    여러 항목을 변환할 때는 분류 결과를 재사용하는 TransformPlan.transform()을 사용한다.
+
+    Args:
+        item: area_based 원본 항목 (dict이면 AreaBasedItem으로 검증, 실패 시 ModelError)
+        lang: "ko" 또는 "en"
+        category_map: {code: {"ko": name, "en": name}}
+    """
+    item = _as_item(item)
+    return _build_poi(item, _classify(_lcls_of(item), lang, category_map))
+
+
+class TransformPlan:
+    """언어별 POI 변환 계획 (실행당 1회 구성).
+
+    제외 코드를 frozenset으로 고정하고, (lclsSystm1, lclsSystm2, lclsSystm3) 조합별
+    분류 결과(category, appCategory, tags, lcls)를 메모하여 항목별 처리를 딕셔너리 조회로 줄인다.
+    조합 수는 수백 개 수준이므로 메모는 제한 없이 유지한다.
+    """
+
+    def __init__(self, lang: str, category_map: dict | None = None) -> None:
+        """
+        Args:
+            lang: "kr" 또는 "en"
+            category_map: build_category_map() 결과 (None이면 새로 로드)
+        """
+        self.lang = lang
+        self.lang_key = "ko" if lang == "kr" else "en"
+        self.category_map = category_map if category_map is not None else build_category_map()
+        self.exclude_codes: frozenset[str] = load_reference_bundle()["exclude_lcls3"][lang]
+        self._memo: dict[tuple[str, str, str], tuple[str, str, tuple[str, ...], tuple[str, ...]]] = {}
+
+    def is_excluded(self, item: AreaBasedItem) -> bool:
+        """lclsSystm3 코드가 제외 대상인지 확인한다."""
+        return item.lclsSystm3 in self.exclude_codes
+
+    def classify(self, item: AreaBasedItem) -> tuple[str, str, tuple[str, ...], tuple[str, ...]]:
+        """항목의 분류 결과 (메모 적중 시 재계산 없음)."""
+        lcls = _lcls_of(item)
+        classified = self._memo.get(lcls)
+        if classified is None:
+            classified = _classify(lcls, self.lang_key, self.category_map)
+            self._memo[lcls] = classified
+        return classified
+
+    def transform(self, item: AreaBasedItem | dict) -> dict:
+        """transform_item()과 동일한 POI를 반환한다."""
+        item = _as_item(item)
+        return _build_poi(item, self.classify(item))
+
+
 def _to_geojson_feature(poi: dict) -> dict:
     """POI item → GeoJSON Feature 변환."""
     return {
@@ -202,40 +252,40 @@ def _to_geojson_feature(poi: dict) -> dict:
 
 
 def transform_pois() -> dict[str, dict]:
-    """area_based_{lang}.json → pois/geojson 변환.
+    """area_based_{lang}.json → POI 변환.
+
+    변환 결과는 열 기반 PoiTable에 바로 넣고, GeoJSON Feature는 save_pois()에서 기록할 때 만든다.
 
     Returns:
-        {"kr": {"pois": [...], "geojson": {...}}, "en": {...}}
+        {"kr": {"pois": PoiTable, "excluded": PoiTable}, "en": {...}}
     """
     category_map = build_category_map()
 
     result: dict[str, dict] = {}
     for lang in ("kr", "en"):
-        lang_key = "ko" if lang == "kr" else "en"
+        plan = TransformPlan(lang, category_map)
 
         data_path = OUTPUT_DIR / f"area_based_{lang}.json"
         if not data_path.exists():
             print(f"[Transform] {data_path} 파일 없음, 건너뜀")
             continue
 
-        items = json.loads(data_path.read_text(encoding="utf-8"))
-
-        exclude_codes = EXCLUDE_LCLS3_KR if lang == "kr" else EXCLUDE_LCLS3_EN
-        pois = []
-        excluded = []
-        for item in items:
-            transformed = transform_item(item, lang_key, category_map)
-            if item.get("lclsSystm3", "") in exclude_codes:
+        items = json.loads(data_path.read_bytes())
+
+        pois = PoiTable()
+        excluded = PoiTable()
+        for raw in items:
+            # 항목별로 검증하여 원본 dict와 모델을 함께 오래 들고 있지 않는다
+            item = try_decode(AreaBasedItem, raw)
+            if item is None:
+                continue
+            transformed = plan.transform(item)
+            if plan.is_excluded(item):
                 excluded.append(transformed)
             else:
                 pois.append(transformed)
 
-        geojson = {
-            "type": "FeatureCollection",
-            "features": [_to_geojson_feature(poi) for poi in pois],
-        }
-
-        result[lang] = {"pois": pois, "geojson": geojson, "excluded": excluded}
+        result[lang] = {"pois": pois, "excluded": excluded}
 
     return result
 
@@ -244,32 +294,162 @@ def save_pois(data: dict[str, dict]) -> list[Path]:
     """변환된 데이터를 output/pois_{lang}.json, pois_geo_{lang}.json으로 저장.
 
     제외된 항목은 pois_exclude_{lang}.json으로 별도 저장 (DB 미입력).
+    PoiTable은 행마다 dict로 바꿔 바로 기록하므로 전체 dict 목록을 만들지 않는다.
     """
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     saved: list[Path] = []
 
     for lang, content in data.items():
-        pois_path = OUTPUT_DIR / f"pois_{lang}.json"
-        pois_path.write_text(
-            json.dumps(content["pois"], ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        saved.append(pois_path)
+        writer = PoiOutputWriter(lang)
+        try:
+            pois = content["pois"]
+            for poi in pois.iter_dicts() if isinstance(pois, PoiTable) else pois:
+                writer.write(poi)
+            excluded = content.get("excluded") or []
+            for poi in excluded.iter_dicts() if isinstance(excluded, PoiTable) else excluded:
+                writer.write(poi, excluded=True)
+        except BaseException:
+            writer.abort()
+            raise
+        saved.extend(writer.close())
 
-        geo_path = OUTPUT_DIR / f"pois_geo_{lang}.json"
-        geo_path.write_text(
-            json.dumps(content["geojson"], ensure_ascii=False, indent=2),
-            encoding="utf-8",
+    return saved
+
+
+class PoiOutputWriter:
+    """pois_{lang}.json / pois_geo_{lang}.json / pois_exclude_{lang}.json 스트리밍 writer.
+
+    save_pois()와 바이트 단위로 같은 파일을 POI 1건씩 기록한다 (Step 2 스트리밍 파이프라인용).
+    pois_exclude_{lang}.json은 제외 항목이 있을 때만 만든다.
+    """
+
+    def __init__(self, lang: str) -> None:
+        self.lang = lang
+        self.pois = JsonArrayWriter(OUTPUT_DIR / f"pois_{lang}.json")
+        self.geo = JsonArrayWriter(
+            OUTPUT_DIR / f"pois_geo_{lang}.json",
+            prefix='{\n  "type": "FeatureCollection",\n  "features": ',
+            suffix="\n}",
+            level=1,
         )
-        saved.append(geo_path)
+        self.excluded: JsonArrayWriter | None = None
 
-        excluded = content.get("excluded", [])
+    def write(self, poi: dict, excluded: bool = False) -> None:
         if excluded:
-            exclude_path = OUTPUT_DIR / f"pois_exclude_{lang}.json"
-            exclude_path.write_text(
-                json.dumps(excluded, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-            saved.append(exclude_path)
+            if self.excluded is None:
+                self.excluded = JsonArrayWriter(OUTPUT_DIR / f"pois_exclude_{self.lang}.json")
+            self.excluded.write(poi)
+        else:
+            self.pois.write(poi)
+            self.geo.write(_to_geojson_feature(poi))
+
+    def close(self) -> list[Path]:
+        """모든 파일을 닫고 저장 경로를 반환한다 (save_pois()와 같은 순서)."""
+        saved = [self.pois.close(), self.geo.close()]
+        if self.excluded is not None:
+            saved.append(self.excluded.close())
+        return saved
+
+    def write_encoded(self, pois: list[str], features: list[str], excluded: list[str]) -> None:
+        """_transform_chunk()가 미리 직렬화한 항목을 기록한다."""
+        for text in pois:
+            self.pois.write_encoded(text)
+        for text in features:
+            self.geo.write_encoded(text)
+        if excluded and self.excluded is None:
+            self.excluded = JsonArrayWriter(OUTPUT_DIR / f"pois_exclude_{self.lang}.json")
+        for text in excluded:
+            self.excluded.write_encoded(text)
+
+    def abort(self) -> None:
+        for writer in (self.pois, self.geo, self.excluded):
+            if writer is not None:
+                writer.abort()
+
+
+# 프로세스 풀 워커별 변환 계획 (_init_transform_worker에서 1회 구성)
+_WORKER_PLANS: dict[str, TransformPlan] = {}
+
+
+def _init_transform_worker(category_map: dict) -> None:
+    for lang in ("kr", "en"):
+        _WORKER_PLANS[lang] = TransformPlan(lang, category_map)
 
-    return saved
+
+def _transform_chunk(lang: str, items: list[dict]) -> tuple[list[str], list[str], list[str]]:
+    """청크를 변환하고 출력 파일 항목으로 직렬화한다 (프로세스 풀에서 실행).
+
+    Returns:
+        (pois, features, excluded) — encode_json_item()으로 직렬화된 항목 (입력 순서 유지)
+    """
+    plan = _WORKER_PLANS[lang]
+    pois, features, excluded = [], [], []
+    for raw in items:
+        item = try_decode(AreaBasedItem, raw)
+        if item is None:
+            continue
+        poi = plan.transform(item)
+        if plan.is_excluded(item):
+            excluded.append(encode_json_item(poi, 0))
+        else:
+            pois.append(encode_json_item(poi, 0))
+            features.append(encode_json_item(_to_geojson_feature(poi), 1))
+    return pois, features, excluded
+
+
+def transform_pois_parallel(
+    workers: int, chunk_size: int = TRANSFORM_CHUNK_SIZE
+) -> tuple[dict[str, dict[str, int]], list[Path]]:
+    """area_based_{lang}.json → pois/geojson 변환 + 저장을 프로세스 풀로 수행한다.
+
+    transform_pois() + save_pois()와 바이트 단위로 같은 파일을 만든다.
+    언어별 입력을 청크로 나눠 변환과 JSON 직렬화를 워커 프로세스에서 수행하고,
+    부모 프로세스는 청크 순서대로 이어 붙이기만 하므로 결과가 항상 같다.
+    두 언어의 청크를 한 풀에 함께 넣으므로 workers >= 2이면 언어가 동시에 처리된다.
+
+    Args:
+        workers: 프로세스 수
+        chunk_size: 청크당 최대 항목 수 (언어별 항목 수 / workers보다 크면 그 값으로 줄임)
+
+    Returns:
+        (counts, saved) — counts: {"kr": {"pois": N, "excluded": N}, ...}, saved: 저장된 파일 경로
+    """
+    category_map = build_category_map()
+
+    chunks: list[tuple[str, list[dict]]] = []
+    for lang in ("kr", "en"):
+        data_path = OUTPUT_DIR / f"area_based_{lang}.json"
+        if not data_path.exists():
+            print(f"[Transform] {data_path} 파일 없음, 건너뜀")
+            continue
+        items = json.loads(data_path.read_text(encoding="utf-8"))
+        size = max(1, min(chunk_size, math.ceil(len(items) / workers)))
+        lang_chunks = [(lang, items[i : i + size]) for i in range(0, len(items), size)]
+        chunks.extend(lang_chunks or [(lang, [])])
+        print(f"[Transform] [{lang}] {len(items)}건 → 청크 {len(lang_chunks)}개")
+
+    counts: dict[str, dict[str, int]] = {}
+    saved: list[Path] = []
+    writer: PoiOutputWriter | None = None
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_transform_worker, initargs=(category_map,)
+    ) as executor:
+        results = executor.map(_transform_chunk, *zip(*chunks)) if chunks else []
+        try:
+            for (lang, _), (pois, features, excluded) in zip(chunks, results):
+                if writer is None or writer.lang != lang:
+                    if writer is not None:
+                        saved.extend(writer.close())
+                    writer = PoiOutputWriter(lang)
+                    counts[lang] = {"pois": 0, "excluded": 0}
+                writer.write_encoded(pois, features, excluded)
+                counts[lang]["pois"] += len(pois)
+                counts[lang]["excluded"] += len(excluded)
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+        if writer is not None:
+            saved.extend(writer.close())
+
+    return counts, saved
@@ -1,14 +1,45 @@
-"""detailCommon2/detailIntro2/detailInfo2 API 응답을 기존 POI에 병합하는 변환 로직."""
+"""detailCommon2/detailIntro2/detailInfo2 API 응답을 기존 POI에 병합하는 변환 로직.
 
+병합은 순수 CPU 작업이므로 여러 건을 merge_details()로 한 번에 처리하고,
+비동기 수집 루프에서는 merge_details_async()로 이벤트 루프 밖(스레드/프로세스 풀)에서 실행한다.
+
+사용 예:
+    merged = merge_details([DetailMerge(poi, common, intro, info, images, pet)])
+    merged = await merge_details_async(entries, in_place=True)   # 기본 스레드 풀
+"""
+
+import asyncio
 import re
+from concurrent.futures import Executor
 from datetime import date
+from functools import partial
+from typing import Iterable, NamedTuple
+
+from src.models import DetailCommonItem, DetailImageItem, decode_item, decode_items
+from src.transformers.pois import _format_date
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+# API 응답 항목에서 제거하는 필드
+_DROP_KEYS = frozenset(("contentid", "contenttypeid", "serialnum"))
+
+
+class DetailMerge(NamedTuple):
+    """merge_details() 입력 한 건 (merge_detail_to_poi()의 인자와 같다)."""
+
+    poi: dict
+    common: DetailCommonItem | dict | None
+    intro_items: list[dict] | None
+    info_items: list[dict] | None
+    image_items: list[DetailImageItem] | list[dict] | None = None
+    pet_item: dict | None = None
+    modifiedtime: str | None = None
 
 
 def _strip_html(text: str) -> str:
     """HTML 태그를 제거한다."""
     if not text:
         return ""
-    return re.sub(r"<[^>]+>", "", text).strip()
+    return _HTML_TAG_RE.sub("", text).strip()
 
 
 def _normalize_url(url: str) -> str:
@@ -19,48 +50,94 @@ def _normalize_url(url: str) -> str:
 
 
 def _clean_item(item: dict) -> dict:
-    """API 응답 항목에서 불필요한 필드를 제거하고 빈 값을 필터링한다."""
-    cleaned = dict(item)
-    for key in ("contentid", "contenttypeid", "serialnum"):
-        cleaned.pop(key, None)
-    # 빈 값 필드 제거
-    return {k: v for k, v in cleaned.items() if v}
+    """API 응답 항목에서 불필요한 필드와 빈 값 필드를 제거한다 (한 번의 복사)."""
+    return {k: v for k, v in item.items() if v and k not in _DROP_KEYS}
 
 
 def merge_detail_to_poi(
     poi: dict,
-    common: dict | None,
+    common: DetailCommonItem | dict | None,
     intro_items: list[dict] | None,
     info_items: list[dict] | None,
-    image_items: list[dict] | None = None,
+    image_items: list[DetailImageItem] | list[dict] | None = None,
     pet_item: dict | None = None,
+    modifiedtime: str | None = None,
 ) -> dict:
     """detailCommon2/detailIntro2/detailInfo2/detailImage2/detailPetTour2 응답을 기존 POI 문서에 병합한다.
 
     Args:
         poi: 기존 POI 문서 (pois_{lang}.json의 항목)
-        common: detailCommon2 API 응답 항목 (없으면 None)
+        common: detailCommon2 API 응답 항목 (DetailCommonItem 또는 dict, 없으면 None)
         intro_items: detailIntro2 API 응답 항목 배열 (없으면 None)
         info_items: detailInfo2 API 응답 항목 배열 (없으면 None)
-        image_items: detailImage2 API 응답 항목 배열 (없으면 None)
+        image_items: detailImage2 API 응답 항목 배열 (DetailImageItem 또는 dict, 없으면 None)
         pet_item: detailPetTour2 API 응답 첫 번째 항목 (없으면 None, 한글만 지원)
+        modifiedtime: 상세 수신 기준 원본 modifiedtime (None이면 poi["source"]["modifiedtime"])
 
     Returns:
         업데이트된 POI 문서 (원본을 복사하여 반환)
     """
-    updated = dict(poi)
+    return _merge_one(
+        DetailMerge(poi, common, intro_items, info_items, image_items, pet_item, modifiedtime),
+        date.today().isoformat(),
+        in_place=False,
+    )
+
+
+def merge_details(
+    entries: Iterable[DetailMerge],
+    today: str | None = None,
+    in_place: bool = False,
+) -> list[dict]:
+    """여러 POI의 상세 응답을 한 번에 병합한다 (입력 순서대로 결과 반환).
+
+    Args:
+        entries: DetailMerge (또는 같은 순서의 튜플) 목록
+        today: detailUpdatedAt 값 (None이면 오늘 날짜를 한 번만 계산)
+        in_place: True이면 entry.poi를 복사하지 않고 그 dict에 병합한다
+            (호출자가 소유한 dict일 때만 — PoiRow.to_dict() 결과 등)
+    """
+    if today is None:
+        today = date.today().isoformat()
+    return [_merge_one(DetailMerge(*entry), today, in_place) for entry in entries]
+
+
+async def merge_details_async(
+    entries: Iterable[DetailMerge],
+    executor: Executor | None = None,
+    in_place: bool = False,
+) -> list[dict]:
+    """merge_details()를 이벤트 루프 밖에서 실행한다.
+
+    executor가 None이면 기본 스레드 풀, ProcessPoolExecutor를 주면 프로세스에서 병합한다
+    (프로세스 풀은 입력/결과를 pickle로 주고받으므로 in_place는 의미가 없다).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(merge_details, list(entries), None, in_place))
+
+
+def _merge_one(entry: DetailMerge, today: str, in_place: bool) -> dict:
+    """DetailMerge 한 건을 병합한다 (중첩 dict/list는 바뀌는 필드만 새로 만든다)."""
+    poi, common, intro_items, info_items, image_items, pet_item, modifiedtime = entry
+    updated = poi if in_place else dict(poi)
 
     # 기존 details 필드 제거 (intro로 대체)
     updated.pop("details", None)
 
+    # dict 응답은 모델로 검증 (fetch_detail_for_poi()는 이미 모델로 반환)
+    if type(common) is dict:
+        common = decode_item(DetailCommonItem, common) if common else None
+    if image_items and type(image_items[0]) is dict:
+        image_items = decode_items(DetailImageItem, image_items)
+
     if common:
         # overview → description (비어있지 않을 때만)
-        overview = common.get("overview", "")
+        overview = common.overview
         if overview:
             updated["description"] = overview
 
         # mlevel (정수 변환)
-        mlevel = common.get("mlevel", "")
+        mlevel = common.mlevel
         if mlevel:
             try:
                 updated["mlevel"] = int(mlevel)
@@ -68,8 +145,8 @@ def merge_detail_to_poi(
                 updated["mlevel"] = 0
 
         # 좌표 업데이트 (유효한 경우만)
-        mapx = common.get("mapx", "")
-        mapy = common.get("mapy", "")
+        mapx = common.mapx
+        mapy = common.mapy
         if mapx and mapy and mapx != "null" and mapy != "null":
             try:
                 lng = float(mapx)
@@ -84,12 +161,12 @@ def merge_detail_to_poi(
                 pass
 
         # homepage → website (HTML 태그 제거)
-        homepage = common.get("homepage", "")
+        homepage = common.homepage
         if homepage:
             updated["website"] = _strip_html(homepage)
 
         # tel → contact
-        tel = common.get("tel", "")
+        tel = common.tel
         if tel:
             updated["contact"] = tel
 
@@ -99,6 +176,14 @@ def merge_detail_to_poi(
     else:
         updated["intro"] = []
 
+    # detailIntro2 행사 기간 → 최상위 ISO 날짜 (행사 기간/캘린더 조회용, 행사 타입만 해당)
+    for intro in updated["intro"]:
+        start, end = _format_date(intro.get("eventstartdate", "")), _format_date(intro.get("eventenddate", ""))
+        if start and end:
+            updated["eventStartDate"] = start
+            updated["eventEndDate"] = end
+            break
+
     # detailInfo2 → info (배열)
     if info_items:
         updated["info"] = [_clean_item(item) for item in info_items]
@@ -107,15 +192,11 @@ def merge_detail_to_poi(
 
     # detailImage2 → images 배열 + thumbnail
     if image_items:
-        images = [
-            _normalize_url(item.get("originimgurl", ""))
-            for item in image_items
-            if item.get("originimgurl")
-        ]
+        images = [_normalize_url(item.originimgurl) for item in image_items if item.originimgurl]
         if images:
             updated["images"] = images
         # 첫 번째 smallimageurl → thumbnail
-        first_small = image_items[0].get("smallimageurl", "")
+        first_small = image_items[0].smallimageurl
         if first_small:
             updated["thumbnail"] = _normalize_url(first_small)
     # API 호출 완료 표시 (이미지가 없는 POI도 완료로 처리)
@@ -129,6 +210,12 @@ def merge_detail_to_poi(
         updated["detailPetUpdated"] = True
 
     # 업데이트 완료 표시 (스킵 판별용)
-    updated["detailUpdatedAt"] = date.today().isoformat()
+    updated["detailUpdatedAt"] = today
+
+    # 상세 수신 기준 원본 modifiedtime (변경 감지 게이트용)
+    if modifiedtime is None:
+        modifiedtime = poi.get("source", {}).get("modifiedtime", "")
+    if modifiedtime:
+        updated["detailModifiedTime"] = modifiedtime
 
     return updated
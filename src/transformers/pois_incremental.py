@@ -0,0 +1,202 @@
+"""원본 해시 기반 POI 증분 재변환 (--transform-only --incremental).
+
+상태 구조 (output/transform_state_{lang}.json):
+{
+    "version": "...",                  # 변환 규칙 해시 (분류 맵, 제외 코드, 지역/앱 카테고리 매핑)
+    "hashes": {"2733967": "sha1", ...} # contentId → 원본 항목 해시
+}
+
+원본 해시와 변환 규칙이 그대로인 항목은 이전 pois_/pois_exclude_ 파일의 문서를 재사용하고,
+신규/변경 항목만 다시 변환한다. 출력 파일은 전체 변환(transform_pois() + save_pois())과 바이트 단위로 같다.
+변환 규칙이 바뀌었으면 전체 항목을 다시 변환한다.
+
+변경분(output/transform_delta_{lang}.json)은 pois_{lang}.json(DB 입력 대상) 기준으로 기록한다:
+    added   — 새로 추가된 POI (신규 항목, 제외 해제)
+    changed — 변환 결과가 달라진 POI
+    removed — 사라진 POI (원본에서 삭제, 새로 제외)
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+from src.models import AreaBasedItem, try_decode
+from src.transformers.pois import (
+    CATEGORY_APP_MAP_EN,
+    CATEGORY_APP_MAP_KR,
+    OUTPUT_DIR,
+    PoiOutputWriter,
+    TransformPlan,
+    build_category_map,
+)
+from src.transformers.regions import REGION_CODE_MAP
+
+# _build_poi() 출력 구조가 바뀌면 올려서 전체 재변환을 유도한다
+TRANSFORM_STATE_VERSION = 1
+
+
+def _state_path(lang: str) -> Path:
+    return OUTPUT_DIR / f"transform_state_{lang}.json"
+
+
+def _delta_path(lang: str) -> Path:
+    return OUTPUT_DIR / f"transform_delta_{lang}.json"
+
+
+def raw_hash(item: dict) -> str:
+    """원본 항목 해시 (키 순서와 무관)."""
+    raw = json.dumps(item, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def plan_version(plan: TransformPlan) -> str:
+    """변환 결과에 영향을 주는 규칙(분류 맵, 제외 코드, 매핑 상수)의 해시."""
+    raw = json.dumps(
+        [
+            TRANSFORM_STATE_VERSION,
+            plan.lang,
+            plan.category_map,
+            sorted(plan.exclude_codes),
+            REGION_CODE_MAP,
+            CATEGORY_APP_MAP_KR,
+            CATEGORY_APP_MAP_EN,
+        ],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _load_state(lang: str) -> dict:
+    path = _state_path(lang)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        print(f"[Transform] [경고] {path} 손상, 전체 재변환합니다: {e}")
+        return {}
+
+
+def _save_json_atomic(path: Path, data: dict, indent: int | None = None) -> Path:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=indent), encoding="utf-8")
+    tmp_path.replace(path)
+    return path
+
+
+def _load_docs(path: Path) -> dict[str, dict]:
+    """이전 출력 파일 → {id: POI} (파일이 없으면 빈 딕셔너리)."""
+    if not path.exists():
+        return {}
+    return {doc["id"]: doc for doc in json.loads(path.read_text(encoding="utf-8"))}
+
+
+def transform_pois_incremental() -> dict[str, dict]:
+    """area_based_{lang}.json 중 신규/변경 항목만 다시 변환하여 pois/geojson 파일을 갱신한다.
+
+    Returns:
+        {lang: {
+            "pois": N, "excluded": N,         # 저장된 건수
+            "retransformed": N, "reused": N,  # 다시 변환한 건수 / 이전 결과 재사용 건수
+            "full": bool,                     # 변환 규칙 변경 또는 이전 상태 없음으로 전체 재변환했는지
+            "delta": {"added": [id], "changed": [id], "removed": [id]},
+            "upserts": [POI],                 # added + changed 문서 (MongoDB 반영용)
+            "paths": [Path],
+        }}
+    """
+    category_map = build_category_map()
+    results: dict[str, dict] = {}
+
+    for lang in ("kr", "en"):
+        data_path = OUTPUT_DIR / f"area_based_{lang}.json"
+        if not data_path.exists():
+            print(f"[Transform] {data_path} 파일 없음, 건너뜀")
+            continue
+
+        plan = TransformPlan(lang, category_map)
+        version = plan_version(plan)
+        state = _load_state(lang)
+        old_pois = _load_docs(OUTPUT_DIR / f"pois_{lang}.json")
+        old_excluded = _load_docs(OUTPUT_DIR / f"pois_exclude_{lang}.json")
+
+        full = state.get("version") != version or not old_pois
+        old_hashes: dict[str, str] = {} if full else state.get("hashes", {})
+
+        items = json.loads(data_path.read_text(encoding="utf-8"))
+        hashes: dict[str, str] = {}
+        new_ids: set[str] = set()
+        added: list[str] = []
+        changed: list[str] = []
+        upserts: list[dict] = []
+        retransformed = 0
+
+        writer = PoiOutputWriter(lang)
+        try:
+            for raw in items:
+                item = try_decode(AreaBasedItem, raw)
+                if item is None:
+                    continue
+                content_id = item.contentid
+                item_hash = raw_hash(raw)
+                hashes[content_id] = item_hash
+
+                poi = None
+                if old_hashes.get(content_id) == item_hash:
+                    poi = old_pois.get(content_id) or old_excluded.get(content_id)
+                if poi is None:
+                    poi = plan.transform(item)
+                    retransformed += 1
+
+                excluded = plan.is_excluded(item)
+                writer.write(poi, excluded=excluded)
+                if excluded or content_id in new_ids:
+                    continue
+
+                new_ids.add(content_id)
+                previous = old_pois.get(content_id)
+                if previous is None:
+                    added.append(content_id)
+                    upserts.append(poi)
+                elif poi is not previous and poi != previous:
+                    changed.append(content_id)
+                    upserts.append(poi)
+        except BaseException:
+            writer.abort()
+            raise
+
+        paths = writer.close()
+        # 제외 항목이 모두 사라지면 이전 pois_exclude 파일도 정리 (save_pois()는 만들지 않음)
+        if writer.excluded is None:
+            (OUTPUT_DIR / f"pois_exclude_{lang}.json").unlink(missing_ok=True)
+
+        delta = {
+            "added": added,
+            "changed": changed,
+            "removed": sorted(set(old_pois) - new_ids),
+        }
+        _save_json_atomic(_state_path(lang), {"version": version, "hashes": hashes})
+        _save_json_atomic(
+            _delta_path(lang),
+            {"generatedAt": datetime.now().isoformat(timespec="seconds"), "full": full, **delta},
+            indent=2,
+        )
+
+        results[lang] = {
+            "pois": writer.pois.count,
+            "excluded": writer.excluded.count if writer.excluded is not None else 0,
+            "retransformed": retransformed,
+            "reused": len(items) - retransformed,
+            "full": full,
+            "delta": delta,
+            "upserts": upserts,
+            "paths": paths,
+        }
+        print(
+            f"[Transform] [{lang}] {len(items)}건 중 {retransformed}건 재변환"
+            f"{' (전체)' if full else ''} — 추가 {len(added)}, 변경 {len(changed)}, "
+            f"삭제 {len(delta['removed'])} → {_delta_path(lang)}"
+        )
+
+    return results
@@ -0,0 +1,171 @@
+"""참조 데이터 번들 (output/reference.pickle) — 분류체계/지역/콘텐츠 타입/제외 코드.
+
+Step 1이 categories.json 변환 직후 생성하며, 변환/동기화/행사 단계가 공통으로 읽는다.
+JSON 파싱 없이 pickle 1회 로드로 끝나고, 프로세스 안에서는 메모리에 유지한다.
+
+번들 구조:
+{
+    "version": 1,
+    "sources": {"categories.json": [mtime_ns, size, sha256], "content-types.json": [...]},
+    "fingerprint": "...",                     # 코드 상수(제외 코드, 지역 매핑) 해시
+    "category_map": {code: {"ko": name, "en": name}},
+    "exclude_lcls3": {"kr": frozenset, "en": frozenset},
+    "region_code_map": {"11": "seoul", ...},
+    "content_type_ids": {"kr": ["12", ...], "en": ["76", ...]},  # content-types.json이 없으면 None
+}
+
+원본 파일의 mtime/크기가 바뀌면 sha256을 비교하여 내용이 달라진 경우에만 다시 만든다.
+코드 상수가 바뀌면 fingerprint 불일치로 다시 만든다.
+"""
+
+import hashlib
+import json
+import pickle
+from functools import lru_cache
+from pathlib import Path
+
+OUTPUT_DIR = Path(__file__).resolve().parent.parent.parent / "output"
+REFERENCE_PATH = OUTPUT_DIR / "reference.pickle"
+CATEGORIES_PATH = OUTPUT_DIR / "categories.json"
+CONTENT_TYPES_PATH = OUTPUT_DIR / "content-types.json"
+
+BUNDLE_VERSION = 1
+
+_SOURCES = {
+    "categories.json": CATEGORIES_PATH,
+    "content-types.json": CONTENT_TYPES_PATH,
+}
+
+# 프로세스 내 캐시
+_bundle: dict | None = None
+
+
+def _file_signature(path: Path) -> list | None:
+    """[mtime_ns, size, sha256] (파일이 없으면 None)."""
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size, hashlib.sha256(path.read_bytes()).hexdigest()]
+
+
+@lru_cache(maxsize=1)
+def _fingerprint() -> str:
+    """번들에 포함되는 코드 상수의 해시 (상수 변경 시 번들 재생성)."""
+    from src.transformers.pois import EXCLUDE_LCLS3_EN, EXCLUDE_LCLS3_KR
+    from src.transformers.regions import REGION_CODE_MAP
+
+    raw = json.dumps(
+        [BUNDLE_VERSION, EXCLUDE_LCLS3_KR, EXCLUDE_LCLS3_EN, REGION_CODE_MAP], sort_keys=True
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _flatten_categories(categories: list[dict]) -> dict[str, dict[str, str]]:
+    """categories.json 트리 → {code: {"ko": name, "en": name}}."""
+    cat_map: dict[str, dict[str, str]] = {}
+    for top in categories:
+        cat_map[top["code"]] = top["name"]
+        for child in top.get("list", []):
+            cat_map[child["code"]] = child["name"]
+            for grandchild in child.get("list", []):
+                cat_map[grandchild["code"]] = grandchild["name"]
+    return cat_map
+
+
+def _content_type_ids(content_types: list[dict]) -> dict[str, list[str]]:
+    """content-types.json → 언어별 사용 가능한 contentTypeId 목록."""
+    ids: dict[str, list[str]] = {"kr": [], "en": []}
+    for ct in content_types:
+        code = ct.get("code", {})
+        for lang in ids:
+            if lang in code and code[lang]:
+                ids[lang].append(str(code[lang]))
+    return ids
+
+
+def build_reference_bundle() -> dict:
+    """원본 파일과 코드 상수로 참조 데이터 번들을 만든다."""
+    from src.transformers.pois import EXCLUDE_LCLS3_EN, EXCLUDE_LCLS3_KR
+    from src.transformers.regions import REGION_CODE_MAP
+
+    categories = json.loads(CATEGORIES_PATH.read_text(encoding="utf-8"))
+    content_types = (
+        json.loads(CONTENT_TYPES_PATH.read_text(encoding="utf-8"))
+        if CONTENT_TYPES_PATH.exists()
+        else None
+    )
+
+    return {
+        "version": BUNDLE_VERSION,
+        "sources": {name: _file_signature(path) for name, path in _SOURCES.items()},
+        "fingerprint": _fingerprint(),
+        "category_map": _flatten_categories(categories),
+        "exclude_lcls3": {"kr": frozenset(EXCLUDE_LCLS3_KR), "en": frozenset(EXCLUDE_LCLS3_EN)},
+        "region_code_map": dict(REGION_CODE_MAP),
+        "content_type_ids": _content_type_ids(content_types) if content_types is not None else None,
+    }
+
+
+def save_reference_bundle(bundle: dict | None = None) -> Path:
+    """참조 데이터 번들을 output/reference.pickle로 저장한다 (None이면 새로 생성)."""
+    global _bundle
+
+    bundle = bundle or build_reference_bundle()
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = REFERENCE_PATH.with_name(REFERENCE_PATH.name + ".tmp")
+    tmp_path.write_bytes(pickle.dumps(bundle, protocol=pickle.HIGHEST_PROTOCOL))
+    tmp_path.replace(REFERENCE_PATH)
+    _bundle = bundle
+    return REFERENCE_PATH
+
+
+def _is_current(bundle: dict) -> bool:
+    """번들이 원본 파일/코드 상수와 일치하는지 확인한다.
+
+    mtime_ns와 크기가 같으면 해시 계산 없이 일치로 판정한다.
+    """
+    if bundle.get("version") != BUNDLE_VERSION or bundle.get("fingerprint") != _fingerprint():
+        return False
+    for name, path in _SOURCES.items():
+        recorded = bundle["sources"].get(name)
+        if not path.exists():
+            if recorded is not None:
+                return False
+            continue
+        if recorded is None:
+            return False
+        stat = path.stat()
+        if [stat.st_mtime_ns, stat.st_size] == recorded[:2]:
+            continue
+        # 내용이 같으면 (checkout 등으로 mtime만 바뀐 경우) 기록된 mtime만 갱신
+        signature = _file_signature(path)
+        if signature[2] != recorded[2]:
+            return False
+        bundle["sources"][name] = signature
+    return True
+
+
+def load_reference_bundle() -> dict:
+    """참조 데이터 번들을 반환한다.
+
+    프로세스 내 캐시 → output/reference.pickle 순으로 사용하며,
+    원본 파일이나 코드 상수가 바뀌었으면 다시 만들어 저장한다.
+    """
+    global _bundle
+
+    if _bundle is not None and _is_current(_bundle):
+        return _bundle
+
+    if REFERENCE_PATH.exists():
+        try:
+            bundle = pickle.loads(REFERENCE_PATH.read_bytes())
+        except (pickle.UnpicklingError, EOFError, AttributeError, ValueError) as e:
+            print(f"[참조 번들] [경고] {REFERENCE_PATH} 로드 실패, 다시 생성합니다: {e}")
+            bundle = None
+        if bundle is not None and _is_current(bundle):
+            _bundle = bundle
+            return bundle
+
+    print(f"[참조 번들] {REFERENCE_PATH} 생성 (파일 없음 또는 원본 변경)")
+    save_reference_bundle()
+    return _bundle
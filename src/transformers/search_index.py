@@ -0,0 +1,559 @@
+"""POI 전문 검색 역색인 (output/search/{lang}/).
+
+name / address / tags / description을 토큰화하여 BM25로 순위를 매기는 역색인을 만든다.
+
+- 토큰화: 한글은 음절 2-gram (한 음절짜리 어절은 그대로), 영문/숫자는 소문자 단어 (불용어 제외)
+  '경복궁 야간관람' → 경복, 복궁, 야간, 간관, 관람
+- 필드 가중치: SEARCH_FIELD_WEIGHTS (문서별 term 가중 빈도와 가중 길이로 BM25 계산)
+- 한 음절 한글 질의('궁')는 그 음절로 시작하거나 끝나는 모든 2-gram으로 확장한다 ('궁궐', '경복궁'의 '복궁')
+
+파일 구성:
+- base.idx: 전체 생성 세그먼트 (mmap으로 열어 배열 복사 없이 조회)
+  헤더 + id 오프셋/문서 길이/지역/앱 카테고리 배열 + id 문자열 + term 오프셋/포스팅 오프셋
+  + 포스팅 문서 번호/가중 빈도 배열 + term 문자열 (term과 id는 UTF-8 바이트 순 정렬)
+- meta.json: 생성 정보, 문서 수/총 길이, 지역/앱 카테고리 번호표
+- delta.pickle: Step 3/4/5 변경분 세그먼트 ({id: 문서}, 삭제 id)
+  base의 같은 id 문서는 가려지고, 변경분이 base의 SEARCH_DELTA_MAX_RATIO를 넘으면
+  두 세그먼트를 병합해 base.idx를 다시 쓴다 (원문 없이 포스팅만으로 병합).
+
+사용 예:
+    index = SearchIndex.open("kr")
+    index.search("경복궁 야간", k=10, region="seoul")          # [(id, score), ...]
+    index.search("night tour", app_category="culture")
+"""
+
+import heapq
+import json
+import math
+import mmap
+import pickle
+import re
+import struct
+import sys
+import unicodedata
+from array import array
+from datetime import datetime
+from pathlib import Path
+
+from src.transformers.pois import OUTPUT_DIR
+
+SEARCH_DIR = OUTPUT_DIR / "search"
+SEARCH_INDEX_VERSION = 1
+
+SEARCH_FIELD_WEIGHTS = {"name": 3.0, "tags": 1.5, "address": 1.0, "description": 0.5}
+# 변경분 문서 수가 base 문서 수의 이 비율을 넘으면 병합
+SEARCH_DELTA_MAX_RATIO = 0.1
+SEARCH_DELTA_MIN_DOCS = 500
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_MAGIC = b"KSIX"
+_HEADER = struct.Struct("=4s7I")
+_TOKEN_RE = re.compile(r"[가-힣]+|[0-9a-zÀ-ɏ]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or the to with".split()
+)
+
+
+# ── 토큰화 ──
+
+
+def _is_hangul(ch: str) -> bool:
+    return "가" <= ch <= "힣"
+
+
+def tokenize(text: str) -> list[str]:
+    """검색 토큰 목록 (중복 포함, 등장 순서)."""
+    text = unicodedata.normalize("NFKC", text).lower()
+    tokens = []
+    for run in _TOKEN_RE.findall(text):
+        if _is_hangul(run[0]):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+        elif run not in _STOPWORDS:
+            tokens.append(run)
+    return tokens
+
+
+def _doc_record(poi: dict) -> tuple[dict[str, float], float, str, str]:
+    """POI → (term 가중 빈도, 가중 길이, region, appCategory)."""
+    terms: dict[str, float] = {}
+    length = 0.0
+    for field, weight in SEARCH_FIELD_WEIGHTS.items():
+        value = poi.get(field) or ""
+        if isinstance(value, list):
+            value = " ".join(value)
+        tokens = tokenize(value)
+        length += weight * len(tokens)
+        for token in tokens:
+            terms[token] = terms.get(token, 0.0) + weight
+    return terms, length, poi.get("region", ""), poi.get("appCategory", "")
+
+
+# ── 세그먼트 기록 ──
+
+
+def _pad4(data: bytes) -> bytes:
+    return data + b"\0" * (-len(data) % 4)
+
+
+def _blob(values: list[str]) -> tuple[array, bytes]:
+    """문자열 목록 → (오프셋 u32[n+1], UTF-8 연결 바이트)."""
+    offsets = array("I", [0])
+    parts = []
+    for value in values:
+        encoded = value.encode("utf-8")
+        parts.append(encoded)
+        offsets.append(offsets[-1] + len(encoded))
+    return offsets, b"".join(parts)
+
+
+def _write_base(lang: str, ids: list[str], records: list[tuple[float, str, str]], postings) -> dict:
+    """base.idx + meta.json을 기록한다.
+
+    Args:
+        ids: UTF-8 바이트 순으로 정렬된 문서 id
+        records: 문서 번호별 (가중 길이, region, appCategory)
+        postings: (term, 문서 번호 array("I"), 가중 빈도 array("f"))를 term 순으로 내는 iterable
+    """
+    regions: dict[str, int] = {}
+    apps: dict[str, int] = {}
+    doc_len = array("f")
+    doc_region = array("H")
+    doc_app = array("H")
+    for length, region, app in records:
+        doc_len.append(length)
+        doc_region.append(regions.setdefault(region, len(regions)))
+        doc_app.append(apps.setdefault(app, len(apps)))
+
+    terms: list[str] = []
+    post_offsets = array("I", [0])
+    post_docs = array("I")
+    post_weights = array("f")
+    for term, docs, weights in postings:
+        terms.append(term)
+        post_docs.extend(docs)
+        post_weights.extend(weights)
+        post_offsets.append(len(post_docs))
+
+    id_offsets, id_blob = _blob(ids)
+    term_offsets, term_blob = _blob(terms)
+    header = _HEADER.pack(
+        _MAGIC, SEARCH_INDEX_VERSION, len(ids), len(terms), len(post_docs), len(id_blob), len(term_blob), 0
+    )
+
+    lang_dir = SEARCH_DIR / lang
+    lang_dir.mkdir(parents=True, exist_ok=True)
+    path = lang_dir / "base.idx"
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for section in (id_offsets, doc_len, doc_region, doc_app):
+            f.write(_pad4(section.tobytes()))
+        f.write(_pad4(id_blob))
+        for section in (term_offsets, post_offsets, post_docs, post_weights):
+            f.write(section.tobytes())
+        f.write(term_blob)
+    tmp_path.replace(path)
+
+    meta = {
+        "version": SEARCH_INDEX_VERSION,
+        "lang": lang,
+        "buildId": datetime.now().strftime("%Y%m%dT%H%M%S"),
+        "byteorder": sys.byteorder,
+        "docs": len(ids),
+        "terms": len(terms),
+        "postings": len(post_docs),
+        "totalLength": round(sum(doc_len), 3),
+        "regions": list(regions),
+        "appCategories": list(apps),
+        "fieldWeights": SEARCH_FIELD_WEIGHTS,
+    }
+    (lang_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    return meta
+
+
+def _sorted_ids(ids) -> list[str]:
+    return sorted(ids, key=lambda content_id: content_id.encode("utf-8"))
+
+
+def _build_segment(lang: str, docs: dict[str, tuple]) -> dict:
+    """{id: _doc_record()} → base 세그먼트."""
+    ids = _sorted_ids(docs)
+    inverted: dict[str, tuple[array, array]] = {}
+    records = []
+    for number, content_id in enumerate(ids):
+        terms, length, region, app = docs[content_id]
+        records.append((length, region, app))
+        for term, weight in terms.items():
+            lists = inverted.get(term)
+            if lists is None:
+                lists = inverted[term] = (array("I"), array("f"))
+            lists[0].append(number)
+            lists[1].append(weight)
+    postings = ((term, *inverted[term]) for term in _sorted_ids(inverted))
+    return _write_base(lang, ids, records, postings)
+
+
+def _empty_delta() -> dict:
+    return {"version": SEARCH_INDEX_VERSION, "docs": {}, "removed": set()}
+
+
+def _delta_path(lang: str) -> Path:
+    return SEARCH_DIR / lang / "delta.pickle"
+
+
+def _save_delta(lang: str, delta: dict) -> None:
+    path = _delta_path(lang)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(pickle.dumps(delta, protocol=pickle.HIGHEST_PROTOCOL))
+    tmp_path.replace(path)
+
+
+def _load_delta(lang: str) -> dict:
+    path = _delta_path(lang)
+    if not path.exists():
+        return _empty_delta()
+    delta = pickle.loads(path.read_bytes())
+    if delta.get("version") != SEARCH_INDEX_VERSION:
+        return _empty_delta()
+    return delta
+
+
+# ── 조회 ──
+
+
+class SearchIndex:
+    """base 세그먼트(mmap) + 변경분 세그먼트 검색기."""
+
+    def __init__(self, lang: str, meta: dict, mm: mmap.mmap, delta: dict) -> None:
+        self.lang = lang
+        self.meta = meta
+        self._mm = mm
+        self.delta = delta
+
+        view = self._view = memoryview(mm)
+        magic, _, n_docs, n_terms, n_postings, id_blob_len, term_blob_len, _ = _HEADER.unpack_from(mm)
+        if magic != _MAGIC:
+            raise ValueError(f"검색 인덱스 형식이 아닙니다: {SEARCH_DIR / lang / 'base.idx'}")
+        offset = _HEADER.size
+
+        def section(fmt: str, count: int, itemsize: int):
+            nonlocal offset
+            size = count * itemsize
+            part = view[offset : offset + size].cast(fmt)
+            offset += size + (-size % 4)
+            return part
+
+        self.n_docs = n_docs
+        self._id_offsets = section("I", n_docs + 1, 4)
+        self._doc_len = section("f", n_docs, 4)
+        self._doc_region = section("H", n_docs, 2)
+        self._doc_app = section("H", n_docs, 2)
+        self._id_blob = view[offset : offset + id_blob_len]
+        offset += id_blob_len + (-id_blob_len % 4)
+        self._term_offsets = section("I", n_terms + 1, 4)
+        self._post_offsets = section("I", n_terms + 1, 4)
+        self._post_docs = section("I", n_postings, 4)
+        self._post_weights = section("f", n_postings, 4)
+        self._term_blob = view[offset : offset + term_blob_len]
+        self._n_terms = n_terms
+        # 끝 음절 → 2-gram term 번호 (한 음절 질의 때 처음 한 번 만든다)
+        self._suffix_terms: dict[bytes, list[int]] | None = None
+        self._regions = {value: idx for idx, value in enumerate(meta["regions"])}
+        self._apps = {value: idx for idx, value in enumerate(meta["appCategories"])}
+
+        # 변경분에 다시 들어오거나 삭제된 base 문서는 가린다
+        self._masked: set[int] = set()
+        for content_id in (*delta["docs"], *delta["removed"]):
+            number = self._find_id(content_id)
+            if number is not None:
+                self._masked.add(number)
+
+        self._delta_terms: dict[str, dict[str, float]] = {}
+        for content_id, (terms, _, _, _) in delta["docs"].items():
+            for term, weight in terms.items():
+                self._delta_terms.setdefault(term, {})[content_id] = weight
+
+        self.n_live = n_docs - len(self._masked) + len(delta["docs"])
+        total = meta["totalLength"] - sum(self._doc_len[n] for n in self._masked)
+        total += sum(record[1] for record in delta["docs"].values())
+        self.avg_len = total / self.n_live if self.n_live else 0.0
+
+    @classmethod
+    def open(cls, lang: str) -> "SearchIndex | None":
+        """output/search/{lang}/를 연다 (인덱스가 없거나 형식이 다르면 None)."""
+        lang_dir = SEARCH_DIR / lang
+        meta_path, base_path = lang_dir / "meta.json", lang_dir / "base.idx"
+        if not meta_path.exists() or not base_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("version") != SEARCH_INDEX_VERSION or meta.get("byteorder") != sys.byteorder:
+            return None
+        with open(base_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(lang, meta, mm, _load_delta(lang))
+
+    def close(self) -> None:
+        for name in (
+            "_id_offsets", "_doc_len", "_doc_region", "_doc_app", "_id_blob",
+            "_term_offsets", "_post_offsets", "_post_docs", "_post_weights", "_term_blob", "_view",
+        ):
+            getattr(self, name).release()
+        self._mm.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # base 세그먼트 접근
+
+    def doc_id(self, number: int) -> str:
+        return bytes(self._id_blob[self._id_offsets[number] : self._id_offsets[number + 1]]).decode("utf-8")
+
+    def _term(self, number: int) -> bytes:
+        return bytes(self._term_blob[self._term_offsets[number] : self._term_offsets[number + 1]])
+
+    def _bisect(self, key: bytes, count: int, get) -> int:
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if get(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _find_id(self, content_id: str) -> int | None:
+        key = content_id.encode("utf-8")
+        get = lambda n: bytes(self._id_blob[self._id_offsets[n] : self._id_offsets[n + 1]])  # noqa: E731
+        number = self._bisect(key, self.n_docs, get)
+        if number < self.n_docs and get(number) == key:
+            return number
+        return None
+
+    def _suffix_numbers(self, key: bytes) -> list[int]:
+        """key(한글 한 음절, UTF-8 3바이트)로 끝나는 한글 2-gram term 번호."""
+        if self._suffix_terms is None:
+            self._suffix_terms = {}
+            for number in range(self._n_terms):
+                term = self._term(number)
+                # 한글 음절은 UTF-8 3바이트 (첫 바이트 0xEA~0xED)
+                if len(term) == 6 and 0xEA <= term[0] <= 0xED:
+                    self._suffix_terms.setdefault(term[3:], []).append(number)
+        return self._suffix_terms.get(key, [])
+
+    def _term_numbers(self, term: str) -> range | list[int]:
+        """term(또는 한 음절이면 그 음절로 시작하거나 끝나는 term)의 번호 목록."""
+        key = term.encode("utf-8")
+        start = self._bisect(key, self._n_terms, self._term)
+        if len(term) == 1 and _is_hangul(term):
+            end = start
+            while end < self._n_terms and self._term(end).startswith(key):
+                end += 1
+            # '궁궁'처럼 시작/끝이 모두 맞는 term은 한 번만
+            return [*range(start, end), *(n for n in self._suffix_numbers(key) if not start <= n < end)]
+        if start < self._n_terms and self._term(start) == key:
+            return range(start, start + 1)
+        return range(0)
+
+    def _delta_matches(self, term: str) -> dict[str, float]:
+        if len(term) == 1 and _is_hangul(term):
+            merged: dict[str, float] = {}
+            for other, postings in self._delta_terms.items():
+                if other.startswith(term) or other.endswith(term):
+                    for content_id, weight in postings.items():
+                        merged[content_id] = merged.get(content_id, 0.0) + weight
+            return merged
+        return self._delta_terms.get(term, {})
+
+    def _bm25(self, tf: float, length: float, idf: float) -> float:
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / self.avg_len) if self.avg_len else BM25_K1
+        return idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+    def search(
+        self,
+        query: str,
+        k: int = 10,
+        region: str | None = None,
+        app_category: str | None = None,
+    ) -> list[tuple[str, float]]:
+        """질의 토큰 중 하나라도 포함한 문서를 BM25 점수 순으로 k개 반환한다.
+
+        Args:
+            query: 검색어 (색인과 같은 규칙으로 토큰화)
+            k: 반환 개수
+            region: 지역 필터 (regions.json의 id)
+            app_category: 앱 카테고리 필터
+
+        Returns:
+            [(id, score), ...] (점수 내림차순, 같은 점수는 id 순)
+        """
+        # 필터 값이 base 번호표에 없으면 base 문서는 모두 탈락 (-1)
+        region_no = None if region is None else self._regions.get(region, -1)
+        app_no = None if app_category is None else self._apps.get(app_category, -1)
+
+        base_scores: dict[int, float] = {}
+        delta_scores: dict[str, float] = {}
+        for term in dict.fromkeys(tokenize(query)):
+            base_tf: dict[int, float] = {}
+            for number in self._term_numbers(term):
+                lo, hi = self._post_offsets[number], self._post_offsets[number + 1]
+                for doc, weight in zip(self._post_docs[lo:hi], self._post_weights[lo:hi]):
+                    if doc not in self._masked:
+                        base_tf[doc] = base_tf.get(doc, 0.0) + weight
+            delta_tf = self._delta_matches(term)
+
+            df = len(base_tf) + len(delta_tf)
+            if not df:
+                continue
+            idf = math.log(1 + (self.n_live - df + 0.5) / (df + 0.5))
+            for doc, tf in base_tf.items():
+                if region_no is not None and self._doc_region[doc] != region_no:
+                    continue
+                if app_no is not None and self._doc_app[doc] != app_no:
+                    continue
+                base_scores[doc] = base_scores.get(doc, 0.0) + self._bm25(tf, self._doc_len[doc], idf)
+            for content_id, tf in delta_tf.items():
+                _, length, doc_region, doc_app = self.delta["docs"][content_id]
+                if region is not None and doc_region != region:
+                    continue
+                if app_category is not None and doc_app != app_category:
+                    continue
+                delta_scores[content_id] = delta_scores.get(content_id, 0.0) + self._bm25(tf, length, idf)
+
+        scored = [(self.doc_id(doc), score) for doc, score in base_scores.items()]
+        scored.extend(delta_scores.items())
+        return [(cid, round(score, 6)) for cid, score in heapq.nsmallest(k, scored, key=lambda s: (-s[1], s[0]))]
+
+    def _merged_postings(self, numbering: list[int], delta_ids: dict[str, int]):
+        """base(가려진 문서 제외) + 변경분 포스팅을 새 번호로 term 순 병합한다."""
+        delta_terms = sorted(self._delta_terms, key=lambda t: t.encode("utf-8"))
+        delta_keys = [t.encode("utf-8") for t in delta_terms]
+        i = 0
+        for number in range(self._n_terms):
+            key = self._term(number)
+            while i < len(delta_keys) and delta_keys[i] < key:
+                yield self._delta_only(delta_terms[i], delta_ids)
+                i += 1
+            lo, hi = self._post_offsets[number], self._post_offsets[number + 1]
+            pairs = [
+                (numbering[doc], weight)
+                for doc, weight in zip(self._post_docs[lo:hi], self._post_weights[lo:hi])
+                if numbering[doc] >= 0
+            ]
+            if i < len(delta_keys) and delta_keys[i] == key:
+                pairs.extend((delta_ids[cid], w) for cid, w in self._delta_terms[delta_terms[i]].items())
+                pairs.sort()
+                i += 1
+            if pairs:
+                yield key.decode("utf-8"), array("I", (p[0] for p in pairs)), array("f", (p[1] for p in pairs))
+        for term in delta_terms[i:]:
+            yield self._delta_only(term, delta_ids)
+
+    def _delta_only(self, term: str, delta_ids: dict[str, int]):
+        pairs = sorted((delta_ids[cid], w) for cid, w in self._delta_terms[term].items())
+        return term, array("I", (p[0] for p in pairs)), array("f", (p[1] for p in pairs))
+
+    def compact(self) -> dict:
+        """base와 변경분을 병합한 새 base.idx를 기록한다 (원문 없이 포스팅만 사용)."""
+        base_ids = [self.doc_id(n) for n in range(self.n_docs) if n not in self._masked]
+        ids = _sorted_ids([*base_ids, *self.delta["docs"]])
+        new_number = {content_id: n for n, content_id in enumerate(ids)}
+
+        numbering = [-1] * self.n_docs
+        records = [None] * len(ids)
+        regions, apps = self.meta["regions"], self.meta["appCategories"]
+        for n in range(self.n_docs):
+            if n in self._masked:
+                continue
+            new = new_number[self.doc_id(n)]
+            numbering[n] = new
+            records[new] = (self._doc_len[n], regions[self._doc_region[n]], apps[self._doc_app[n]])
+        delta_ids = {}
+        for content_id, (_, length, region, app) in self.delta["docs"].items():
+            delta_ids[content_id] = new_number[content_id]
+            records[new_number[content_id]] = (length, region, app)
+
+        return _write_base(self.lang, ids, records, self._merged_postings(numbering, delta_ids))
+
+
+# ── 생성 / 갱신 ──
+
+
+def _load_source_pois(lang: str) -> list[dict] | None:
+    """pois_{lang}.json에 pois_details_{lang}.json(상세 반영분, description 포함)을 덮어쓴다."""
+    pois_path = OUTPUT_DIR / f"pois_{lang}.json"
+    if not pois_path.exists():
+        return None
+    pois = {poi["id"]: poi for poi in json.loads(pois_path.read_text(encoding="utf-8"))}
+    details_path = OUTPUT_DIR / f"pois_details_{lang}.json"
+    if details_path.exists():
+        for poi in json.loads(details_path.read_text(encoding="utf-8")):
+            if poi.get("id") in pois:
+                pois[poi["id"]] = poi
+    return list(pois.values())
+
+
+def build_search_index(lang: str) -> dict | None:
+    """pois_{lang}.json(+ pois_details_{lang}.json)으로 검색 인덱스 전체를 다시 만든다 (변경분 초기화).
+
+    Returns:
+        meta.json 내용 (pois_{lang}.json이 없으면 None)
+    """
+    pois = _load_source_pois(lang)
+    if pois is None:
+        print(f"[Transform] {OUTPUT_DIR / f'pois_{lang}.json'} 파일 없음, 건너뜀")
+        return None
+    meta = _build_segment(lang, {poi["id"]: _doc_record(poi) for poi in pois})
+    _save_delta(lang, _empty_delta())
+    return meta
+
+
+def update_search_index(lang: str, upserts: dict[str, dict], removed: set[str]) -> dict | None:
+    """변경분 세그먼트에 추가/변경/삭제를 반영하고, 커지면 base와 병합한다.
+
+    Args:
+        lang: "kr" 또는 "en"
+        upserts: {id: POI} — name/address/tags/description/region/appCategory 사용
+        removed: 삭제된 POI id
+
+    Returns:
+        {"upserted": N, "removed": N, "delta": 변경분 문서 수, "compacted": bool}
+        (build_search_index()로 만든 인덱스가 없으면 None)
+    """
+    index = SearchIndex.open(lang)
+    if index is None:
+        return None
+
+    delta = index.delta
+    for content_id in removed:
+        delta["docs"].pop(content_id, None)
+        delta["removed"].add(content_id)
+    for content_id, poi in upserts.items():
+        delta["removed"].discard(content_id)
+        delta["docs"][content_id] = _doc_record(poi)
+
+    changed = len(delta["docs"]) + len(delta["removed"])
+    compacted = changed > max(SEARCH_DELTA_MIN_DOCS, index.n_docs * SEARCH_DELTA_MAX_RATIO)
+    if compacted:
+        # 병합은 갱신된 변경분으로 다시 연 인덱스에서 수행
+        index.close()
+        _save_delta(lang, delta)
+        with SearchIndex.open(lang) as merged:
+            merged.compact()
+        delta = _empty_delta()
+    else:
+        index.close()
+    _save_delta(lang, delta)
+    return {
+        "upserted": len(upserts),
+        "removed": len(removed),
+        "delta": len(delta["docs"]),
+        "compacted": compacted,
+    }
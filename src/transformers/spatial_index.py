@@ -0,0 +1,320 @@
+"""POI 좌표 격자 공간 인덱스 (output/spatial_index_{lang}.pickle).
+
+pois_{lang}.json의 coordinates를 위경도 고정 격자(기본 0.01°, 약 1.1km)로 나눠 셀별 POI 번호를 기록한다.
+반경 / k-최근접 / bbox 조회를 카테고리·앱 카테고리·지역 필터와 함께 지원한다.
+
+좌표가 0.0인 POI(_safe_float 기본값)는 위치를 알 수 없으므로 인덱싱하지 않는다 (unindexed로 집계).
+거리는 haversine 기준 미터 단위.
+
+사용 예:
+    index = SpatialIndex.load("kr")
+    index.radius(37.5665, 126.9780, 1000, app_category="restaurant")  # [(id, m), ...]
+    index.nearest(37.5665, 126.9780, 5, region="seoul")
+    index.bbox(126.9, 37.5, 127.0, 37.6)                               # [id, ...]
+"""
+
+import heapq
+import json
+import math
+import pickle
+from array import array
+from pathlib import Path
+
+from src.transformers.pois import OUTPUT_DIR
+
+SPATIAL_INDEX_VERSION = 1
+DEFAULT_CELL_DEG = 0.01
+
+EARTH_RADIUS_M = 6_371_008.8
+# 위도 1°의 거리 (m)
+_DEG_M = math.pi * EARTH_RADIUS_M / 180
+
+
+def spatial_index_path(lang: str) -> Path:
+    return OUTPUT_DIR / f"spatial_index_{lang}.pickle"
+
+
+def _never(number: int) -> bool:
+    """조건에 맞는 POI가 있을 수 없는 필터 (인덱스에 없는 값)."""
+    return False
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이 거리 (m)."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class _Interned:
+    """문자열 값 → 번호 (필터 비교를 정수 비교로 줄인다)."""
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = self._index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+
+class SpatialIndex:
+    """POI 격자 공간 인덱스.
+
+    POI 속성은 번호별 병렬 배열(array)로, 격자는 {(ix, iy): array[POI 번호]}로 보관한다.
+    """
+
+    def __init__(
+        self,
+        lang: str,
+        cell_deg: float,
+        ids: list[str],
+        lats: array,
+        lngs: array,
+        attrs: dict[str, tuple[list[str], array]],
+        cells: dict[tuple[int, int], array],
+        unindexed: int,
+    ) -> None:
+        self.lang = lang
+        self.cell_deg = cell_deg
+        self.ids = ids
+        self.lats = lats
+        self.lngs = lngs
+        self.attrs = attrs
+        self.cells = cells
+        self.unindexed = unindexed
+        # k-최근접 종료 판정용: 인덱스 내 최대 |위도|에서의 셀 최소 폭 (m)
+        max_abs_lat = max((abs(lat) for lat in lats), default=0.0)
+        self._min_cell_m = cell_deg * _DEG_M * math.cos(math.radians(min(max_abs_lat, 89.0)))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, lang: str, pois: list[dict], cell_deg: float = DEFAULT_CELL_DEG) -> "SpatialIndex":
+        """POI 목록으로 인덱스를 만든다 (좌표 0.0인 POI 제외)."""
+        ids: list[str] = []
+        lats, lngs = array("d"), array("d")
+        interned = {"category": _Interned(), "appCategory": _Interned(), "region": _Interned()}
+        codes = {field: array("I") for field in interned}
+        cells: dict[tuple[int, int], array] = {}
+        unindexed = 0
+
+        for poi in pois:
+            coords = poi.get("coordinates") or {}
+            lat, lng = coords.get("lat", 0.0), coords.get("lng", 0.0)
+            if not lat or not lng:
+                unindexed += 1
+                continue
+            number = len(ids)
+            ids.append(poi["id"])
+            lats.append(lat)
+            lngs.append(lng)
+            for field, values in interned.items():
+                codes[field].append(values.add(poi.get(field, "")))
+            key = (math.floor(lng / cell_deg), math.floor(lat / cell_deg))
+            cells.setdefault(key, array("I")).append(number)
+
+        attrs = {field: (values.values, codes[field]) for field, values in interned.items()}
+        return cls(lang, cell_deg, ids, lats, lngs, attrs, cells, unindexed)
+
+    # ── 저장 / 로드 ──
+
+    def save(self, path: Path | None = None) -> Path:
+        path = path or spatial_index_path(self.lang)
+        state = {
+            "version": SPATIAL_INDEX_VERSION,
+            "lang": self.lang,
+            "cell_deg": self.cell_deg,
+            "ids": self.ids,
+            "lats": self.lats,
+            "lngs": self.lngs,
+            "attrs": self.attrs,
+            "cells": self.cells,
+            "unindexed": self.unindexed,
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp_path.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, lang: str, path: Path | None = None) -> "SpatialIndex":
+        """저장된 인덱스를 로드한다 (버전이 다르면 ValueError)."""
+        state = pickle.loads((path or spatial_index_path(lang)).read_bytes())
+        if state.get("version") != SPATIAL_INDEX_VERSION:
+            raise ValueError(f"공간 인덱스 버전 불일치: {state.get('version')}")
+        return cls(
+            state["lang"], state["cell_deg"], state["ids"], state["lats"], state["lngs"],
+            state["attrs"], state["cells"], state["unindexed"],
+        )
+
+    # ── 조회 ──
+
+    def _matcher(self, category: str | None, app_category: str | None, region: str | None):
+        """필터 조건 → POI 번호 판정 함수 (조건 없으면 None, 없는 값이면 _never)."""
+        checks = []
+        for field, value in (("category", category), ("appCategory", app_category), ("region", region)):
+            if value is None:
+                continue
+            values, codes = self.attrs[field]
+            if value not in values:
+                return _never
+            checks.append((codes, values.index(value)))
+        if not checks:
+            return None
+        return lambda number: all(codes[number] == code for codes, code in checks)
+
+    def _cell_range(self, min_lng: float, min_lat: float, max_lng: float, max_lat: float):
+        for ix in range(math.floor(min_lng / self.cell_deg), math.floor(max_lng / self.cell_deg) + 1):
+            for iy in range(math.floor(min_lat / self.cell_deg), math.floor(max_lat / self.cell_deg) + 1):
+                numbers = self.cells.get((ix, iy))
+                if numbers is not None:
+                    yield numbers
+
+    def _rings(self, cx: int, cy: int, max_ring: int):
+        """중심 셀에서 링 단위로 (링 번호, [셀 POI 번호 배열]) 을 낸다 (비어 있는 링은 생략 가능).
+
+        링 둘레(8 * ring)의 셀만 본다. 둘레가 비어 있지 않은 셀 수보다 커지면
+        남은 링은 대부분 빈 셀이므로, 비어 있지 않은 셀을 한 번 훑어 링 순서로 낸다.
+        """
+        cells = self.cells
+        for ring in range(max_ring + 1):
+            if 8 * ring > len(cells):
+                rest: dict[int, list[array]] = {}
+                for (ix, iy), numbers in cells.items():
+                    r = max(abs(ix - cx), abs(iy - cy))
+                    if ring <= r <= max_ring:
+                        rest.setdefault(r, []).append(numbers)
+                for r in sorted(rest):
+                    yield r, rest[r]
+                return
+            if ring == 0:
+                edge = [(cx, cy)]
+            else:
+                edge = [(ix, iy) for ix in range(cx - ring, cx + ring + 1) for iy in (cy - ring, cy + ring)]
+                edge += [(ix, iy) for ix in (cx - ring, cx + ring) for iy in range(cy - ring + 1, cy + ring)]
+            yield ring, [cells[key] for key in edge if key in cells]
+
+    def bbox(
+        self,
+        min_lng: float,
+        min_lat: float,
+        max_lng: float,
+        max_lat: float,
+        category: str | None = None,
+        app_category: str | None = None,
+        region: str | None = None,
+    ) -> list[str]:
+        """bbox 안의 POI id 목록 (pois_{lang}.json 순서)."""
+        match = self._matcher(category, app_category, region)
+        if match is _never:
+            return []
+        found = [
+            number
+            for numbers in self._cell_range(min_lng, min_lat, max_lng, max_lat)
+            for number in numbers
+            if min_lng <= self.lngs[number] <= max_lng
+            and min_lat <= self.lats[number] <= max_lat
+            and (match is None or match(number))
+        ]
+        return [self.ids[number] for number in sorted(found)]
+
+    def radius(
+        self,
+        lat: float,
+        lng: float,
+        radius_m: float,
+        category: str | None = None,
+        app_category: str | None = None,
+        region: str | None = None,
+    ) -> list[tuple[str, float]]:
+        """중심에서 radius_m 이내의 POI [(id, 거리 m)] (가까운 순)."""
+        match = self._matcher(category, app_category, region)
+        if match is _never:
+            return []
+        d_lat = radius_m / _DEG_M
+        d_lng = radius_m / (_DEG_M * max(math.cos(math.radians(min(abs(lat) + d_lat, 89.0))), 1e-6))
+        found = []
+        for numbers in self._cell_range(lng - d_lng, lat - d_lat, lng + d_lng, lat + d_lat):
+            for number in numbers:
+                if match is not None and not match(number):
+                    continue
+                dist = haversine_m(lat, lng, self.lats[number], self.lngs[number])
+                if dist <= radius_m:
+                    found.append((dist, number))
+        found.sort()
+        return [(self.ids[number], dist) for dist, number in found]
+
+    def nearest(
+        self,
+        lat: float,
+        lng: float,
+        k: int,
+        category: str | None = None,
+        app_category: str | None = None,
+        region: str | None = None,
+        max_radius_m: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """가까운 POI k개 [(id, 거리 m)] (가까운 순).
+
+        중심 셀에서 링 단위로 넓혀 가며, 남은 링의 최소 거리가 k번째 거리보다 멀어지면 멈춘다.
+        링마다 둘레의 셀만 보고, max_radius_m이 있으면 그 거리를 넘는 링은 보지 않는다.
+        """
+        if k <= 0 or not self.cells:
+            return []
+        match = self._matcher(category, app_category, region)
+        if match is _never:
+            return []
+        cx, cy = math.floor(lng / self.cell_deg), math.floor(lat / self.cell_deg)
+        xs = [ix for ix, _ in self.cells]
+        ys = [iy for _, iy in self.cells]
+        max_ring = max(abs(cx - min(xs)), abs(cx - max(xs)), abs(cy - min(ys)), abs(cy - max(ys)))
+        min_cell_m = min(
+            self._min_cell_m,
+            self.cell_deg * _DEG_M * math.cos(math.radians(min(abs(lat), 89.0))),
+        )
+        if max_radius_m is not None:
+            # ring 링의 셀은 중심에서 최소 (ring - 1) * 셀 폭 떨어져 있다
+            max_ring = min(max_ring, math.floor(max_radius_m / min_cell_m) + 1)
+
+        heap: list[tuple[float, int]] = []  # (-거리, 번호) — 최대 힙으로 k개 유지
+        for ring, ring_cells in self._rings(cx, cy, max_ring):
+            for numbers in ring_cells:
+                for number in numbers:
+                    if match is not None and not match(number):
+                        continue
+                    dist = haversine_m(lat, lng, self.lats[number], self.lngs[number])
+                    if max_radius_m is not None and dist > max_radius_m:
+                        continue
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-dist, number))
+                    elif dist < -heap[0][0]:
+                        heapq.heapreplace(heap, (-dist, number))
+            # 아직 보지 않은 셀은 중심에서 최소 ring * 셀 폭 이상 떨어져 있다
+            bound = ring * min_cell_m
+            if len(heap) == k and -heap[0][0] <= bound:
+                break
+            if max_radius_m is not None and bound > max_radius_m:
+                break
+
+        return [(self.ids[number], -neg) for neg, number in sorted(heap, key=lambda e: (-e[0], e[1]))]
+
+
+def build_spatial_index(lang: str, cell_deg: float = DEFAULT_CELL_DEG) -> Path | None:
+    """pois_{lang}.json으로 공간 인덱스를 만들어 저장한다 (파일이 없으면 None)."""
+    pois_path = OUTPUT_DIR / f"pois_{lang}.json"
+    if not pois_path.exists():
+        print(f"[Transform] {pois_path} 파일 없음, 건너뜀")
+        return None
+    index = SpatialIndex.build(lang, json.loads(pois_path.read_text(encoding="utf-8")), cell_deg)
+    path = index.save()
+    print(
+        f"[Transform] [{lang}] 공간 인덱스: {len(index)}건, 셀 {len(index.cells)}개 "
+        f"(좌표 없음 {index.unindexed}건 제외)"
+    )
+    return path
@@ -0,0 +1,327 @@
+"""pois_geo_{lang}.json → Mapbox Vector Tile 피라미드 (output/tiles/{lang}/{z}/{x}/{y}.mvt).
+
+타일은 레이어 "pois" 하나에 _to_geojson_feature()의 속성(id, slug, category, name, region)만 담는다.
+MVT(protobuf)는 의존성 없이 직접 인코딩한다 (vector_tile.proto v2: Tile.layers / Layer / Feature / Value).
+
+- 전체 생성 (build_tiles): Feature를 줌별 타일에 배정한 뒤 타일 인코딩/기록을 프로세스 풀로 분산
+- 증분 갱신 (update_tiles): Step 4/5 변경분(geo_delta)이 닿은 타일만 다시 기록
+  이전/새 좌표가 속한 타일을 모두 갱신하고, 비게 된 타일 파일은 삭제한다.
+
+상태 (output/tiles/{lang}/state.pickle): 줌 범위, {id: Feature}, {(z, x, y): {id, ...}}
+좌표가 0.0인 POI는 타일에 넣지 않는다.
+"""
+
+import json
+import math
+import pickle
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.config import TILE_EXTENT, TILE_MAX_ZOOM, TILE_MIN_ZOOM
+from src.transformers.pois import OUTPUT_DIR, _to_geojson_feature
+
+TILES_DIR = OUTPUT_DIR / "tiles"
+TILE_LAYER = "pois"
+TILE_STATE_VERSION = 1
+
+# Web Mercator 위도 한계
+_MAX_LAT = 85.05112878
+
+_GEOM_POINT = 1
+_CMD_MOVE_TO_1 = (1 & 0x7) | (1 << 3)
+
+
+# ── protobuf 인코딩 ──
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _field_varint(field: int, value: int) -> bytes:
+    return _varint(field << 3) + _varint(value)
+
+
+def _field_bytes(field: int, data: bytes) -> bytes:
+    return _varint((field << 3) | 2) + _varint(len(data)) + data
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+# ── 좌표 / 타일 ──
+
+
+def _mercator(lng: float, lat: float) -> tuple[float, float]:
+    """경위도 → Web Mercator 정규 좌표 (0~1, 좌상단 원점)."""
+    lat = max(-_MAX_LAT, min(_MAX_LAT, lat))
+    sin = math.sin(math.radians(lat))
+    x = (lng + 180.0) / 360.0
+    y = 0.5 - math.log((1 + sin) / (1 - sin)) / (4 * math.pi)
+    return x, y
+
+
+def _is_located(feature: dict) -> bool:
+    lng, lat = feature["geometry"]["coordinates"]
+    return bool(lng) and bool(lat)
+
+
+def _tile_keys(feature: dict, min_zoom: int, max_zoom: int) -> list[tuple[int, int, int]]:
+    """Feature가 속한 줌별 타일 (z, x, y)."""
+    mx, my = _mercator(*feature["geometry"]["coordinates"])
+    keys = []
+    for z in range(min_zoom, max_zoom + 1):
+        n = 1 << z
+        keys.append((z, min(int(mx * n), n - 1), min(int(my * n), n - 1)))
+    return keys
+
+
+def encode_tile(key: tuple[int, int, int], features: list[dict], extent: int = TILE_EXTENT) -> bytes:
+    """한 타일의 Feature 목록 → MVT 바이트 (레이어 "pois")."""
+    z, tx, ty = key
+    n = 1 << z
+    keys: list[str] = []
+    key_index: dict[str, int] = {}
+    values: list[str] = []
+    value_index: dict[str, int] = {}
+    encoded_features = []
+
+    for feature in features:
+        tags = []
+        for name, value in feature["properties"].items():
+            value = "" if value is None else str(value)
+            if name not in key_index:
+                key_index[name] = len(keys)
+                keys.append(name)
+            if value not in value_index:
+                value_index[value] = len(values)
+                values.append(value)
+            tags.extend((key_index[name], value_index[value]))
+
+        mx, my = _mercator(*feature["geometry"]["coordinates"])
+        px = round((mx * n - tx) * extent)
+        py = round((my * n - ty) * extent)
+        geometry = (_CMD_MOVE_TO_1, _zigzag(px), _zigzag(py))
+
+        body = b""
+        content_id = feature["properties"].get("id", "")
+        if content_id.isdigit():
+            body += _field_varint(1, int(content_id))
+        body += _field_bytes(2, b"".join(_varint(t) for t in tags))
+        body += _field_varint(3, _GEOM_POINT)
+        body += _field_bytes(4, b"".join(_varint(c) for c in geometry))
+        encoded_features.append(_field_bytes(2, body))
+
+    layer = _field_varint(15, 2) + _field_bytes(1, TILE_LAYER.encode("utf-8"))
+    layer += b"".join(encoded_features)
+    layer += b"".join(_field_bytes(3, k.encode("utf-8")) for k in keys)
+    layer += b"".join(_field_bytes(4, _field_bytes(1, v.encode("utf-8"))) for v in values)
+    layer += _field_varint(5, extent)
+    return _field_bytes(3, layer)
+
+
+def _tile_path(lang: str, key: tuple[int, int, int]) -> Path:
+    z, x, y = key
+    return TILES_DIR / lang / str(z) / str(x) / f"{y}.mvt"
+
+
+def _write_tile_chunk(lang: str, tiles: list[tuple[tuple[int, int, int], list[dict]]]) -> tuple[int, int]:
+    """타일을 인코딩하여 기록한다 (프로세스 풀에서 실행). Feature가 없는 타일은 파일 삭제.
+
+    Returns:
+        (기록 수, 삭제 수)
+    """
+    written = removed = 0
+    for key, features in tiles:
+        path = _tile_path(lang, key)
+        if not features:
+            if path.exists():
+                path.unlink()
+                removed += 1
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(encode_tile(key, features))
+        written += 1
+    return written, removed
+
+
+def _write_tiles(
+    lang: str, tiles: list[tuple[tuple[int, int, int], list[dict]]], workers: int
+) -> tuple[int, int]:
+    """타일 기록을 workers개 프로세스로 나눠 수행한다 (workers <= 1이면 현재 프로세스)."""
+    if workers <= 1 or len(tiles) < 2:
+        return _write_tile_chunk(lang, tiles)
+
+    size = max(1, math.ceil(len(tiles) / (workers * 4)))
+    chunks = [tiles[i : i + size] for i in range(0, len(tiles), size)]
+    written = removed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for w, r in executor.map(_write_tile_chunk, [lang] * len(chunks), chunks):
+            written += w
+            removed += r
+    return written, removed
+
+
+# ── 상태 ──
+
+
+def _state_path(lang: str) -> Path:
+    return TILES_DIR / lang / "state.pickle"
+
+
+def _load_state(lang: str) -> dict | None:
+    path = _state_path(lang)
+    if not path.exists():
+        return None
+    state = pickle.loads(path.read_bytes())
+    if state.get("version") != TILE_STATE_VERSION:
+        return None
+    return state
+
+
+def _save_state(lang: str, state: dict) -> None:
+    path = _state_path(lang)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+    tmp_path.replace(path)
+
+
+def _save_tilejson(lang: str, state: dict) -> Path:
+    """타일셋 메타데이터 (TileJSON 3.0)."""
+    points = [f["geometry"]["coordinates"] for f in state["features"].values()]
+    bounds = (
+        [min(p[0] for p in points), min(p[1] for p in points),
+         max(p[0] for p in points), max(p[1] for p in points)]
+        if points
+        else None
+    )
+    tilejson = {
+        "tilejson": "3.0.0",
+        "name": f"korea-pois-{lang}",
+        "tiles": ["{z}/{x}/{y}.mvt"],
+        "minzoom": state["min_zoom"],
+        "maxzoom": state["max_zoom"],
+        "bounds": bounds,
+        "vector_layers": [{
+            "id": TILE_LAYER,
+            "fields": {"id": "String", "slug": "String", "category": "String", "name": "String", "region": "String"},
+        }],
+        "featureCount": len(state["features"]),
+        "tileCount": len(state["tiles"]),
+    }
+    path = TILES_DIR / lang / "tiles.json"
+    path.write_text(json.dumps(tilejson, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def _tile_features(state: dict, key: tuple[int, int, int]) -> list[dict]:
+    return [state["features"][i] for i in sorted(state["tiles"].get(key, ()))]
+
+
+# ── 생성 / 갱신 ──
+
+
+def build_tiles(
+    lang: str,
+    workers: int = 1,
+    min_zoom: int = TILE_MIN_ZOOM,
+    max_zoom: int = TILE_MAX_ZOOM,
+) -> dict[str, int] | None:
+    """pois_geo_{lang}.json으로 타일 피라미드 전체를 다시 만든다 (기존 타일 삭제).
+
+    Returns:
+        {"features": N, "unlocated": N, "tiles": N} (pois_geo_{lang}.json이 없으면 None)
+    """
+    geo_path = OUTPUT_DIR / f"pois_geo_{lang}.json"
+    if not geo_path.exists():
+        print(f"[Tiles] {geo_path} 파일 없음, 건너뜀")
+        return None
+
+    all_features = json.loads(geo_path.read_text(encoding="utf-8"))["features"]
+    state = {
+        "version": TILE_STATE_VERSION,
+        "min_zoom": min_zoom,
+        "max_zoom": max_zoom,
+        "features": {},
+        "tiles": {},
+    }
+    unlocated = 0
+    for feature in all_features:
+        if not _is_located(feature):
+            unlocated += 1
+            continue
+        content_id = feature["properties"]["id"]
+        state["features"][content_id] = feature
+        for key in _tile_keys(feature, min_zoom, max_zoom):
+            state["tiles"].setdefault(key, set()).add(content_id)
+
+    lang_dir = TILES_DIR / lang
+    if lang_dir.exists():
+        shutil.rmtree(lang_dir)
+    lang_dir.mkdir(parents=True)
+
+    tiles = [(key, _tile_features(state, key)) for key in sorted(state["tiles"])]
+    written, _ = _write_tiles(lang, tiles, workers)
+    _save_state(lang, state)
+    _save_tilejson(lang, state)
+    return {"features": len(state["features"]), "unlocated": unlocated, "tiles": written}
+
+
+def update_tiles(
+    lang: str, upserts: dict[str, dict], removed: set[str], workers: int = 1
+) -> dict[str, int] | None:
+    """변경된 POI가 닿은 타일만 다시 기록한다.
+
+    Args:
+        lang: "kr" 또는 "en"
+        upserts: {id: POI} — 추가/변경 POI (geo_delta_from_summaries() 결과)
+        removed: 삭제된 POI id
+        workers: 타일 기록 프로세스 수
+
+    Returns:
+        {"upserted": N, "removed": N, "tiles": 다시 기록한 수, "deleted": 삭제한 타일 수}
+        (build_tiles()로 만든 타일이 없으면 None)
+    """
+    state = _load_state(lang)
+    if state is None:
+        return None
+
+    min_zoom, max_zoom = state["min_zoom"], state["max_zoom"]
+    touched: set[tuple[int, int, int]] = set()
+
+    def _detach(content_id: str) -> None:
+        old = state["features"].pop(content_id, None)
+        if old is None:
+            return
+        for key in _tile_keys(old, min_zoom, max_zoom):
+            ids = state["tiles"].get(key)
+            if ids is not None:
+                ids.discard(content_id)
+                if not ids:
+                    del state["tiles"][key]
+            touched.add(key)
+
+    for content_id in removed:
+        _detach(content_id)
+    for content_id, poi in upserts.items():
+        _detach(content_id)
+        feature = _to_geojson_feature(poi)
+        if not _is_located(feature):
+            continue
+        state["features"][content_id] = feature
+        for key in _tile_keys(feature, min_zoom, max_zoom):
+            state["tiles"].setdefault(key, set()).add(content_id)
+            touched.add(key)
+
+    tiles = [(key, _tile_features(state, key)) for key in sorted(touched)]
+    written, deleted = _write_tiles(lang, tiles, workers)
+    _save_state(lang, state)
+    _save_tilejson(lang, state)
+    return {"upserted": len(upserts), "removed": len(removed), "tiles": written, "deleted": deleted}
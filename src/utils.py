@@ -1,5 +1,7 @@
+import json
 import re
 import unicodedata
+from pathlib import Path
 
 
 def slugify(text: str) -> str:
@@ -10,3 +12,56 @@ def slugify(text: str) -> str:
     text = re.sub(r"[^\w\s-]", "", text)
     text = re.sub(r"[-\s]+", "-", text)
     return text
+
+
+def encode_json_item(item, level: int = 0) -> str:
+    """JSON 배열 항목을 json.dumps(indent=2) 배열 안의 들여쓰기로 직렬화한다 (JsonArrayWriter용).
+
+    level은 항목이 속한 배열의 들여쓰기 깊이다. 멀티 프로세스에서 미리 직렬화할 때 사용한다.
+    """
+    return json.dumps(item, ensure_ascii=False, indent=2).replace("\n", "\n" + "  " * (level + 1))
+
+
+class JsonArrayWriter:
+    """JSON 배열을 항목 단위로 파일에 기록하는 스트리밍 writer.
+
+    json.dumps(items, ensure_ascii=False, indent=2)와 바이트 단위로 같은 파일을 만든다.
+    level은 배열이 놓이는 들여쓰기 깊이로, 객체 안의 배열은 prefix/suffix와 함께 사용한다.
+    임시 파일에 기록한 뒤 close() 시 원래 경로로 교체하므로 중단되면 기존 파일이 유지된다.
+    """
+
+    def __init__(self, path: Path, prefix: str = "", suffix: str = "", level: int = 0) -> None:
+        self.path = path
+        self.count = 0
+        self._suffix = suffix
+        self._level = level
+        self._pad = "\n" + "  " * (level + 1)
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._tmp_path.open("w", encoding="utf-8")
+        self._file.write(prefix)
+
+    def write(self, item) -> None:
+        self.write_encoded(encode_json_item(item, self._level))
+
+    def write_encoded(self, text: str) -> None:
+        """encode_json_item(item, level)로 직렬화된 항목을 기록한다."""
+        self._file.write(("[" if self.count == 0 else ",") + self._pad + text)
+        self.count += 1
+
+    def write_all(self, items) -> None:
+        for item in items:
+            self.write(item)
+
+    def close(self) -> Path:
+        """배열을 닫고 임시 파일을 원래 경로로 교체한다."""
+        closing = "[]" if self.count == 0 else "\n" + "  " * self._level + "]"
+        self._file.write(closing + self._suffix)
+        self._file.close()
+        self._tmp_path.replace(self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """임시 파일을 삭제한다 (기존 파일 유지)."""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
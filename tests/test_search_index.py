@@ -0,0 +1,52 @@
+"""SearchIndex 한 음절 한글 질의 테스트."""
+
+import json
+
+import pytest
+
+from src.transformers import search_index
+from src.transformers.search_index import SearchIndex, build_search_index, update_search_index
+
+
+def _poi(content_id: str, name: str, tags: list[str] | None = None) -> dict:
+    return {
+        "id": content_id,
+        "name": name,
+        "address": "",
+        "tags": tags or [],
+        "description": "",
+        "region": "seoul",
+        "appCategory": "attraction",
+    }
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_index, "OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(search_index, "SEARCH_DIR", tmp_path / "search")
+    pois = [
+        _poi("1", "경복궁", ["궁궐"]),
+        _poi("2", "창덕궁"),
+        _poi("3", "덕수궁"),
+        _poi("4", "남산타워"),
+    ]
+    (tmp_path / "pois_kr.json").write_text(json.dumps(pois, ensure_ascii=False), encoding="utf-8")
+    build_search_index("kr")
+    return tmp_path
+
+
+def _ids(query: str) -> set[str]:
+    with SearchIndex.open("kr") as index:
+        return {content_id for content_id, _ in index.search(query, k=10)}
+
+
+def test_single_syllable_matches_word_end(output_dir) -> None:
+    assert _ids("궁") == {"1", "2", "3"}
+    assert _ids("덕") == {"2", "3"}
+    assert _ids("워") == {"4"}
+
+
+def test_single_syllable_matches_word_end_in_delta(output_dir) -> None:
+    update_search_index("kr", {"5": _poi("5", "운현궁"), "4": _poi("4", "남산공원")}, set())
+    assert _ids("궁") == {"1", "2", "3", "5"}
+    assert _ids("워") == set()
@@ -0,0 +1,57 @@
+"""SpatialIndex 조회 테스트."""
+
+import random
+import time
+
+from src.transformers.spatial_index import SpatialIndex, haversine_m
+
+
+def _poi(content_id: str, lat: float, lng: float, app_category: str = "attraction") -> dict:
+    return {
+        "id": content_id,
+        "coordinates": {"lat": lat, "lng": lng},
+        "category": "AC",
+        "appCategory": app_category,
+        "region": "seoul",
+    }
+
+
+# 전국에 흩어진 소수의 POI (빈 셀이 대부분인 넓은 격자)
+SPARSE_POIS = [
+    _poi("seoul", 37.5665, 126.9780),
+    _poi("busan", 35.1796, 129.0756),
+    _poi("jeju", 33.4996, 126.5312, "nature"),
+    _poi("gangneung", 37.7519, 128.8761),
+]
+
+
+def test_nearest_sparse_filter_is_fast() -> None:
+    index = SpatialIndex.build("kr", SPARSE_POIS)
+
+    started = time.perf_counter()
+    assert [i for i, _ in index.nearest(37.5665, 126.9780, 3)] == ["seoul", "gangneung", "busan"]
+    assert [i for i, _ in index.nearest(37.5665, 126.9780, 10)] == ["seoul", "gangneung", "busan", "jeju"]
+    assert [i for i, _ in index.nearest(37.5665, 126.9780, 1, app_category="nature")] == ["jeju"]
+    assert index.nearest(37.5665, 126.9780, 1, app_category="unknown") == []
+    assert [i for i, _ in index.nearest(37.5665, 126.9780, 5, max_radius_m=200_000)] == ["seoul", "gangneung"]
+    assert time.perf_counter() - started < 1.0
+
+
+def test_nearest_matches_brute_force() -> None:
+    rng = random.Random(7)
+    pois = [
+        _poi(str(n), rng.uniform(33.0, 38.5), rng.uniform(125.0, 130.0), rng.choice(["a", "b", "c"]))
+        for n in range(2000)
+    ]
+    index = SpatialIndex.build("kr", pois, cell_deg=0.05)
+    for _ in range(30):
+        lat, lng = rng.uniform(33.0, 38.5), rng.uniform(125.0, 130.0)
+        k = rng.randint(1, 15)
+        app_category = rng.choice([None, "a"])
+        expected = sorted(
+            (haversine_m(lat, lng, p["coordinates"]["lat"], p["coordinates"]["lng"]), p["id"])
+            for p in pois
+            if app_category is None or p["appCategory"] == app_category
+        )[:k]
+        got = index.nearest(lat, lng, k, app_category=app_category)
+        assert [d for d, _ in expected] == [d for _, d in got]